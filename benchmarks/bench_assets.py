@@ -0,0 +1,111 @@
+"""Aset first paint: CDN (Google Fonts + Unsplash) vs static/ lokal.
+
+Jalankan dari root repo setelah python -m pakar.assets build:
+
+    python benchmarks/bench_assets.py [--url http://localhost:8501] [--runs 5]
+
+Yang diukur adalah jalur kritis font & hero seperti yang dilakukan browser dengan
+cache kosong: untuk CDN, CSS Google Fonts diunduh dulu lalu semua woff2 di
+dalamnya; untuk lokal, @font-face sudah inline sehingga langsung woff2 dari
+app/static/. Waktu = CSS + file paralel terlama (koneksi baru setiap run).
+Tanpa --url, server Streamlit dijalankan sendiri di port acak.
+"""
+
+import argparse
+import os
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pakar import assets  # noqa: E402
+
+def fetch(url):
+    t0 = time.perf_counter()
+    request = urllib.request.Request(url, headers={"User-Agent": assets.USER_AGENT})
+    with urllib.request.urlopen(request, timeout=30) as response:
+        data = response.read()
+    return data, time.perf_counter() - t0
+
+def fetch_parallel(urls):
+    if not urls:
+        return 0, 0.0
+    with ThreadPoolExecutor(max_workers=len(urls)) as pool:
+        results = list(pool.map(fetch, urls))
+    return sum(len(data) for data, _ in results), max(seconds for _, seconds in results)
+
+def cdn_run():
+    css_bytes, css_s = 0, 0.0
+    fonts = []
+    for url in (assets.INTER_CSS, assets.ICONS_CSS):
+        data, seconds = fetch(url)
+        css_bytes += len(data)
+        css_s = max(css_s, seconds)
+        fonts += re.findall(r"url\((https://[^)]+)\)", data.decode("utf-8"))
+    file_bytes, file_s = fetch_parallel(fonts + [assets.HERO_CDN])
+    return css_bytes + file_bytes, css_s + file_s, len(fonts) + 1
+
+def local_run(base, manifest):
+    urls = [f"{base}/{assets.STATIC_URL}{name}" for name in manifest["preload"] + [manifest["hero"]]]
+    urls += [f"{base}/{assets.STATIC_URL}{name}" for name in manifest["files"] if name.startswith("inter-")]
+    file_bytes, file_s = fetch_parallel(urls)
+    return file_bytes, file_s, len(urls)
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def start_streamlit():
+    port = free_port()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", os.path.join(ROOT, "app.py"), "--server.headless", "true",
+         "--server.port", str(port)], cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    base = f"http://127.0.0.1:{port}"
+    for _ in range(100):
+        try:
+            urllib.request.urlopen(f"{base}/_stcore/health", timeout=1)
+            return proc, base
+        except OSError:
+            time.sleep(0.2)
+    proc.kill()
+    raise RuntimeError("server Streamlit tidak merespons")
+
+def report(name, runs):
+    size, _, count = runs[0]
+    times = sorted(seconds for _, seconds, _ in runs)
+    print(f"{name:>6} {count:>6} {size / 1024:>9.1f} {statistics.median(times) * 1000:>9.1f} {times[-1] * 1000:>9.1f}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="server Streamlit yang sudah berjalan")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--skip-cdn", action="store_true", help="lewati CDN (mis. di jaringan tertutup)")
+    args = parser.parse_args(argv)
+
+    manifest = assets.load_manifest()
+    if not manifest:
+        parser.error("static/manifest.json belum ada; jalankan python -m pakar.assets build")
+
+    proc = None
+    base = args.url
+    if base is None:
+        proc, base = start_streamlit()
+    try:
+        print(f"{'sumber':>6} {'file':>6} {'KiB':>9} {'p50 ms':>9} {'max ms':>9}")
+        if not args.skip_cdn:
+            report("cdn", [cdn_run() for _ in range(args.runs)])
+        report("lokal", [local_run(base.rstrip("/"), manifest) for _ in range(args.runs)])
+    finally:
+        if proc is not None:
+            proc.terminate()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Throughput run_diagnosis_batch vs loop run_diagnosis.
+
+Jalankan dari root repo: python benchmarks/bench_batch.py [jumlah ...]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pakar import RULES, SYMPTOMS, current_kb, run_diagnosis  # noqa: E402
+from pakar.batch import compile_batch, run_diagnosis_batch  # noqa: E402
+
+
+def make_sets(n, seed=0):
+    rng = random.Random(seed)
+    codes = list(SYMPTOMS)
+    sets = []
+    for _ in range(n):
+        # Campuran premis rule nyata + gejala acak, mirip tiket reparasi
+        picked = []
+        for rule in rng.sample(RULES, rng.randint(0, 2)):
+            picked.extend(rule["symptoms"])
+        picked.extend(rng.sample(codes, rng.randint(0, 3)))
+        sets.append(picked)
+    return sets
+
+
+def main(sizes):
+    batch = compile_batch(current_kb())
+    for n in sizes:
+        sets = make_sets(n)
+        t0 = time.perf_counter()
+        run_diagnosis_batch(sets, batch=batch)
+        dt_batch = time.perf_counter() - t0
+
+        sample = sets[:min(n, 100_000)]
+        t0 = time.perf_counter()
+        for s in sample:
+            run_diagnosis(s)
+        dt_loop = (time.perf_counter() - t0) * n / len(sample)
+
+        print(f"{n:>9,} set  batch {dt_batch:7.2f}s ({n / dt_batch:>10,.0f}/s)  "
+              f"loop {dt_loop:7.2f}s ({n / dt_loop:>10,.0f}/s)")
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
@@ -0,0 +1,96 @@
+"""Memori riwayat di proses: list dict per entri vs HistoryColumns.
+
+Jalankan dari root repo: python benchmarks/bench_history_memory.py [jumlah ...]
+
+Riwayat sintetis dibaca dari SQLite sementara lalu dibentuk menjadi (a) list
+dict seperti entri riwayat sebelumnya (datetime, nama penyebab, list gejala,
+ringkasan teks) dan (b) HistoryColumns. Kedua bentuk dibangun dari query yang
+sama di dalam wilayah tracemalloc: baris hasil fetch (dan string di dalamnya)
+ikut terhitung, lalu dilepas sebelum ukuran dibaca, sehingga hanya yang benar-
+benar ditahan oleh tiap bentuk yang tersisa. Dilaporkan juga puncak alokasi,
+waktu membangun (termasuk fetch), dan waktu merender satu halaman 20 entri
+lewat atribut yang dipakai kartu riwayat.
+
+Aplikasi hanya menahan satu halaman (21 baris) per render, jadi selisih memori
+di sini berlaku untuk blok besar seperti pada benchmark ini, bukan untuk halaman
+riwayat di app; di sana EntryView justru lebih lambat dirender (properti per
+atribut, kira-kira 1,5-2x untuk 20 entri).
+"""
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_transfer import fill  # noqa: E402
+
+from pakar import current_kb  # noqa: E402
+from pakar.columnar import HistoryColumns  # noqa: E402
+from pakar.history import COLUMNS, HistoryStore  # noqa: E402
+
+
+def as_dicts(rows, kb):
+    return [
+        {"id": id_, "cause": cause, "cause_name": cause_name, "confidence": confidence,
+         "symptoms": symptoms.split(",") if symptoms else [], "symptoms_text": symptoms_text,
+         "timestamp": datetime.fromtimestamp(ts), "level": level, "category": category}
+        for id_, ts, cause, cause_name, confidence, level, symptoms, symptoms_text, category in rows
+    ]
+
+
+def load(db, build, kb):
+    store = HistoryStore(db)
+    try:
+        # Baris hasil fetch hanya hidup di sini: yang tersisa setelah return adalah milik `build`
+        return build(store._conn.execute(f"SELECT {COLUMNS} FROM history ORDER BY id DESC").fetchall(), kb)
+    finally:
+        store.close()
+
+
+def measure(db, build, kb):
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    value = load(db, build, kb)
+    seconds = time.perf_counter() - t0
+    gc.collect()
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, size, peak, seconds
+
+
+def render(items):
+    render_once(items)
+    t0 = time.perf_counter()
+    render_once(items)
+    return time.perf_counter() - t0
+
+
+def render_once(items):
+    for item in items[:20]:
+        get = item.get if isinstance(item, dict) else lambda name, item=item: getattr(item, name)
+        get("timestamp").strftime("%d %b • %H:%M"), get("cause_name"), get("symptoms_text"), get("level")
+        int(get("confidence") * 100)
+
+
+def main(sizes):
+    kb = current_kb()
+    print(f"{'entri':>9} {'bentuk':>8} {'MiB':>8} {'B/entri':>8} {'puncak MiB':>11} {'bangun s':>9} "
+          f"{'render us':>10}")
+    for n in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            db = os.path.join(tmp, "riwayat.db")
+            fill(db, n)
+            for name, build in (("dict", as_dicts), ("kolom", HistoryColumns.from_rows)):
+                value, size, peak, seconds = measure(db, build, kb)
+                print(f"{n:>9,} {name:>8} {size / 2**20:>8.1f} {size / n:>8.0f} {peak / 2**20:>11.1f} "
+                      f"{seconds:>9.2f} {render(value) * 1e6:>10.1f}")
+                del value
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [100_000])
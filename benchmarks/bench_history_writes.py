@@ -0,0 +1,85 @@
+"""Insert riwayat berkelanjutan dari N sesi bersamaan: tulis langsung vs HistoryWriter.
+
+Jalankan dari root repo: python benchmarks/bench_history_writes.py [--duration 5] [--think MS] [sesi ...]
+
+Setiap sesi adalah thread yang terus menambah entri, dengan jeda --think
+milidetik di antara entri (default 0: tanpa jeda, beban jenuh). Mode yang dibandingkan:
+
+- ``commit``: setiap entri langsung di-commit oleh thread sesi (batch_size=1)
+- ``batch``:  HistoryStore.add bawaan, commit per 32 entri di thread sesi yang kebetulan mengisi batch
+- ``writer``: sesi hanya mengantrekan ke HistoryWriter, satu thread melakukan group commit
+
+Yang dilaporkan: entri tertulis per detik (termasuk flush akhir) dan latensi
+pemanggilan add yang dirasakan sesi (p50/p99/maks). Pada beban jenuh antrean
+HistoryWriter penuh dan `add` menunggu (backpressure), sehingga latensi maksimum
+mode writer di sana mencerminkan lama menunggu slot antrean.
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pakar.history import HistoryStore, HistoryWriter  # noqa: E402
+
+ENTRY = dict(cause="C01", cause_name="Kerusakan Bootloader", confidence=0.97, level="Tinggi",
+             symptoms=["G038", "G037", "G001"], symptoms_text="Muncul pesan error boot, Harddisk berbunyi klik",
+             category="Storage", kb_version="bench")
+
+
+def run(mode, sessions, duration, think, tmp):
+    store = HistoryStore(os.path.join(tmp, f"{mode}-{sessions}.db"), batch_size=1 if mode == "commit" else 32)
+    target = HistoryWriter(store).start() if mode == "writer" else store
+    latencies = [[] for _ in range(sessions)]
+    start = threading.Barrier(sessions + 1)
+    stop = threading.Event()
+
+    def session(samples):
+        start.wait()
+        while not stop.is_set():
+            t0 = time.perf_counter()
+            target.add(**ENTRY)
+            samples.append(time.perf_counter() - t0)
+            if think:
+                time.sleep(think)
+
+    threads = [threading.Thread(target=session, args=(samples,)) for samples in latencies]
+    for t in threads:
+        t.start()
+    start.wait()
+    t0 = time.perf_counter()
+    time.sleep(duration)
+    stop.set()
+    for t in threads:
+        t.join()
+    if mode == "writer":
+        target.close()
+    store.flush()
+    seconds = time.perf_counter() - t0
+    written = store.count()
+    store.close()
+    samples = sorted(s for per_session in latencies for s in per_session)
+    p99 = samples[int(len(samples) * 0.99)]
+    print(f"{mode:>7} {sessions:>6} {written / seconds:>12,.0f} {statistics.median(samples) * 1e6:>9.1f} "
+          f"{p99 * 1e6:>9.1f} {samples[-1] * 1e3:>9.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("sessions", nargs="*", type=int, default=[1, 8, 32, 64])
+    parser.add_argument("--duration", type=float, default=5.0, help="detik per percobaan")
+    parser.add_argument("--think", type=float, default=0.0, metavar="MS", help="jeda antar entri per sesi")
+    args = parser.parse_args(argv)
+    print(f"{'mode':>7} {'sesi':>6} {'entri/s':>12} {'p50 us':>9} {'p99 us':>9} {'maks ms':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for sessions in args.sessions:
+            for mode in ("commit", "batch", "writer"):
+                run(mode, sessions, args.duration, args.think / 1000, tmp)
+
+
+if __name__ == "__main__":
+    main()
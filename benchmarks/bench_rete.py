@@ -0,0 +1,81 @@
+"""Matcher Rete vs pemindaian naif forward_chaining per perubahan gejala.
+
+Jalankan dari root repo: python benchmarks/bench_rete.py [--scales base,1k,10k]
+
+Beban kerja meniru sesi di symptoms_page: gejala dicentang satu per satu lalu
+dilepas lagi. Untuk setiap toggle diukur:
+
+- naive:       forward_chaining ulang atas seluruh gejala terpilih
+- incremental: IncrementalDiagnosis (hitungan premis per rule)
+- rete:        ReteDiagnosis (node kondisi bersama)
+"""
+
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.synthetic import SCALES, generate_kb, generate_queries  # noqa: E402
+from pakar import KnowledgeBase, forward_chaining  # noqa: E402
+from pakar.incremental import IncrementalDiagnosis  # noqa: E402
+from pakar.rete import ReteNetwork, ReteDiagnosis  # noqa: E402
+
+def toggles(queries):
+    # (gejala, dicentang?) untuk setiap sesi: centang semua, lalu lepas dari belakang
+    for query in queries:
+        codes = list(dict.fromkeys(query))
+        for code in codes:
+            yield code, True
+        for code in reversed(codes):
+            yield code, False
+
+def run_naive(kb, events):
+    selected = set()
+    for code, on in events:
+        if on:
+            selected.add(code)
+        else:
+            selected.discard(code)
+        forward_chaining(selected, kb)
+
+def run_session(cls, kb, events):
+    state = cls(kb)
+    for code, on in events:
+        if on:
+            state.add(code)
+        else:
+            state.remove(code)
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - t0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", default=",".join(SCALES))
+    parser.add_argument("--sessions", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    print(f"{'skala':>6} {'rule':>7} {'kondisi':>8} {'node':>7} {'kompilasi':>10} "
+          f"{'naive':>9} {'incr':>9} {'rete':>9}  (us per toggle)")
+    for scale in args.scales.split(","):
+        symptoms, causes, rules = generate_kb(*SCALES[scale])
+        kb = KnowledgeBase(symptoms, causes, rules)
+        t0 = time.perf_counter()
+        network = kb.derived("rete_network", ReteNetwork)
+        compile_s = time.perf_counter() - t0
+
+        events = list(toggles(generate_queries(symptoms, rules, args.sessions)))
+        naive = timed(run_naive, kb, events)
+        incremental = timed(run_session, IncrementalDiagnosis, kb, events)
+        rete = timed(run_session, ReteDiagnosis, kb, events)
+        per = lambda s: s / len(events) * 1e6  # noqa: E731
+        print(f"{scale:>6} {len(rules):>7} {network.conditions:>8} {len(network):>7} {compile_s:>9.2f}s "
+              f"{per(naive):>9.1f} {per(incremental):>9.1f} {per(rete):>9.1f}")
+
+if __name__ == "__main__":
+    main()
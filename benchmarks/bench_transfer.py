@@ -0,0 +1,79 @@
+"""Throughput ekspor/impor riwayat per format (CSV, JSONL, Parquet).
+
+Jalankan dari root repo: python benchmarks/bench_transfer.py [--memory] [jumlah ...]
+
+Riwayat sintetis ditulis ke SQLite sementara, diekspor ke setiap format lalu
+diimpor ke database kosong. Dengan --memory, puncak memori (tracemalloc)
+dilaporkan agar terlihat bahwa memori tidak tumbuh dengan jumlah baris; throughput
+pada mode ini lebih rendah karena tracemalloc mencatat setiap alokasi.
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pakar import CAUSES, SYMPTOMS  # noqa: E402
+from pakar.history import HistoryStore  # noqa: E402
+from pakar.transfer import FORMATS, export_history, import_history  # noqa: E402
+
+
+def fill(path, n, seed=0):
+    rng = random.Random(seed)
+    codes = list(SYMPTOMS)
+    causes = list(CAUSES.items())
+    start = datetime.now() - timedelta(days=365)
+    store = HistoryStore(path)
+    for i in range(0, n, 10_000):
+        rows = []
+        for _ in range(min(10_000, n - i)):
+            cause_id, cause = rng.choice(causes)
+            symptoms = rng.sample(codes, rng.randint(1, 5))
+            rows.append((
+                (start + timedelta(seconds=rng.randint(0, 365 * 86400))).timestamp(), cause_id, cause["name"],
+                rng.random(), cause["level"], symptoms, ", ".join(SYMPTOMS[c]["text"] for c in symptoms),
+                cause.get("category", ""), "bench",
+            ))
+        store.add_many(rows)
+    store.close()
+
+
+def timed(fn, *args, memory=False):
+    if memory:
+        tracemalloc.start()
+    t0 = time.perf_counter()
+    fn(*args)
+    seconds = time.perf_counter() - t0
+    if not memory:
+        return seconds, ""
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, f" (puncak {peak / 2**20:5.1f} MiB)"
+
+
+def main(sizes, memory=False):
+    for n in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            db = os.path.join(tmp, "riwayat.db")
+            fill(db, n)
+            print(f"{n:,} entri")
+            for fmt in FORMATS:
+                path = os.path.join(tmp, f"riwayat.{fmt}")
+                try:
+                    dt_out, mem_out = timed(export_history, db, path, memory=memory)
+                except ValueError as e:
+                    print(f"  {fmt:>8}  dilewati: {e}")
+                    continue
+                dt_in, mem_in = timed(import_history, os.path.join(tmp, f"impor-{fmt}.db"), path, memory=memory)
+                print(f"  {fmt:>8}  {os.path.getsize(path) / 2**20:7.1f} MiB  "
+                      f"ekspor {n / dt_out:>9,.0f}/s{mem_out}  impor {n / dt_in:>9,.0f}/s{mem_in}")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    memory = "--memory" in args
+    main([int(a) for a in args if a != "--memory"] or [100_000, 1_000_000], memory)
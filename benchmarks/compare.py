@@ -0,0 +1,37 @@
+"""Bandingkan dua hasil benchmarks/run.py: python benchmarks/compare.py lama.json baru.json"""
+
+import json
+import sys
+
+# Metrik yang lebih besar = lebih baik; selain itu lebih kecil = lebih baik
+HIGHER_IS_BETTER = ("sets_per_s",)
+
+def flatten(tree, prefix=""):
+    for key, value in tree.items():
+        name = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            yield from flatten(value, name)
+        elif isinstance(value, float):
+            yield name, value
+
+def main(old_path, new_path):
+    with open(old_path) as f:
+        old = json.load(f)
+    with open(new_path) as f:
+        new = json.load(f)
+    print(f"{old['meta']['commit']} -> {new['meta']['commit']}")
+
+    new_values = dict(flatten({"engine": new["engine"], "pages": new["pages"]}))
+    for name, before in flatten({"engine": old["engine"], "pages": old["pages"]}):
+        after = new_values.get(name)
+        if after is None or not before:
+            continue
+        change = after / before - 1
+        better = change > 0 if name.endswith(HIGHER_IS_BETTER) else change < 0
+        flag = "" if abs(change) < 0.05 else ("  lebih baik" if better else "  LEBIH BURUK")
+        print(f"{name:<40} {before:>14.2f} {after:>14.2f} {change:>+8.1%}{flag}")
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        sys.exit(__doc__)
+    main(sys.argv[1], sys.argv[2])
@@ -0,0 +1,144 @@
+"""Uji beban layanan JSON (pakar.service): request per detik dan persentil latensi.
+
+    python benchmarks/load_test.py --spawn                      # jalankan uvicorn sendiri
+    python benchmarks/load_test.py --url http://127.0.0.1:8000 --concurrency 128 --duration 20
+    python benchmarks/load_test.py --spawn --batch 500          # POST /diagnose/batch
+
+Klien memakai koneksi HTTP/1.1 keep-alive langsung di atas asyncio (tanpa
+dependensi tambahan), satu koneksi per pekerja konkuren.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from urllib.parse import urlsplit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.synthetic import generate_queries  # noqa: E402
+from pakar import RULES, SYMPTOMS  # noqa: E402
+
+def percentile(samples, q):
+    return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+def build_bodies(batch, n=2000):
+    queries = generate_queries(SYMPTOMS, RULES, n)
+    if not batch:
+        return "/diagnose", [json.dumps({"symptoms": q}).encode() for q in queries]
+    bodies = []
+    for start in range(0, n, batch):
+        items = [{"id": start + i, "symptoms": q} for i, q in enumerate(queries[start:start + batch])]
+        bodies.append(json.dumps({"items": items}).encode())
+    return "/diagnose/batch", bodies
+
+async def request(reader, writer, host, path, body):
+    writer.write(
+        f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+    )
+    head = await reader.readuntil(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    length = 0
+    for line in head.split(b"\r\n")[1:]:
+        name, _, value = line.partition(b":")
+        if name.strip().lower() == b"content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+async def worker(host, port, path, bodies, offset, deadline, latencies, errors):
+    reader, writer = await asyncio.open_connection(host, port)
+    n = offset
+    try:
+        while time.perf_counter() < deadline:
+            t0 = time.perf_counter()
+            status = await request(reader, writer, host, path, bodies[n % len(bodies)])
+            latencies.append(time.perf_counter() - t0)
+            if status != 200:
+                errors.append(status)
+            n += 1
+    finally:
+        writer.close()
+
+async def run_load(url, path, bodies, concurrency, duration):
+    parts = urlsplit(url)
+    host, port = parts.hostname, parts.port or 80
+    latencies, errors = [], []
+    # Pemanasan singkat agar kompilasi KB/batch tidak ikut terukur
+    await worker(host, port, path, bodies, 0, time.perf_counter() + 0.5, [], [])
+    t0 = time.perf_counter()
+    deadline = t0 + duration
+    await asyncio.gather(*(worker(host, port, path, bodies, i * 7, deadline, latencies, errors)
+                           for i in range(concurrency)))
+    return latencies, errors, time.perf_counter() - t0
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def spawn_server():
+    port = free_port()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "pakar.service:app", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT,
+    )
+    for _ in range(100):
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            return proc, f"http://127.0.0.1:{port}"
+        except OSError:
+            time.sleep(0.1)
+    proc.terminate()
+    raise RuntimeError("uvicorn tidak bisa dijalankan")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--spawn", action="store_true", help="jalankan uvicorn pakar.service:app di port bebas")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=10.0, help="lama pengukuran (detik)")
+    parser.add_argument("--batch", type=int, default=0, metavar="N", help="item per request /diagnose/batch")
+    parser.add_argument("--out", default=None, help="simpan ringkasan sebagai JSON")
+    args = parser.parse_args(argv)
+
+    proc = None
+    url = args.url
+    if args.spawn:
+        proc, url = spawn_server()
+    try:
+        path, bodies = build_bodies(args.batch)
+        latencies, errors, elapsed = asyncio.run(run_load(url, path, bodies, args.concurrency, args.duration))
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+
+    latencies.sort()
+    report = {
+        "url": url + path,
+        "concurrency": args.concurrency,
+        "batch": args.batch,
+        "requests": len(latencies),
+        "errors": len(errors),
+        "seconds": elapsed,
+        "requests_per_s": len(latencies) / elapsed,
+        "diagnoses_per_s": len(latencies) * max(args.batch, 1) / elapsed,
+        "p50_ms": percentile(latencies, 0.50) * 1e3,
+        "p95_ms": percentile(latencies, 0.95) * 1e3,
+        "p99_ms": percentile(latencies, 0.99) * 1e3,
+    }
+    for key, value in report.items():
+        print(f"{key:>16}: {value:.2f}" if isinstance(value, float) else f"{key:>16}: {value}")
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Benchmark mesin inferensi dan halaman Streamlit; hasil disimpan sebagai JSON.
+
+    python benchmarks/run.py                       # semua skala + halaman
+    python benchmarks/run.py --scales base,1k --no-pages --out hasil.json
+    python benchmarks/compare.py lama.json baru.json
+
+Setiap skala memakai KB sintetis (benchmarks/synthetic.py). Latensi dilaporkan
+sebagai p50/p99 dalam mikrodetik, memori puncak dari tracemalloc dalam MB.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.synthetic import SCALES, generate_kb, generate_queries  # noqa: E402
+from pakar import KnowledgeBase, run_diagnosis  # noqa: E402
+from pakar.batch import compile_batch, run_diagnosis_batch  # noqa: E402
+
+def percentiles(samples):
+    samples = sorted(samples)
+    pick = lambda q: samples[min(len(samples) - 1, int(q * len(samples)))]  # noqa: E731
+    return {"p50_us": pick(0.50) * 1e6, "p99_us": pick(0.99) * 1e6, "n": len(samples)}
+
+def peak_memory(fn):
+    tracemalloc.start()
+    try:
+        result = fn()
+        return result, tracemalloc.get_traced_memory()[1] / 1e6
+    finally:
+        tracemalloc.stop()
+
+def time_each(fn, items):
+    timings = []
+    for item in items:
+        t0 = time.perf_counter()
+        fn(item)
+        timings.append(time.perf_counter() - t0)
+    return timings
+
+def bench_engine(scale, n_queries, n_batch, top_k):
+    n_symptoms, n_causes, n_rules = SCALES[scale]
+    symptoms, causes, rules = generate_kb(n_symptoms, n_causes, n_rules)
+
+    # Waktu dan memori diukur terpisah karena tracemalloc memperlambat eksekusi
+    t0 = time.perf_counter()
+    kb = KnowledgeBase(symptoms, causes, rules)
+    compile_s = time.perf_counter() - t0
+    _, compile_mb = peak_memory(lambda: KnowledgeBase(symptoms, causes, rules))
+    queries = generate_queries(symptoms, rules, n_queries)
+    batch_queries = generate_queries(symptoms, rules, n_batch, seed=2)
+
+    single = time_each(lambda q: run_diagnosis(q, kb), queries)
+    _, single_mb = peak_memory(lambda: [run_diagnosis(q, kb) for q in queries[:1000]])
+
+    batch, batch_compile_mb = peak_memory(lambda: compile_batch(kb))
+    t0 = time.perf_counter()
+    run_diagnosis_batch(batch_queries, batch=batch)
+    batch_s = time.perf_counter() - t0
+    _, batch_mb = peak_memory(lambda: run_diagnosis_batch(batch_queries, batch=batch))
+
+    topk = time_each(lambda q: run_diagnosis(q, kb, k=top_k), queries)
+
+    return {
+        "kb": {"symptoms": n_symptoms, "causes": n_causes, "rules": n_rules},
+        "compile": {"seconds": compile_s, "peak_mb": compile_mb, "batch_peak_mb": batch_compile_mb},
+        "single": {**percentiles(single), "peak_mb": single_mb},
+        "batch": {"sets": n_batch, "seconds": batch_s, "sets_per_s": n_batch / batch_s, "peak_mb": batch_mb},
+        "topk": {"k": top_k, **percentiles(topk)},
+    }
+
+def bench_pages(reruns, history_rows):
+    from streamlit.testing.v1 import AppTest
+    from pakar.history import HistoryStore
+
+    # Riwayat sementara agar history_page punya isi tanpa menyentuh riwayat.db
+    db = os.path.join(tempfile.mkdtemp(), "bench.db")
+    store = HistoryStore(db, batch_size=1000)
+    for i in range(history_rows):
+        store.add("C28", "Bootloader Windows Rusak", 0.97, "Sedang", ["G038"], "Muncul pesan 'Boot Device Not",
+                  category="Storage")
+    store.close()
+    os.environ["PAKAR_HISTORY_DB"] = db
+
+    at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=60).run()
+    at.session_state.page = "symptoms"
+    at.run()
+    at.checkbox(key="G038").check().run()
+    # Centang hanya menjalankan ulang fragmen; rerun penuh agar tombol Analisa ada di pohon elemen
+    at.run()
+    at.button(key="btn_analyze").click().run()
+
+    pages = {}
+    for page in ("home", "symptoms", "results", "history"):
+        timings = []
+        for _ in range(reruns):
+            at.session_state.page = page
+            t0 = time.perf_counter()
+            at.run()
+            timings.append(time.perf_counter() - t0)
+        if at.exception:
+            raise RuntimeError(f"{page}_page gagal: {at.exception}")
+        pages[f"{page}_page"] = percentiles(timings)
+    return pages
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", default=",".join(SCALES), help="daftar skala, mis. base,1k,10k")
+    parser.add_argument("--queries", type=int, default=5000, help="jumlah query tunggal per skala")
+    parser.add_argument("--batch", type=int, default=100_000, help="jumlah himpunan gejala untuk batch")
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--no-pages", action="store_true", help="lewati benchmark halaman (AppTest)")
+    parser.add_argument("--reruns", type=int, default=30, help="rerun per halaman")
+    parser.add_argument("--history-rows", type=int, default=10_000)
+    parser.add_argument("--out", default=None, help="file JSON (default: benchmarks/results/<commit>.json)")
+    args = parser.parse_args(argv)
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "engine": {},
+        "pages": {},
+    }
+    for scale in args.scales.split(","):
+        print(f"[engine] {scale} ...", file=sys.stderr)
+        report["engine"][scale] = bench_engine(scale, args.queries, args.batch, args.top_k)
+    if not args.no_pages:
+        print("[pages] AppTest ...", file=sys.stderr)
+        report["pages"] = bench_pages(args.reruns, args.history_rows)
+
+    out = args.out or os.path.join(ROOT, "benchmarks", "results", f"{report['meta']['commit'] or 'local'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w") as f:
+        json.dump(report, f, indent=2)
+    print(out)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Basis pengetahuan sintetis berbentuk SYMPTOMS/CAUSES/RULES untuk benchmark.
+
+Bentuknya meniru KB asli: gejala terbagi ke beberapa kategori, rule punya 1-3
+premis yang sebagian besar dari kategori yang sama, dan sebagian kecil gejala
+populer muncul di banyak rule (seperti G038, G051, G057).
+"""
+
+import random
+
+CATEGORIES = ["Layar", "Power", "Input", "Audio", "Storage", "Network", "Thermal", "System", "Fisik"]
+LEVELS = ["Rendah", "Sedang", "Tinggi"]
+
+# Skala (gejala, penyebab, rule); "base" sama dengan ukuran KB saat ini
+SCALES = {
+    "base": (75, 50, 59),
+    "1k": (1_000, 500, 5_000),
+    "10k": (10_000, 5_000, 100_000),
+}
+
+def generate_kb(n_symptoms, n_causes, n_rules, seed=0):
+    rng = random.Random(seed)
+    width = len(str(max(n_symptoms, n_causes, n_rules)))
+
+    symptoms = {}
+    by_category = {cat: [] for cat in CATEGORIES}
+    for i in range(n_symptoms):
+        code = f"G{i + 1:0{width}d}"
+        cat = CATEGORIES[i * len(CATEGORIES) // n_symptoms]
+        symptoms[code] = {"text": f"Gejala sintetis {code}", "category": cat}
+        by_category[cat].append(code)
+
+    causes = {}
+    cause_category = {}
+    for i in range(n_causes):
+        code = f"C{i + 1:0{width}d}"
+        cat = CATEGORIES[i * len(CATEGORIES) // n_causes]
+        causes[code] = {
+            "name": f"Penyebab sintetis {code}",
+            "category": cat,
+            "prior_cf": round(rng.uniform(0.70, 0.98), 2),
+            "level": rng.choice(LEVELS),
+            "desc": f"Deskripsi {code}",
+            "sol": [f"1. Solusi pertama {code}.", f"2. Solusi kedua {code}."],
+        }
+        cause_category[code] = cat
+
+    all_codes = list(symptoms)
+    cause_codes = list(causes)
+    rules = []
+    for i in range(n_rules):
+        # Setiap penyebab minimal punya satu rule, sisanya acak
+        cause = cause_codes[i] if i < n_causes else rng.choice(cause_codes)
+        pool = by_category[cause_category[cause]] or all_codes
+        size = rng.choices([1, 2, 3], weights=[3, 4, 2])[0]
+        premise = []
+        while len(premise) < size:
+            if rng.random() < 0.8:
+                # Distribusi miring: gejala awal tiap kategori lebih sering dipakai
+                code = pool[int(len(pool) * rng.random() ** 2)]
+            else:
+                code = rng.choice(all_codes)
+            if code not in premise:
+                premise.append(code)
+        rules.append({"id": f"R{i + 1:0{width}d}", "symptoms": premise, "cause": cause,
+                      "cf": round(rng.uniform(0.60, 0.98), 2)})
+    return symptoms, causes, rules
+
+def generate_queries(symptoms, rules, n, seed=1):
+    """Himpunan gejala campuran: premis rule nyata ditambah gejala acak."""
+    rng = random.Random(seed)
+    codes = list(symptoms)
+    queries = []
+    for _ in range(n):
+        picked = []
+        for rule in rng.sample(rules, min(len(rules), rng.randint(0, 2))):
+            picked.extend(rule["symptoms"])
+        picked.extend(rng.sample(codes, min(len(codes), rng.randint(0, 3))))
+        queries.append(picked)
+    return queries
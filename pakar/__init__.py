@@ -0,0 +1,31 @@
+"""Sistem pakar diagnosa kerusakan laptop tanpa ketergantungan ke Streamlit.
+
+Modul batch (NumPy) baru dimuat saat `run_diagnosis_batch` pertama kali dipakai
+supaya `import pakar` tetap ringan untuk worker dan skrip.
+"""
+
+from .engine import (KnowledgeBase, combine_cf, current_kb, forward_chaining, kb_version, rank_causes, run_diagnosis,
+                     use_kb)
+from .kb import CAUSES, RULES, SYMPTOMS, THRESHOLD_CF
+
+__all__ = [
+    "CAUSES",
+    "KnowledgeBase",
+    "RULES",
+    "SYMPTOMS",
+    "THRESHOLD_CF",
+    "combine_cf",
+    "current_kb",
+    "forward_chaining",
+    "kb_version",
+    "rank_causes",
+    "run_diagnosis",
+    "run_diagnosis_batch",
+    "use_kb",
+]
+
+def __getattr__(name):
+    if name == "run_diagnosis_batch":
+        from .batch import run_diagnosis_batch
+        return run_diagnosis_batch
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
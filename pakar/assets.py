@@ -0,0 +1,159 @@
+"""Aset statis (font & gambar hero) yang di-bundle agar UI tetap cepat tanpa internet.
+
+Build (butuh internet sekali, di mesin mana saja), hasilnya ke folder ``static/``::
+
+    python -m pakar.assets build
+
+- Material Symbols: hanya glyph ikon yang benar-benar dipakai app.py
+  (parameter ``icon_names`` Google Fonts), satu instance statis (wght 400, FILL 0)
+  karena app tidak memakai font-variation-settings
+- Inter: hanya subset ``latin`` untuk bobot yang dipakai
+- Hero: versi WebP 1200px dari gambar Unsplash yang sama
+
+Nama file memuat hash isinya sehingga aman di-cache selamanya. Saat runtime
+``font_head()`` dan ``hero_url()`` memakai ``static/manifest.json`` bila ada,
+dan kembali ke CDN bila belum di-build.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATIC_DIR = os.path.join(ROOT, "static")
+MANIFEST = os.path.join(STATIC_DIR, "manifest.json")
+# Prefix URL file di static/ yang disajikan Streamlit (server.enableStaticServing)
+STATIC_URL = "app/static/"
+
+INTER_CSS = "https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;900&display=swap"
+ICONS_CSS = "https://fonts.googleapis.com/css2?family=Material+Symbols+Outlined:wght,FILL@100..700,0..1&display=swap"
+ICONS_STATIC_CSS = "https://fonts.googleapis.com/css2?family=Material+Symbols+Outlined:opsz,wght,FILL,GRAD@24,400,0,0"
+HERO_CDN = "https://images.unsplash.com/photo-1518770660439-4636190af475?q=80&w=2070&auto=format&fit=crop"
+HERO_BUILD = "https://images.unsplash.com/photo-1518770660439-4636190af475?q=70&w=1200&fm=webp&fit=crop"
+
+# Google Fonts memilih format dari User-Agent; ini agar yang dikirim woff2
+USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+
+# Ikon di app.py: isi <span class="material-symbols-outlined">, tuple ("ikon", "#warna")
+# di CATEGORY_ICONS, dan tuple (..., "#warna", "ikon") di HISTORY_LEVEL_STYLE
+ICON_PATTERNS = (
+    re.compile(r"material-symbols-outlined['\"][^>]*>\s*([a-z0-9_]+)\s*<"),
+    re.compile(r"\(\"([a-z0-9_]+)\", \"#[0-9a-fA-F]{6}\"\)"),
+    re.compile(r"\"#[0-9a-fA-F]{6}\", \"([a-z0-9_]+)\"\)"),
+)
+
+_manifest = None
+
+def load_manifest():
+    global _manifest
+    if _manifest is None:
+        try:
+            with open(MANIFEST, encoding="utf-8") as f:
+                _manifest = json.load(f)
+        except (OSError, ValueError):
+            _manifest = {}
+    return _manifest
+
+def font_head():
+    """HTML <head> untuk font: @font-face lokal + preload, atau <link> ke CDN."""
+    manifest = load_manifest()
+    if not manifest:
+        return (f'<link href="{INTER_CSS}" rel="stylesheet">\n'
+                f'<link href="{ICONS_CSS}" rel="stylesheet">\n')
+    preload = "".join(
+        f'<link rel="preload" href="{STATIC_URL}{name}" as="font" type="font/woff2" crossorigin>\n'
+        for name in manifest["preload"])
+    return f"{preload}<style>{manifest['fonts_css']}</style>\n"
+
+def hero_url():
+    manifest = load_manifest()
+    return f"{STATIC_URL}{manifest['hero']}" if manifest else HERO_CDN
+
+def icon_names(source):
+    names = set()
+    for pattern in ICON_PATTERNS:
+        names.update(pattern.findall(source))
+    return sorted(names)
+
+def fetch(url):
+    request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+    with urllib.request.urlopen(request, timeout=30) as response:
+        return response.read()
+
+def save(data, stem, ext):
+    # Nama berisi hash isi: URL berubah setiap isi berubah, jadi boleh di-cache permanen
+    name = f"{stem}-{hashlib.sha256(data).hexdigest()[:12]}.{ext}"
+    with open(os.path.join(STATIC_DIR, name), "wb") as f:
+        f.write(data)
+    return name
+
+def localize_css(css, stem, keep_block=None):
+    """Unduh semua url() woff2 di CSS Google Fonts dan ganti dengan path lokal."""
+    if keep_block is not None:
+        # Buang blok @font-face untuk subset unicode yang tidak dipakai (/* cyrillic */ dst.)
+        blocks = re.findall(r"/\* ([\w-]+) \*/\s*(@font-face \{.*?\})", css, flags=re.S)
+        css = "\n".join(block for subset, block in blocks if subset == keep_block)
+    files = []
+
+    def replace(match):
+        name = save(fetch(match.group(1)), stem, "woff2")
+        files.append(name)
+        return f"url({STATIC_URL}{name})"
+
+    return re.sub(r"url\((https://[^)]+)\)", replace, css), files
+
+def build(app_path):
+    os.makedirs(STATIC_DIR, exist_ok=True)
+    with open(app_path, encoding="utf-8") as f:
+        icons = icon_names(f.read())
+
+    icons_url = f"{ICONS_STATIC_CSS}&icon_names={','.join(icons)}&display=block"
+    icons_css, icon_files = localize_css(fetch(icons_url).decode("utf-8"), "material-symbols")
+    inter_css, inter_files = localize_css(fetch(INTER_CSS).decode("utf-8"), "inter", keep_block="latin")
+    hero = save(fetch(HERO_BUILD), "hero", "webp")
+
+    manifest = {
+        "icons": icons,
+        "fonts_css": re.sub(r"\s+", " ", inter_css + icons_css).strip(),
+        # Font ikon dipreload: tanpanya nama ikon tampil sebagai teks sampai font termuat
+        "preload": icon_files,
+        "hero": hero,
+        "files": icon_files + inter_files + [hero],
+    }
+    with open(MANIFEST, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1)
+
+    # Sisa build lama (hash berbeda) dihapus agar folder static tidak membengkak
+    keep = set(manifest["files"]) | {"manifest.json", ".gitkeep"}
+    for name in os.listdir(STATIC_DIR):
+        if name not in keep:
+            os.remove(os.path.join(STATIC_DIR, name))
+    return manifest
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m pakar.assets", description="Build aset statis UI.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build_cmd = sub.add_parser("build", help="unduh & subset font serta gambar hero ke static/")
+    build_cmd.add_argument("--app", default=os.path.join(ROOT, "app.py"))
+    sub.add_parser("icons", help="tampilkan ikon yang dipakai app.py")
+    args = parser.parse_args(argv)
+
+    if args.command == "icons":
+        with open(os.path.join(ROOT, "app.py"), encoding="utf-8") as f:
+            print(" ".join(icon_names(f.read())))
+        return 0
+    try:
+        manifest = build(args.app)
+    except OSError as e:
+        print(f"gagal mengunduh aset: {e}", file=sys.stderr)
+        return 1
+    total = sum(os.path.getsize(os.path.join(STATIC_DIR, name)) for name in manifest["files"])
+    print(f"{len(manifest['icons'])} ikon, {len(manifest['files'])} file, {total / 1024:.1f} KiB -> {STATIC_DIR}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
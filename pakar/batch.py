@@ -0,0 +1,143 @@
+"""Diagnosa batch tervektorisasi (NumPy) untuk banyak himpunan gejala."""
+
+from itertools import chain, islice
+
+import numpy as np
+
+from .engine import current_kb
+from .kb import THRESHOLD_CF
+
+def compile_batch(kb):
+    # Matriks insidensi gejala x rule dalam bentuk sparse (CSR), baris gejala mengikuti
+    # kb.symptom_bits; diambil langsung dari indeks terbalik gejala -> rule milik KB.
+    # Matriks padat tidak muat untuk KB besar (10k gejala x 100k rule = 4 GB float32).
+    columns = {code: i for i, code in enumerate(kb.symptom_bits)}
+    n_rules = len(kb.rule_cf)
+    counts = np.array([len(kb.symptom_rules[code]) for code in columns], dtype=np.int64)
+    sym_ptr = np.zeros(len(columns) + 1, dtype=np.int64)
+    np.cumsum(counts, out=sym_ptr[1:])
+    sym_rules = np.fromiter(chain.from_iterable(kb.symptom_rules[code] for code in columns),
+                            dtype=np.int64, count=int(sym_ptr[-1]))
+    rule_len = np.bincount(sym_rules, minlength=n_rules)
+
+    cause_ids = list(dict.fromkeys(kb.rule_cause))
+    cause_index = {c: i for i, c in enumerate(cause_ids)}
+    return {
+        "columns": columns,
+        "sym_ptr": sym_ptr,
+        "sym_rules": sym_rules,
+        "rule_len": rule_len,
+        "always": np.array(kb.always_rules, dtype=np.int64),
+        "rule_cause": np.array([cause_index[c] for c in kb.rule_cause], dtype=np.int64),
+        "rule_cf": np.array(kb.rule_cf, dtype=np.float64),
+        "cause_ids": cause_ids,
+        "prior": np.array([kb.causes[c]["prior_cf"] for c in cause_ids], dtype=np.float64),
+    }
+
+def fire_rules(batch, rows, cols, n, partial=False):
+    """Pasangan (rule, set) yang semua premisnya terpenuhi, plus bobot tiap pasangan.
+
+    Setara dengan (X @ incidence) == panjang premis, tetapi hanya baris CSR milik
+    gejala yang dipilih yang disentuh, lalu premis dihitung per (set, rule). Pada
+    mode partial setiap rule yang tersentuh ikut, berbobot pecahan premis yang ada.
+    """
+    n_rules = len(batch["rule_len"])
+    pairs = np.unique(rows * len(batch["columns"]) + cols)
+    rows, cols = np.divmod(pairs, len(batch["columns"]))
+    sym_ptr = batch["sym_ptr"]
+    fan_out = sym_ptr[cols + 1] - sym_ptr[cols]
+    offsets = np.repeat(sym_ptr[cols] - (np.cumsum(fan_out) - fan_out), fan_out) + np.arange(fan_out.sum())
+    keys, hits = np.unique(np.repeat(rows, fan_out) * n_rules + batch["sym_rules"][offsets], return_counts=True)
+    rule_len = batch["rule_len"][keys % n_rules]
+    weight = None
+    if partial:
+        weight = hits / rule_len
+    else:
+        keys = keys[hits == rule_len]
+    set_idx, rule_idx = np.divmod(keys, n_rules)
+    if len(batch["always"]):
+        rule_idx = np.concatenate([rule_idx, np.repeat(batch["always"], n)])
+        set_idx = np.concatenate([set_idx, np.tile(np.arange(n), len(batch["always"]))])
+        if partial:
+            weight = np.concatenate([weight, np.ones(len(batch["always"]) * n)])
+    return rule_idx, set_idx, weight
+
+def score_batch(batch, symptom_sets, k=3, threshold=THRESHOLD_CF, partial=False):
+    columns = batch["columns"]
+    n, n_causes = len(symptom_sets), len(batch["cause_ids"])
+    lookup = columns.get
+    cols = np.array([lookup(s, -1) for symptoms in symptom_sets for s in symptoms], dtype=np.int64)
+    rows = np.repeat(np.arange(n), [len(symptoms) for symptoms in symptom_sets])
+    known = cols >= 0
+    rule_idx, set_idx, weight = fire_rules(batch, rows[known], cols[known], n, partial)
+    rule_cf = batch["rule_cf"][rule_idx] * weight if partial else batch["rule_cf"][rule_idx]
+
+    # Kelompokkan pasangan (set, cause); di dalam kelompok urut sesuai RULES
+    key = set_idx * n_causes + batch["rule_cause"][rule_idx]
+    order = np.lexsort((rule_idx, key))
+    key, rule_idx, rule_cf = key[order], rule_idx[order], rule_cf[order]
+    is_start = np.ones(len(key), dtype=bool)
+    is_start[1:] = key[1:] != key[:-1]
+    starts = np.flatnonzero(is_start)
+    group = np.cumsum(is_start) - 1
+    rank = np.arange(len(key)) - starts[group]
+
+    # MYCIN combine_cf = 1 - (1 - prior) * prod(1 - cf): rule ke-r tiap kelompok
+    # digabung pada putaran ke-r, urutan operasinya sama dengan forward_chaining
+    group_set = key[starts] // n_causes
+    group_cause = key[starts] % n_causes
+    cf = batch["prior"][group_cause]
+    for r in range(int(rank.max()) + 1 if len(rank) else 0):
+        sel = rank == r
+        g = group[sel]
+        cf[g] = cf[g] + rule_cf[sel] * (1 - cf[g])
+
+    # Top-k per set di antara CF >= threshold: CF menurun, seri dipecah oleh rule
+    # pertama yang menyala (sama dengan rank_causes)
+    passed = cf >= threshold
+    first_rule, group_set, group_cause, cf = rule_idx[starts][passed], group_set[passed], group_cause[passed], cf[passed]
+    order = np.lexsort((first_rule, -cf, group_set))
+    group_set, group_cause, cf = group_set[order], group_cause[order], cf[order]
+    is_first = np.ones(len(group_set), dtype=bool)
+    is_first[1:] = group_set[1:] != group_set[:-1]
+    set_start = np.flatnonzero(is_first)
+    keep = (np.arange(len(group_set)) - set_start[np.cumsum(is_first) - 1]) < k
+
+    cause_ids = batch["cause_ids"]
+    tops = [[] for _ in range(n)]
+    for i, c, v in zip(group_set[keep].tolist(), group_cause[keep].tolist(), cf[keep].tolist()):
+        tops[i].append((cause_ids[c], v))
+    return [(top, "success") if top else (None, "low_confidence") for top in tops]
+
+def count_fired(batch, symptom_sets):
+    """Berapa kali setiap rule menyala (semua premis terpenuhi) di seluruh himpunan gejala."""
+    n_rules = len(batch["rule_len"])
+    columns = batch["columns"]
+    cols = np.array([columns.get(s, -1) for symptoms in symptom_sets for s in symptoms], dtype=np.int64)
+    rows = np.repeat(np.arange(len(symptom_sets)), [len(symptoms) for symptoms in symptom_sets])
+    known = cols >= 0
+    rule_idx, _, _ = fire_rules(batch, rows[known], cols[known], len(symptom_sets))
+    return np.bincount(rule_idx, minlength=n_rules)
+
+_compiled = {}
+
+def batch_for(kb):
+    # Satu matriks per versi KB; versi lama dibuang saat KB berganti
+    batch = _compiled.get(kb.version)
+    if batch is None:
+        batch = compile_batch(kb)
+        _compiled.clear()
+        _compiled[kb.version] = batch
+    return batch
+
+def run_diagnosis_batch(symptom_sets, k=3, threshold=THRESHOLD_CF, chunk_size=8192, batch=None, partial=False):
+    # Versi vektor dari run_diagnosis untuk banyak himpunan gejala sekaligus
+    if batch is None:
+        batch = batch_for(current_kb())
+    out = []
+    it = iter(symptom_sets)
+    while True:
+        chunk = list(islice(it, chunk_size))
+        if not chunk:
+            return out
+        out.extend(score_batch(batch, chunk, k, threshold, partial))
@@ -0,0 +1,80 @@
+"""Cache hasil diagnosa (LRU) untuk kombinasi gejala yang sering muncul."""
+
+import threading
+import time
+from collections import OrderedDict
+
+from . import metrics
+from .engine import current_kb, run_diagnosis
+
+def canonical_symptoms(symptoms):
+    # Urutan dan duplikasi tidak memengaruhi hasil forward chaining
+    return tuple(sorted(set(symptoms)))
+
+class DiagnosisCache:
+    """LRU berbatas, aman dipakai banyak thread (satu per sesi Streamlit).
+
+    Kunci cache adalah (versi KB, gejala), jadi hasil dari KB lama tidak pernah
+    dikembalikan. Entri versi lama tidak dibuang sekaligus saat KB berganti: sesi
+    yang masih memegang KB lama tetap mendapat hit, dan sisanya tersingkir lewat
+    LRU seperti entri lain.
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def diagnose(self, symptoms, kb=None):
+        kb = kb or current_kb()
+        if metrics.registry() is None:
+            return self._diagnose(symptoms, kb)
+        # Diukur di sini agar hit cache juga tercatat di metrik diagnosa
+        t0 = time.perf_counter()
+        results, status = self._diagnose(symptoms, kb)
+        metrics.observe_diagnosis(symptoms, kb, results, time.perf_counter() - t0)
+        return results, status
+
+    def _diagnose(self, symptoms, kb):
+        symptoms = canonical_symptoms(symptoms)
+        key = (kb.version, symptoms)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._unpack(cached)
+            self.misses += 1
+
+        results, status = run_diagnosis(symptoms, kb)
+        packed = (tuple(results) if results else None, status)
+        with self._lock:
+            self._entries[key] = packed
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return self._unpack(packed)
+
+    @staticmethod
+    def _unpack(packed):
+        # Salinan list baru agar pemanggil bebas memodifikasi hasilnya
+        results, status = packed
+        return (list(results) if results else None), status
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
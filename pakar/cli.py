@@ -0,0 +1,171 @@
+"""Antarmuka baris perintah: python -m pakar diagnose < gejala.jsonl > hasil.jsonl
+
+Setiap baris input berupa list kode gejala (["G038", "G037"]) atau objek
+{"id": ..., "symptoms": [...]}. Hasil ditulis satu baris JSON per input, berurutan,
+tanpa menampung seluruh file di memori.
+"""
+
+import argparse
+import json
+import sys
+from itertools import islice
+
+from .engine import current_kb, run_diagnosis, use_kb
+from .kb import CAUSES, RULES, SYMPTOMS, THRESHOLD_CF
+from .loader import KnowledgeBaseError, dump_kb, load_kb
+
+def parse_line(line):
+    record = json.loads(line)
+    if isinstance(record, list):
+        record_id, symptoms = None, record
+    elif isinstance(record, dict):
+        record_id, symptoms = record.get("id"), record["symptoms"]
+    else:
+        raise ValueError("baris harus berupa list gejala atau objek")
+    # Sama dengan service.parse_symptoms: input lain baru gagal di engine, di luar penanganan per baris
+    if not isinstance(symptoms, list) or not all(isinstance(s, str) for s in symptoms):
+        raise ValueError("symptoms harus berupa list kode gejala")
+    return record_id, symptoms
+
+def format_result(record_id, symptoms, results, status, causes):
+    out = {"symptoms": symptoms, "status": status, "results": []}
+    if record_id is not None:
+        out = {"id": record_id, **out}
+    for cause_id, cf in results or []:
+        out["results"].append({"cause": cause_id, "name": causes[cause_id]["name"], "cf": cf})
+    return json.dumps(out, ensure_ascii=False)
+
+def iter_records(lines):
+    for n, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            yield n, *parse_line(line)
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            yield n, None, e
+
+def diagnose(args, stdin, stdout):
+    if args.kb:
+        use_kb(load_kb(args.kb))
+    causes = current_kb().causes
+    records = iter_records(stdin)
+    if args.batch:
+        from .batch import run_diagnosis_batch
+
+    failed = 0
+    while True:
+        # Potongan berukuran tetap: memori konstan berapa pun panjang input
+        chunk = list(islice(records, args.batch or 256))
+        if not chunk:
+            return 1 if failed else 0
+        valid = [(n, rid, syms) for n, rid, syms in chunk if not isinstance(syms, Exception)]
+        if args.batch:
+            diagnosed = run_diagnosis_batch([syms for _, _, syms in valid], args.top_k, args.threshold,
+                                            partial=args.partial)
+        else:
+            diagnosed = [run_diagnosis(syms, None, args.top_k, args.threshold, args.partial) for _, _, syms in valid]
+        results = {n: r for (n, _, _), r in zip(valid, diagnosed)}
+
+        for n, rid, syms in chunk:
+            if isinstance(syms, Exception):
+                failed += 1
+                stdout.write(json.dumps({"line": n, "error": f"input tidak valid: {syms}"}) + "\n")
+                continue
+            top, status = results[n]
+            stdout.write(format_result(rid, syms, top, status, causes) + "\n")
+        stdout.flush()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m pakar", description="Sistem pakar diagnosa kerusakan laptop")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("diagnose", help="diagnosa JSONL dari stdin, hasil JSONL ke stdout")
+    p.add_argument("--batch", type=int, default=0, metavar="N",
+                   help="proses N baris sekaligus lewat mesin batch NumPy")
+    p.add_argument("--top-k", type=int, default=3, metavar="K", help="jumlah penyebab per hasil (default 3)")
+    p.add_argument("--threshold", type=float, default=THRESHOLD_CF, metavar="CF",
+                   help=f"CF minimum penyebab yang dilaporkan (default {THRESHOLD_CF})")
+    p.add_argument("--partial", action="store_true",
+                   help="mode partial-match: rule dengan sebagian premis ikut dihitung, CF diskalakan")
+    p.add_argument("--kb", help="file KB eksternal (.json/.kbb) sebagai pengganti KB bawaan")
+
+    p = sub.add_parser("export-kb", help="tulis KB bawaan ke file .json atau .kbb")
+    p.add_argument("path")
+
+    p = sub.add_parser("check-kb", help="validasi file KB .json atau .kbb")
+    p.add_argument("path")
+
+    p = sub.add_parser("rescore", help="diagnosa ulang riwayat SQLite dengan KB lain (bisa dilanjutkan)")
+    p.add_argument("--db", default="riwayat.db", help="file riwayat (default riwayat.db)")
+    p.add_argument("--kb", help="file KB baru (.json/.kbb); default KB bawaan")
+    p.add_argument("--workers", type=int, default=0, metavar="N", help="jumlah proses (default jumlah CPU)")
+    p.add_argument("--chunk-size", type=int, default=10_000, metavar="N", help="entri per potongan")
+
+    p = sub.add_parser("rescore-report", help="ringkasan penyebab teratas yang berubah setelah rescore")
+    p.add_argument("--db", default="riwayat.db")
+    p.add_argument("--kb", help="file KB yang dipakai saat rescore; default KB bawaan")
+    p.add_argument("--limit", type=int, default=20, help="jumlah perpindahan penyebab yang ditampilkan")
+    p.add_argument("--json", action="store_true", help="keluaran JSON")
+
+    for name, help_text, path_help in (
+            ("export-history", "ekspor riwayat SQLite ke CSV/JSONL/Parquet", "file tujuan"),
+            ("import-history", "impor riwayat dari CSV/JSONL/Parquet ke SQLite", "file sumber")):
+        p = sub.add_parser(name, help=help_text)
+        p.add_argument("path", help=f"{path_help} (.csv, .jsonl, .parquet)")
+        p.add_argument("--db", default="riwayat.db")
+        p.add_argument("--format", choices=("csv", "jsonl", "parquet"), help="default dari ekstensi file")
+        p.add_argument("--chunk-size", type=int, default=10_000, metavar="N", help="entri per potongan")
+
+    p = sub.add_parser("rebuild-rollups", help="hitung ulang statistik dasbor dari seluruh riwayat")
+    p.add_argument("--db", default="riwayat.db")
+
+    args = parser.parse_args(argv)
+    try:
+        if args.command == "diagnose":
+            return diagnose(args, sys.stdin, sys.stdout)
+        if args.command == "export-kb":
+            dump_kb(args.path, SYMPTOMS, CAUSES, RULES)
+        elif args.command == "check-kb":
+            kb = load_kb(args.path)
+            print(f"OK: {len(kb.symptoms)} gejala, {len(kb.causes)} penyebab, {len(kb.rules)} rule, versi {kb.version}")
+        elif args.command == "rescore":
+            from .rescore import rescore
+
+            def progress(done, last_id):
+                print(f"\r{done} entri (id terakhir {last_id})", end="", file=sys.stderr, flush=True)
+
+            version, done = rescore(args.db, args.kb, args.workers or None, args.chunk_size, progress)
+            print(f"\nselesai: {done} entri didiagnosa ulang dengan KB {version}", file=sys.stderr)
+        elif args.command == "rescore-report":
+            from .rescore import diff_report, format_report
+
+            version = load_kb(args.kb).version if args.kb else current_kb().version
+            report = diff_report(args.db, version, args.limit)
+            print(json.dumps(report, ensure_ascii=False) if args.json else format_report(report))
+        elif args.command in ("export-history", "import-history"):
+            # Diimpor di sini: transfer menarik sqlite3 dan riwayat, tidak dibutuhkan perintah lain
+            from .transfer import HistoryFileError, export_history, import_history
+
+            def progress(done):
+                print(f"\r{done} entri", end="", file=sys.stderr, flush=True)
+
+            transfer = export_history if args.command == "export-history" else import_history
+            try:
+                done = transfer(args.db, args.path, args.format, args.chunk_size, progress)
+            except HistoryFileError as e:
+                print(f"error: {e}", file=sys.stderr)
+                return 1
+            print(f"\nselesai: {done} entri", file=sys.stderr)
+        elif args.command == "rebuild-rollups":
+            from .history import HistoryStore
+
+            store = HistoryStore(args.db)
+            try:
+                store.rebuild_rollups()
+                print(f"OK: {store.rollups().total()} entri", file=sys.stderr)
+            finally:
+                store.close()
+    except (OSError, KnowledgeBaseError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    return 0
@@ -0,0 +1,132 @@
+"""Representasi riwayat kolumnar yang ringkas di memori.
+
+Entri riwayat sebagai dict membawa datetime, string nama penyebab, level,
+kategori, list kode gejala, dan ringkasan teks gejala: beberapa ratus byte per
+entri. ``HistoryColumns`` menyimpan blok entri sebagai tuple kolom (``array``
+dari pustaka standar untuk angka, list untuk teks):
+
+- id (int64) dan timestamp epoch (float64)
+- indeks penyebab (uint32) ke tabel penyebab yang di-intern per blok, sehingga
+  nama, level, dan kategori disimpan sekali per penyebab, bukan per entri
+- confidence (float64)
+- kode gejala dan ringkasan teks gejala apa adanya seperti di tabel history
+
+Baris dibaca lewat ``EntryView`` (``__slots__``, hanya referensi blok + nomor
+baris); ``timestamp`` dan list ``symptoms`` baru dibentuk saat diakses untuk
+dirender. ``symptoms_text`` adalah ringkasan yang tersimpan saat diagnosa, jadi
+kartu riwayat tidak berubah ketika KB berubah; ``kb_symptoms_text`` membangunnya
+ulang dari teks gejala KB blok ini bila memang dibutuhkan.
+"""
+
+from array import array
+from datetime import datetime
+
+# Sama dengan ringkasan yang ditulis show_result ke riwayat
+SUMMARY_SYMPTOMS = 3
+SUMMARY_CHARS = 30
+
+class EntryView:
+    """Satu baris HistoryColumns; atributnya sama dengan kunci dict entri riwayat."""
+
+    __slots__ = ("_cols", "_row")
+
+    def __init__(self, cols, row):
+        self._cols = cols
+        self._row = row
+
+    @property
+    def id(self):
+        return self._cols.ids[self._row]
+
+    @property
+    def cause(self):
+        return self._cols.causes[self._cols.cause_index[self._row]][0]
+
+    @property
+    def cause_name(self):
+        return self._cols.causes[self._cols.cause_index[self._row]][1]
+
+    @property
+    def level(self):
+        return self._cols.causes[self._cols.cause_index[self._row]][2]
+
+    @property
+    def category(self):
+        return self._cols.causes[self._cols.cause_index[self._row]][3]
+
+    @property
+    def confidence(self):
+        return self._cols.confidence[self._row]
+
+    @property
+    def timestamp(self):
+        return datetime.fromtimestamp(self._cols.ts[self._row])
+
+    @property
+    def symptoms(self):
+        return self._cols.symptoms(self._row)
+
+    @property
+    def symptoms_text(self):
+        return self._cols.symptom_summaries[self._row]
+
+    @property
+    def kb_symptoms_text(self):
+        # Kode yang tidak ada di KB ditampilkan apa adanya
+        texts = self._cols.kb.symptoms
+        return ", ".join(texts[code]["text"][:SUMMARY_CHARS] if code in texts else code
+                         for code in self.symptoms[:SUMMARY_SYMPTOMS])
+
+    def __repr__(self):
+        return f"EntryView(id={self.id}, cause={self.cause!r}, confidence={self.confidence:.2f})"
+
+class HistoryColumns:
+    """Blok entri riwayat tak berubah dalam bentuk kolom; diindeks seperti list EntryView."""
+
+    def __init__(self, ids, ts, cause_index, confidence, symptom_codes, symptom_summaries, causes, kb):
+        self.ids = ids
+        self.ts = ts
+        self.cause_index = cause_index
+        self.confidence = confidence
+        self.symptom_codes = symptom_codes
+        self.symptom_summaries = symptom_summaries
+        self.causes = causes
+        self.kb = kb
+
+    @classmethod
+    def from_rows(cls, rows, kb):
+        """Bangun dari baris (id, ts, cause, cause_name, confidence, level, symptoms, symptoms_text, category).
+
+        `symptoms` boleh list kode atau string dipisah koma seperti di tabel history.
+        """
+        rows = rows if isinstance(rows, list) else list(rows)
+        if rows:
+            id_col, ts_col, cause_col, name_col, conf_col, level_col, symptom_col, text_col, category_col = zip(*rows)
+        else:
+            id_col = ts_col = cause_col = name_col = conf_col = level_col = symptom_col = text_col = category_col = ()
+        cause_ids = {}
+        cause_rows = array("I", [cause_ids.setdefault(key, len(cause_ids))
+                                 for key in zip(cause_col, name_col, level_col, (c or "" for c in category_col))])
+        # Kode gejala disimpan sebagai string seperti di tabel history: urutan input pengguna tetap terjaga
+        codes = [symptoms if isinstance(symptoms, str) else ",".join(symptoms) for symptoms in symptom_col]
+        return cls(array("q", id_col), array("d", ts_col), cause_rows, array("d", conf_col), codes, list(text_col),
+                   list(cause_ids), kb)
+
+    def symptoms(self, row):
+        codes = self.symptom_codes[row]
+        return codes.split(",") if codes else []
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [EntryView(self, row) for row in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return EntryView(self, index)
+
+    def __iter__(self):
+        return (EntryView(self, row) for row in range(len(self)))
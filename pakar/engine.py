@@ -0,0 +1,243 @@
+"""Mesin inferensi forward chaining dengan Certainty Factor (MYCIN)."""
+
+import hashlib
+import heapq
+import json
+from collections import Counter
+from operator import itemgetter
+
+from .kb import CAUSES, RULES, SYMPTOMS, THRESHOLD_CF
+
+# Toleransi pembulatan antara batas atas (perkalian) dan CF hasil combine_cf berurutan
+BOUND_EPS = 1e-12
+
+def compile_rules(symptoms, rules):
+    columns = getattr(rules, "columns", None)
+    if columns is not None:
+        # Rule dari file biner: dikompilasi langsung dari array indeks, tanpa membentuk dict per rule
+        return compile_columns(symptoms, *columns())
+
+    # Rule dibaca sekali saja
+    premises, rule_cause, rule_cf = [], [], []
+    for rule in rules:
+        premises.append(rule["symptoms"])
+        rule_cause.append(rule["cause"])
+        rule_cf.append(rule["cf"])
+
+    # Bit untuk setiap kode gejala (urutan SYMPTOMS), lalu kode premis yang tidak ada di katalog
+    bits = {}
+    for code in symptoms:
+        bits[code] = 1 << len(bits)
+    for premise in premises:
+        for sym in premise:
+            if sym not in bits:
+                bits[sym] = 1 << len(bits)
+
+    # Premis tiap rule sebagai bitmask + indeks terbalik gejala -> rule
+    masks = []
+    index = {code: [] for code in bits}
+    always = []
+    for i, premise in enumerate(premises):
+        mask = 0
+        for sym in premise:
+            mask |= bits[sym]
+        masks.append(mask)
+        for sym in set(premise):
+            index[sym].append(i)
+        if not mask:
+            always.append(i)
+    return bits, masks, index, always, rule_cause, rule_cf
+
+def compile_columns(symptoms, premise_ptr, premise, rule_cause, rule_cf):
+    """compile_rules untuk rule berbentuk kolom: premis = indeks gejala (urutan SYMPTOMS) per rentang premise_ptr."""
+    bits = {code: 1 << i for i, code in enumerate(symptoms)}
+    codes = list(bits)
+    rules_of = [[] for _ in codes]
+    masks = []
+    always = []
+    premise, premise_ptr = list(premise), list(premise_ptr)
+    for i in range(len(rule_cause)):
+        mask = 0
+        for j in premise[premise_ptr[i]:premise_ptr[i + 1]]:
+            bit = 1 << j
+            if not mask & bit:
+                mask |= bit
+                rules_of[j].append(i)
+        masks.append(mask)
+        if not mask:
+            always.append(i)
+    return bits, masks, dict(zip(codes, rules_of)), always, list(rule_cause), list(rule_cf)
+
+def rule_ceilings(causes, rule_cause, rule_cf):
+    # CF maksimum penyebab tiap rule bila semua rulenya menyala: 1 - (1 - prior) * prod(1 - cf)
+    miss = {}
+    for cause_id, cf in zip(rule_cause, rule_cf):
+        miss[cause_id] = miss.get(cause_id, 1 - causes[cause_id]["prior_cf"]) * (1 - cf)
+    return [1 - miss[cause_id] + BOUND_EPS for cause_id in rule_cause]
+
+def premise_lengths(kb):
+    # Jumlah gejala unik di premis tiap rule (sama dengan panjang daftar di indeks terbalik)
+    return [mask.bit_count() for mask in kb.rule_masks]
+
+def rule_premises(kb):
+    # Premis unik per rule, dibaca ulang dari bitmask agar rule dari file biner tidak perlu didekode
+    codes = list(kb.symptom_bits)
+    premises = []
+    for mask in kb.rule_masks:
+        premise = []
+        while mask:
+            low = mask & -mask
+            premise.append(codes[low.bit_length() - 1])
+            mask ^= low
+        premises.append(tuple(premise))
+    return premises
+
+def kb_version(symptoms, causes, rules):
+    # Hash isi basis pengetahuan; berubah setiap kali gejala, penyebab, atau rule diubah.
+    # sort_keys membuang urutan dict, jadi urutan kode gejala (posisi bit, mis. di tautan
+    # pakar.share) ikut di-hash secara eksplisit
+    payload = json.dumps([symptoms, causes, rules, list(symptoms)], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:12]
+
+class KnowledgeBase:
+    """Basis pengetahuan beserta indeks rule yang sudah dikompilasi."""
+
+    def __init__(self, symptoms, causes, rules, version=None):
+        self.symptoms = symptoms
+        self.causes = causes
+        self.rules = rules
+        (self.symptom_bits, self.rule_masks, self.symptom_rules, self.always_rules,
+         self.rule_cause, self.rule_cf) = compile_rules(symptoms, rules)
+        self.rule_ceiling = rule_ceilings(causes, self.rule_cause, self.rule_cf)
+        # Versi bisa dibawa dari file KB agar tidak perlu menghash ulang seluruh isi
+        self.version = version or kb_version(symptoms, causes, rules)
+        self._derived = {}
+
+    def derived(self, name, build):
+        # Struktur turunan (mis. katalog UI) dibangun sekali dan ikut berganti bersama KB
+        value = self._derived.get(name)
+        if value is None:
+            value = self._derived[name] = build(self)
+        return value
+
+_current = KnowledgeBase(SYMPTOMS, CAUSES, RULES)
+
+def current_kb():
+    return _current
+
+def use_kb(kb):
+    # Pergantian referensi bersifat atomik; diagnosa yang sedang berjalan tetap memakai KB lamanya
+    global _current
+    _current = kb
+
+def combine_cf(cf1, cf2):
+    return cf1 + cf2 * (1 - cf1)
+
+def match_candidates(user_symptoms, kb):
+    # Hanya rule yang menyentuh gejala terpilih yang perlu dievaluasi
+    bits, symptom_rules = kb.symptom_bits, kb.symptom_rules
+    user_mask = 0
+    candidates = set(kb.always_rules)
+    for sym in user_symptoms:
+        bit = bits.get(sym)
+        if bit is not None and not user_mask & bit:
+            user_mask |= bit
+            candidates.update(symptom_rules[sym])
+    return user_mask, sorted(candidates)
+
+def forward_chaining(user_symptoms, kb=None):
+    kb = kb or _current
+    masks = kb.rule_masks
+    user_mask, candidates = match_candidates(user_symptoms, kb)
+
+    results = {}
+    for i in candidates:
+        mask = masks[i]
+        if user_mask & mask == mask:
+            cause_id = kb.rule_cause[i]
+            rule_cf = kb.rule_cf[i]
+            prior_cf = kb.causes[cause_id]["prior_cf"]
+            if cause_id not in results:
+                results[cause_id] = combine_cf(prior_cf, rule_cf)
+            else:
+                results[cause_id] = combine_cf(results[cause_id], rule_cf)
+    return results
+
+def partial_chaining(user_symptoms, kb=None):
+    """Seperti forward_chaining, tetapi rule dengan sebagian premis terpenuhi ikut
+    menyala dengan CF dikali pecahan premis yang ada (2 dari 3 gejala -> 2/3 cf)."""
+    kb = kb or _current
+    symptom_rules = kb.symptom_rules
+    lengths = kb.derived("premise_lengths", premise_lengths)
+
+    # Jumlah premis terpenuhi per rule = jumlah baris matriks gejala x rule (indeks
+    # terbalik) milik gejala terpilih; Counter menghitungnya tanpa loop Python per rule
+    hits = Counter()
+    for sym in set(user_symptoms):
+        rules = symptom_rules.get(sym)
+        if rules:
+            hits.update(rules)
+    for i in kb.always_rules:
+        hits[i] = 0
+
+    results = {}
+    for i in sorted(hits):
+        cause_id = kb.rule_cause[i]
+        # Rule tanpa premis selalu menyala penuh
+        rule_cf = kb.rule_cf[i] * (hits[i] / lengths[i] if lengths[i] else 1.0)
+        cf = results.get(cause_id)
+        results[cause_id] = combine_cf(kb.causes[cause_id]["prior_cf"] if cf is None else cf, rule_cf)
+    return results
+
+def rank_causes(user_symptoms, kb=None, k=3, threshold=THRESHOLD_CF, partial=False):
+    """k penyebab dengan CF tertinggi yang >= threshold, sebagai list (cause, cf).
+
+    Hasilnya sama dengan mengurutkan seluruh keluaran forward_chaining (CF menurun,
+    seri dipecah oleh rule pertama yang menyala). Premis rule tidak dicek bila CF
+    maksimum penyebabnya (semua rule menyala) sudah di bawah threshold atau di
+    bawah batas bawah CF ke-k yang sudah pasti didapat.
+
+    Dengan partial=True skor diambil dari partial_chaining.
+    """
+    if k <= 0:
+        return []
+    kb = kb or _current
+    if partial:
+        ranked = [(cause_id, cf) for cause_id, cf in partial_chaining(user_symptoms, kb).items() if cf >= threshold]
+        ranked.sort(key=itemgetter(1), reverse=True)
+        return ranked[:k]
+    masks, rule_cause, rule_cf, ceiling = kb.rule_masks, kb.rule_cause, kb.rule_cf, kb.rule_ceiling
+    user_mask, candidates = match_candidates(user_symptoms, kb)
+
+    # CF penyebab hanya bisa naik, jadi CF saat rule pertamanya menyala adalah batas
+    # bawah; nilai ke-k terbesar dari batas bawah itu (heap berukuran k) menaikkan ambang
+    floor, lower = threshold, []
+    results = {}
+    for i in candidates:
+        if ceiling[i] < floor:
+            continue
+        mask = masks[i]
+        if user_mask & mask == mask:
+            cause_id = rule_cause[i]
+            cf = results.get(cause_id)
+            if cf is not None:
+                results[cause_id] = combine_cf(cf, rule_cf[i])
+                continue
+            cf = results[cause_id] = combine_cf(kb.causes[cause_id]["prior_cf"], rule_cf[i])
+            if len(lower) < k:
+                heapq.heappush(lower, cf)
+            elif cf > lower[0]:
+                heapq.heapreplace(lower, cf)
+            if len(lower) == k and lower[0] > floor:
+                floor = lower[0]
+
+    # Hanya CF >= ambang akhir yang bisa masuk top-k; sort stabil menjaga urutan seri
+    ranked = [(cause_id, cf) for cause_id, cf in results.items() if cf >= floor]
+    ranked.sort(key=itemgetter(1), reverse=True)
+    return ranked[:k]
+
+def run_diagnosis(user_symptoms, kb=None, k=3, threshold=THRESHOLD_CF, partial=False):
+    results = rank_causes(user_symptoms, kb, k, threshold, partial)
+    if not results:
+        return None, "low_confidence"
+    return results, "success"
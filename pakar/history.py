@@ -0,0 +1,439 @@
+"""Riwayat diagnosa persisten di SQLite (mode WAL).
+
+Entri dari tombol Analisa ditampung dulu lalu ditulis per batch dalam satu
+transaksi. Di aplikasi, HistoryWriter memindahkan penulisan itu ke satu thread
+latar per proses: semua sesi hanya memasukkan entri ke antrean, dan thread
+penulis melakukan group commit per batch yang dibatasi ukuran dan waktu.
+Pembacaan memakai keyset pagination (WHERE id < cursor) sehingga
+biaya per halaman tidak bergantung pada jumlah total baris. Filter level dan
+kategori memakai indeks gabungan (kolom, id) sehingga halaman yang difilter
+juga dibaca langsung dari indeks, bukan dengan memindai seluruh tabel.
+
+Tabel ``rescored`` menyimpan hasil diagnosa ulang entri riwayat terhadap versi KB
+lain (lihat pakar.rescore), berdampingan dengan hasil asli di ``history``.
+Statistik dasbor dibaca dari tabel ``rollup`` (lihat pakar.rollups) yang
+diperbarui bersama setiap INSERT, bukan dengan memindai riwayat.
+"""
+
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+from .columnar import HistoryColumns
+from .engine import current_kb
+from .rollups import Rollups
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    cause TEXT NOT NULL,
+    cause_name TEXT NOT NULL,
+    confidence REAL NOT NULL,
+    level TEXT NOT NULL,
+    symptoms TEXT NOT NULL,
+    symptoms_text TEXT NOT NULL,
+    category TEXT NOT NULL DEFAULT '',
+    kb_version TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS history_ts ON history (ts);
+CREATE INDEX IF NOT EXISTS history_cause ON history (cause);
+"""
+
+# Kolom yang ditambahkan setelah tabel history pertama kali dibuat (database lama)
+ADDED_COLUMNS = [
+    ("category", "TEXT NOT NULL DEFAULT ''"),
+    ("kb_version", "TEXT NOT NULL DEFAULT ''"),
+]
+
+# Migrasi berurutan; indeks ke-n membawa skema dari PRAGMA user_version n ke n+1
+MIGRATIONS = [
+    # 1: kolom kategori + indeks gabungan untuk filter riwayat
+    """
+    DROP INDEX IF EXISTS history_level;
+    CREATE INDEX IF NOT EXISTS history_level_id ON history (level, id);
+    CREATE INDEX IF NOT EXISTS history_category_id ON history (category, id);
+    """,
+    # 2: hasil diagnosa ulang per versi KB; cause kosong berarti di bawah threshold
+    """
+    CREATE TABLE IF NOT EXISTS rescored (
+        kb_version TEXT NOT NULL,
+        history_id INTEGER NOT NULL,
+        cause TEXT NOT NULL,
+        cause_name TEXT NOT NULL,
+        confidence REAL NOT NULL,
+        level TEXT NOT NULL,
+        PRIMARY KEY (kb_version, history_id)
+    ) WITHOUT ROWID;
+    """,
+    # 3: rollup statistik dasbor; diisi ulang dari riwayat saat migrasi
+    """
+    CREATE TABLE IF NOT EXISTS rollup (
+        kind TEXT NOT NULL,
+        key TEXT NOT NULL,
+        n INTEGER NOT NULL,
+        conf_sum REAL NOT NULL,
+        PRIMARY KEY (kind, key)
+    ) WITHOUT ROWID;
+    """,
+]
+
+# Versi skema yang membuat tabel rollup; database yang lebih lama dibangun ulang rollup-nya
+ROLLUP_VERSION = 3
+
+UPSERT_ROLLUP = (
+    "INSERT INTO rollup (kind, key, n, conf_sum) VALUES (?, ?, ?, ?)"
+    " ON CONFLICT (kind, key) DO UPDATE SET n = n + excluded.n, conf_sum = conf_sum + excluded.conf_sum"
+)
+
+COLUMNS = "id, ts, cause, cause_name, confidence, level, symptoms, symptoms_text, category"
+
+def migrate(conn):
+    """Bawa skema ke versi terbaru; mengembalikan versi sebelum migrasi."""
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(history)")}
+    for name, definition in ADDED_COLUMNS:
+        if name not in columns:
+            conn.execute(f"ALTER TABLE history ADD COLUMN {name} {definition}")
+    for n in range(version, len(MIGRATIONS)):
+        with conn:
+            conn.execute("BEGIN")
+            for statement in MIGRATIONS[n].split(";"):
+                if statement.strip():
+                    conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {n + 1}")
+    return version
+
+def batch_rollups(batch):
+    # Baris tabel history (ts, cause, cause_name, confidence, level, ..., category, ...) -> rollup
+    return Rollups.from_rows((row[0], row[1], row[3], row[4], row[7]) for row in batch)
+
+class HistoryStore:
+    def __init__(self, path, batch_size=32):
+        self.path = path
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._pending = []
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        version = migrate(self._conn)
+        self._count = self._conn.execute("SELECT COUNT(*) FROM history").fetchone()[0]
+        if version < ROLLUP_VERSION:
+            self.rebuild_rollups()
+        else:
+            self._rollups = Rollups.from_table(self._conn.execute("SELECT kind, key, n, conf_sum FROM rollup"))
+
+    def add(self, cause, cause_name, confidence, level, symptoms, symptoms_text, timestamp=None, category="",
+            kb_version=""):
+        ts = (timestamp or datetime.now()).timestamp()
+        with self._lock:
+            self._pending.append((ts, cause, cause_name, confidence, level, ",".join(symptoms), symptoms_text,
+                                  category or "", kb_version or ""))
+            if len(self._pending) >= self.batch_size:
+                self._flush_locked()
+
+    def add_many(self, rows):
+        """Sisipkan banyak entri dalam satu transaksi (impor).
+
+        rows: (ts, cause, cause_name, confidence, level, symptoms, symptoms_text, category, kb_version),
+        `ts` dalam detik epoch dan `symptoms` list kode gejala.
+        """
+        batch = [
+            (ts, cause, cause_name, confidence, level, ",".join(symptoms), symptoms_text, category or "",
+             kb_version or "")
+            for ts, cause, cause_name, confidence, level, symptoms, symptoms_text, category, kb_version in rows
+        ]
+        with self._lock:
+            # Entri tertunda dari add() punya transaksinya sendiri: bila gagal, batch ini tetap ditulis
+            try:
+                self._flush_locked()
+            except sqlite3.Error:
+                logger.exception("entri riwayat tertunda gagal ditulis")
+            self._insert_locked(batch)
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        """Tulis entri tertunda dalam satu transaksi.
+
+        Antrean tertunda dikosongkan sebelum menulis: bila transaksi gagal, entrinya
+        dibuang (pengecualian diteruskan), tidak diulang bersama batch berikutnya.
+        """
+        batch, self._pending = self._pending, []
+        self._insert_locked(batch)
+
+    def _insert_locked(self, batch):
+        if not batch:
+            return
+        # Rollup batch ini digabung dulu, lalu satu UPSERT per (jenis, kunci) dalam transaksi yang sama
+        delta = batch_rollups(batch)
+        with self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "INSERT INTO history (ts, cause, cause_name, confidence, level, symptoms, symptoms_text, category,"
+                " kb_version) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                batch,
+            )
+            self._conn.executemany(UPSERT_ROLLUP, delta.rows())
+        # Rollup di memori hanya mengikuti transaksi yang berhasil di-commit
+        self._count += len(batch)
+        self._rollups.merge(delta)
+
+    def count(self):
+        with self._lock:
+            return self._count + len(self._pending)
+
+    def rollups(self):
+        """Salinan rollup terkini (termasuk entri yang belum di-flush)."""
+        with self._lock:
+            copy = batch_rollups(self._pending)
+            copy.merge(self._rollups)
+        return copy
+
+    def rebuild_rollups(self):
+        """Hitung ulang tabel rollup dari riwayat dalam satu kali baca berurutan."""
+        with self._lock:
+            self._flush_locked()
+            rows = self._conn.execute("SELECT ts, cause, confidence, level, category FROM history")
+            rollups = Rollups.from_rows(rows)
+            with self._conn:
+                self._conn.execute("BEGIN")
+                self._conn.execute("DELETE FROM rollup")
+                self._conn.executemany(UPSERT_ROLLUP, rollups.rows())
+            self._rollups = rollups
+
+    def fill_categories(self, categories):
+        """Isi kategori entri lama (sebelum migrasi) dari peta id penyebab -> kategori."""
+        self.flush()
+        with self._lock, self._conn:
+            # Cek lewat indeks (category, id); setelah sekali terisi, pemanggilan berikutnya murah
+            if self._conn.execute("SELECT 1 FROM history WHERE category = '' LIMIT 1").fetchone() is None:
+                return
+            before = self._conn.total_changes
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "UPDATE history INDEXED BY history_category_id SET category = ? WHERE category = '' AND cause = ?",
+                [(category, cause) for cause, category in categories.items() if category],
+            )
+            changed = self._conn.total_changes != before
+        if changed:
+            # Rollup per kategori dihitung dari kolom yang baru saja diisi
+            self.rebuild_rollups()
+
+    def page(self, before=None, limit=20, level=None, category=None, kb=None):
+        """Entri terbaru lebih dulu; `before` adalah id terakhir dari halaman sebelumnya.
+
+        `level`/`category` menyaring halaman lewat indeks (level, id) / (category, id).
+        Hasilnya HistoryColumns (diindeks seperti list EntryView); `kb` hanya untuk kb_symptoms_text.
+        """
+        where, params = [], []
+        if level is not None:
+            where.append("level = ?")
+            params.append(level)
+        if category is not None:
+            where.append("category = ?")
+            params.append(category)
+        if before is not None:
+            where.append("id < ?")
+            params.append(before)
+        clause = f" WHERE {' AND '.join(where)}" if where else ""
+        # Koneksi dipakai bersama thread penulis: baca di bawah lock yang sama dengan BEGIN…COMMIT
+        with self._lock:
+            self._flush_locked()
+            rows = self._conn.execute(
+                f"SELECT {COLUMNS} FROM history{clause} ORDER BY id DESC LIMIT ?", (*params, limit)).fetchall()
+        return HistoryColumns.from_rows(rows, kb or current_kb())
+
+    def symptom_chunk(self, after=0, limit=10_000):
+        """(id, kode gejala) urut id untuk entri dengan id > `after`; untuk diagnosa ulang."""
+        with self._lock:
+            self._flush_locked()
+            rows = self._conn.execute(
+                "SELECT id, symptoms FROM history WHERE id > ? ORDER BY id LIMIT ?", (after, limit)).fetchall()
+        return [(id_, symptoms.split(",") if symptoms else []) for id_, symptoms in rows]
+
+    def export_chunk(self, after=0, limit=10_000):
+        """Entri lengkap urut id dengan id > `after`, untuk ekspor berpotongan.
+
+        Baris: (id, ts, cause, cause_name, confidence, level, symptoms, symptoms_text, category, kb_version).
+        """
+        with self._lock:
+            self._flush_locked()
+            rows = self._conn.execute(
+                "SELECT id, ts, cause, cause_name, confidence, level, symptoms, symptoms_text, category, kb_version"
+                " FROM history WHERE id > ? ORDER BY id LIMIT ?", (after, limit)).fetchall()
+        return [(*row[:6], row[6].split(",") if row[6] else [], *row[7:]) for row in rows]
+
+    def last_rescored(self, kb_version):
+        """Id terbesar yang sudah didiagnosa ulang untuk versi KB ini (titik lanjut job)."""
+        with self._lock:
+            row = self._conn.execute("SELECT MAX(history_id) FROM rescored WHERE kb_version = ?", (kb_version,))
+            return row.fetchone()[0] or 0
+
+    def save_rescored(self, kb_version, rows):
+        """rows: (history_id, cause, cause_name, confidence, level); satu transaksi per potongan."""
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN")
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO rescored (kb_version, history_id, cause, cause_name, confidence, level)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                [(kb_version, *row) for row in rows],
+            )
+
+    def rescore_diff(self, kb_version, limit=20):
+        """Ringkasan perubahan penyebab teratas riwayat asli vs diagnosa ulang `kb_version`."""
+        conn = self._conn
+        join = "FROM history h JOIN rescored r ON r.kb_version = ? AND r.history_id = h.id"
+        with self._lock:
+            total, changed, mean_delta = conn.execute(
+                f"SELECT COUNT(*), COALESCE(SUM(h.cause != r.cause), 0),"
+                f" AVG(CASE WHEN h.cause = r.cause THEN r.confidence - h.confidence END) {join}",
+                (kb_version,)).fetchone()
+            transitions = conn.execute(
+                f"SELECT h.cause, h.cause_name, r.cause, r.cause_name, COUNT(*), AVG(r.confidence - h.confidence)"
+                f" {join} WHERE h.cause != r.cause GROUP BY h.cause, r.cause ORDER BY COUNT(*) DESC LIMIT ?",
+                (kb_version, limit)).fetchall()
+        return {
+            "kb_version": kb_version,
+            "rescored": total,
+            "changed": changed,
+            # Rata-rata perubahan CF pada entri yang penyebab teratasnya tetap
+            "unchanged_cf_delta": mean_delta or 0.0,
+            "transitions": [
+                {"from": old, "from_name": old_name, "to": new, "to_name": new_name or None, "count": n,
+                 "cf_delta": delta}
+                for old, old_name, new, new_name, n, delta in transitions
+            ],
+        }
+
+    def close(self):
+        self.flush()
+        self._conn.close()
+
+class HistoryWriter:
+    """Satu thread penulis riwayat untuk semua sesi (group commit).
+
+    `add` hanya memasukkan entri ke antrean lalu kembali; thread penulis
+    mengambil entri hingga `max_batch` atau hingga `max_delay` detik sejak entri
+    pertama batch, lalu menulisnya lewat HistoryStore.add_many dalam satu
+    transaksi. Bila antrean penuh (`max_queue`), `add` menunggu paling lama
+    `put_timeout` detik: penulis yang tertinggal memperlambat sesi, bukan
+    menumpuk memori tanpa batas. Bila penulis macet, entri dibuang dan dihitung
+    sebagai error alih-alih memblokir sesi selamanya.
+    """
+
+    _STOP = object()
+
+    def __init__(self, store, max_batch=256, max_delay=0.05, max_queue=4096, put_timeout=5.0):
+        self.store = store
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.put_timeout = put_timeout
+        self._queue = queue.Queue(max_queue)
+        self._done = threading.Condition()
+        self._enqueued = 0
+        self._written = 0
+        self._batches = 0
+        self._waits = 0
+        self._errors = 0
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="history-writer", daemon=True)
+        self._thread.start()
+        return self
+
+    def add(self, cause, cause_name, confidence, level, symptoms, symptoms_text, timestamp=None, category="",
+            kb_version=""):
+        """Antrekan satu entri (argumen sama dengan HistoryStore.add); mengembalikan nomor urutnya."""
+        ts = (timestamp or datetime.now()).timestamp()
+        row = (ts, cause, cause_name, confidence, level, list(symptoms), symptoms_text, category, kb_version)
+        with self._done:
+            # Nomor dipesan sebelum put agar `written` tidak pernah mendahului `enqueued`
+            self._enqueued += 1
+            seq = self._enqueued
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            with self._done:
+                self._waits += 1
+            try:
+                self._queue.put(row, timeout=self.put_timeout)
+            except queue.Full:
+                logger.error("antrean riwayat penuh selama %.1f detik; entri dibuang", self.put_timeout)
+                # Nomor urutnya tetap dianggap selesai agar sync() tidak menunggu entri yang tidak akan ditulis
+                self._finish(1, errors=1)
+        return seq
+
+    def sync(self, timeout=None, seq=None):
+        """Tunggu sampai entri nomor `seq` (default: semua yang sudah diantrekan) tertulis.
+
+        Nomor urut adalah nilai kembali `add`; sesi cukup menunggu entrinya sendiri.
+        """
+        with self._done:
+            target = self._enqueued if seq is None else seq
+            return self._done.wait_for(lambda: self._written >= target, timeout)
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is self._STOP:
+                break
+            batch = [item]
+            deadline = time.monotonic() + self.max_delay
+            while len(batch) < self.max_batch:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is self._STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._write(batch)
+
+    def _write(self, batch):
+        errors = 0
+        try:
+            self.store.add_many(batch)
+        except Exception:
+            # Error apa pun (SQLite, baris rusak, bug rollup) hanya menggagalkan batch ini; bila thread
+            # penulis mati, `written` berhenti naik dan setiap sync() menunggu sampai timeout
+            logger.exception("%d entri riwayat gagal ditulis", len(batch))
+            errors = len(batch)
+        self._finish(len(batch), errors, batches=1)
+
+    def _finish(self, count, errors=0, batches=0):
+        with self._done:
+            self._written += count
+            self._errors += errors
+            self._batches += batches
+            self._done.notify_all()
+
+    def stats(self):
+        with self._done:
+            return {
+                "queued": self._enqueued - self._written,
+                "written": self._written,
+                "batches": self._batches,
+                "waits": self._waits,
+                "errors": self._errors,
+            }
+
+    def close(self):
+        """Tulis semua entri yang masih antre lalu hentikan thread penulis."""
+        if self._thread is not None:
+            self._queue.put(self._STOP)
+            self._thread.join()
+            self._thread = None
+        self.store.flush()
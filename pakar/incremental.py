@@ -0,0 +1,103 @@
+"""Diagnosa inkremental untuk pratinjau langsung saat gejala dicentang satu per satu."""
+
+from .engine import combine_cf, current_kb, premise_lengths
+from .kb import THRESHOLD_CF
+
+class IncrementalDiagnosis:
+    """Status forward chaining yang diperbarui per gejala, bukan dihitung ulang.
+
+    Untuk tiap rule yang tersentuh disimpan jumlah premis yang sudah terpenuhi;
+    rule menyala tepat saat jumlah itu sama dengan panjang premisnya. Menambah
+    atau menghapus satu gejala hanya menyentuh rule di indeks terbalik gejala
+    tersebut, lalu CF penyebab yang rule-nya berubah dihitung ulang dari rule
+    yang menyala (urut RULES, sama persis dengan forward_chaining).
+    """
+
+    def __init__(self, kb=None):
+        self.kb = kb or current_kb()
+        self.selected = set()
+        self._lengths = self.kb.derived("premise_lengths", premise_lengths)
+        self._hits = {}
+        self._fired = {}
+        self._cf = {}
+        for i in self.kb.always_rules:
+            self._fire(i)
+        for cause_id in list(self._fired):
+            self._recompute(cause_id)
+
+    def _fire(self, i):
+        self._fired.setdefault(self.kb.rule_cause[i], set()).add(i)
+
+    def _unfire(self, i):
+        cause_id = self.kb.rule_cause[i]
+        rules = self._fired[cause_id]
+        rules.discard(i)
+        if not rules:
+            del self._fired[cause_id]
+
+    def _recompute(self, cause_id):
+        rules = self._fired.get(cause_id)
+        if not rules:
+            self._cf.pop(cause_id, None)
+            return
+        cf = self.kb.causes[cause_id]["prior_cf"]
+        for i in sorted(rules):
+            cf = combine_cf(cf, self.kb.rule_cf[i])
+        self._cf[cause_id] = cf
+
+    def add(self, code):
+        """Tandai gejala terpilih; mengembalikan penyebab yang CF-nya berubah."""
+        rules = self.kb.symptom_rules.get(code)
+        if code in self.selected or rules is None:
+            self.selected.add(code)
+            return set()
+        self.selected.add(code)
+        changed = set()
+        for i in rules:
+            hits = self._hits[i] = self._hits.get(i, 0) + 1
+            if hits == self._lengths[i]:
+                self._fire(i)
+                changed.add(self.kb.rule_cause[i])
+        for cause_id in changed:
+            self._recompute(cause_id)
+        return changed
+
+    def remove(self, code):
+        """Kebalikan add(); mengembalikan penyebab yang CF-nya berubah."""
+        if code not in self.selected:
+            return set()
+        self.selected.discard(code)
+        changed = set()
+        for i in self.kb.symptom_rules.get(code, ()):
+            hits = self._hits[i]
+            if hits == self._lengths[i]:
+                self._unfire(i)
+                changed.add(self.kb.rule_cause[i])
+            if hits == 1:
+                del self._hits[i]
+            else:
+                self._hits[i] = hits - 1
+        for cause_id in changed:
+            self._recompute(cause_id)
+        return changed
+
+    def sync(self, codes):
+        """Samakan dengan daftar gejala terpilih; hanya selisihnya yang diproses."""
+        codes = set(codes)
+        changed = set()
+        for code in self.selected - codes:
+            changed |= self.remove(code)
+        for code in codes - self.selected:
+            changed |= self.add(code)
+        return changed
+
+    def results(self):
+        """CF per penyebab yang menyala, setara forward_chaining(self.selected)."""
+        return dict(self._cf)
+
+    def top(self, k=3, threshold=THRESHOLD_CF):
+        # Seri dipecah oleh rule pertama yang menyala, seperti rank_causes
+        ranked = [(cf, min(self._fired[cause_id]), cause_id)
+                  for cause_id, cf in self._cf.items() if cf >= threshold]
+        ranked.sort(key=lambda x: (-x[0], x[1]))
+        return [(cause_id, cf) for cf, _, cause_id in ranked[:k]]
@@ -0,0 +1,356 @@
+"""Basis pengetahuan: gejala, penyebab kerusakan, dan rule Certainty Factor."""
+
+THRESHOLD_CF = 0.4
+
+SYMPTOMS = {
+    "G001": {"text": "Layar gelap/hitam total, namun indikator power menyala", "category": "Layar"},
+    "G002": {"text": "Layar sering berkedip (flickering) saat engsel digerakkan", "category": "Layar"},
+    "G003": {"text": "Terdapat retakan fisik atau cairan bocor di dalam layar", "category": "Layar"},
+    "G004": {"text": "Muncul titik/pixel warna-warni yang statis (Dead/Stuck Pixel)", "category": "Layar"},
+    "G005": {"text": "Layar sentuh merespon acak tanpa disentuh (Ghost Touch)", "category": "Layar"},
+    "G006": {"text": "Gambar di layar sangat redup, hanya terlihat jika disenter", "category": "Layar"},
+    "G007": {"text": "Tampilan layar pecah-pecah (artefak) atau ada kotak-kotak aneh", "category": "Layar"},
+    "G008": {"text": "Warna layar dominan satu warna (misal: kemerahan/kebiruan)", "category": "Layar"},
+    "G009": {"text": "Layar menjadi putih polos (White Screen of Death)", "category": "Layar"},
+    "G010": {"text": "Ada garis vertikal/horizontal tipis yang permanen", "category": "Layar"},
+    "G011": {"text": "Baterai drop drastis (misal 100% ke 20% dalam hitungan menit)", "category": "Power"},
+    "G012": {"text": "Laptop mendeteksi charger tapi persentase tidak naik (Plugged in, not charging)", "category": "Power"},
+    "G013": {"text": "Konektor charger harus ditekuk/digoyang agar daya masuk", "category": "Power"},
+    "G014": {"text": "Casing area baterai/keyboard melengkung atau terangkat", "category": "Power"},
+    "G015": {"text": "Laptop mati total seketika saat kabel charger dicabut", "category": "Power"},
+    "G016": {"text": "Adaptor charger sangat panas hingga sulit disentuh", "category": "Power"},
+    "G017": {"text": "Muncul percikan api kecil saat mencolok charger ke laptop", "category": "Power"},
+    "G018": {"text": "Indikator lampu baterai berkedip merah/oranye terus menerus", "category": "Power"},
+    "G019": {"text": "Laptop sering mati sendiri secara acak meski baterai penuh", "category": "Power"},
+    "G020": {"text": "Beberapa tombol keyboard mati/tidak merespon sama sekali", "category": "Input"},
+    "G021": {"text": "Muncul karakter berulang terus menerus seolah tombol tertindih", "category": "Input"},
+    "G022": {"text": "Tombol keyboard terasa lengket atau tidak membal saat ditekan", "category": "Input"},
+    "G023": {"text": "Touchpad sama sekali tidak merespon sentuhan", "category": "Input"},
+    "G024": {"text": "Kursor mouse bergerak liar sendiri (drifting)", "category": "Input"},
+    "G025": {"text": "Klik kiri/kanan pada touchpad tidak berfungsi", "category": "Input"},
+    "G026": {"text": "Fingerprint reader panas atau tidak mendeteksi jari", "category": "Input"},
+    "G027": {"text": "Tombol power sulit ditekan atau masuk ke dalam", "category": "Input"},
+    "G028": {"text": "Suara speaker pecah/sember saat volume diatas 50%", "category": "Audio"},
+    "G029": {"text": "Tidak ada suara sama sekali (tanda silang merah di ikon speaker)", "category": "Audio"},
+    "G030": {"text": "Suara hanya keluar sebelah (kiri/kanan saja)", "category": "Audio"},
+    "G031": {"text": "Headset tidak terdeteksi saat dicolok ke jack audio", "category": "Audio"},
+    "G032": {"text": "Ada suara dengung (static noise) konstan dari speaker/headset", "category": "Audio"},
+    "G033": {"text": "Webcam menampilkan layar hitam blank", "category": "Audio"},
+    "G034": {"text": "Lampu indikator webcam menyala tapi tidak ada gambar", "category": "Audio"},
+    "G035": {"text": "Mikrofon lawan bicara mendengar suara kita sangat kecil/kresek", "category": "Audio"},
+    "G036": {"text": "Proses copy-paste file sangat lambat (speed drop ke 0 KB/s)", "category": "Storage"},
+    "G037": {"text": "Terdengar bunyi 'tek-tek' atau gesekan logam dari dalam laptop", "category": "Storage"},
+    "G038": {"text": "Muncul pesan 'Boot Device Not Found' atau 'No Media'", "category": "Storage"},
+    "G039": {"text": "Drive partisi hilang (misal Drive D: tidak ada)", "category": "Storage"},
+    "G040": {"text": "File sering corrupt atau tidak bisa dibuka tiba-tiba", "category": "Storage"},
+    "G041": {"text": "Kapasitas SSD/HDD penuh padahal data sedikit", "category": "Storage"},
+    "G042": {"text": "Proses booting Windows sangat lama (> 5 menit)", "category": "Storage"},
+    "G043": {"text": "Sering muncul pesan 'Disk Usage 100%' di Task Manager", "category": "Storage"},
+    "G044": {"text": "Wi-Fi tidak bisa diaktifkan (tombol on/off abu-abu)", "category": "Network"},
+    "G045": {"text": "Daftar Wi-Fi kosong (tidak mendeteksi hotspot apapun)", "category": "Network"},
+    "G046": {"text": "Sinyal Wi-Fi sangat lemah (1 bar) padahal dekat router", "category": "Network"},
+    "G047": {"text": "Wi-Fi sering putus nyambung (disconnect) setiap beberapa menit", "category": "Network"},
+    "G048": {"text": "Bluetooth device paired tapi tidak mau connect", "category": "Network"},
+    "G049": {"text": "Port LAN tidak menyala lampunya saat kabel dipasang", "category": "Network"},
+    "G050": {"text": "Internet 'No Internet Access' (Tanda seru kuning)", "category": "Network"},
+    "G051": {"text": "Laptop mati mendadak saat menjalankan aplikasi berat (Game/Render)", "category": "Thermal"},
+    "G052": {"text": "Bagian bawah laptop sangat panas hingga tidak nyaman dipangku", "category": "Thermal"},
+    "G053": {"text": "Kipas laptop berbunyi kasar/berisik seperti benda tersangkut", "category": "Thermal"},
+    "G054": {"text": "Kipas laptop tidak berputar sama sekali (hening total saat panas)", "category": "Thermal"},
+    "G055": {"text": "Angin yang keluar dari ventilasi terasa lemah/tidak ada", "category": "Thermal"},
+    "G056": {"text": "Laptop terasa lambat (throttling) saat suhu naik", "category": "Thermal"},
+    "G057": {"text": "Sering muncul Blue Screen (BSOD) dengan kode error berbeda-beda", "category": "System"},
+    "G058": {"text": "Laptop Freeze/Hang total, kursor tidak bisa gerak", "category": "System"},
+    "G059": {"text": "Windows gagal update (Stuck di 'Getting Windows Ready')", "category": "System"},
+    "G060": {"text": "Muncul banyak iklan Pop-up tidak senonoh/judi di desktop", "category": "System"},
+    "G061": {"text": "Ekstensi file berubah aneh (misal .encrypted)", "category": "System"},
+    "G062": {"text": "Aplikasi sering Force Close (Not Responding) sendiri", "category": "System"},
+    "G063": {"text": "Jam dan Tanggal laptop selalu kembali ke tahun lama (Reset)", "category": "System"},
+    "G064": {"text": "BIOS meminta password padahal tidak pernah disetting", "category": "System"},
+    "G065": {"text": "Engsel laptop bunyi 'krek' saat dibuka/ditutup", "category": "Fisik"},
+    "G066": {"text": "Casing laptop terbuka/menganga di area engsel", "category": "Fisik"},
+    "G067": {"text": "USB Drive tidak terdeteksi di semua port USB", "category": "Fisik"},
+    "G068": {"text": "Port USB longgar, flashdisk mudah goyang", "category": "Fisik"},
+    "G069": {"text": "Port HDMI tidak menampilkan gambar ke proyektor/TV", "category": "Fisik"},
+    "G070": {"text": "Keluar bau gosong/hangus dari ventilasi udara", "category": "Fisik"},
+    "G071": {"text": "Tersetrum ringan (grounding) saat menyentuh bodi logam laptop", "category": "Fisik"},
+    "G072": {"text": "Tombol trackpad keras/tidak bisa diklik", "category": "Fisik"},
+    "G073": {"text": "Layar laptop tidak bisa menutup rapat", "category": "Fisik"},
+    "G074": {"text": "Baut-baut casing bawah banyak yang hilang/lepas", "category": "Fisik"},
+    "G075": {"text": "Slot SD Card tidak bisa membaca memori kamera", "category": "Fisik"},
+}
+
+CAUSES = {
+    "C01": {"name": "Backlight Inverter Rusak/Putus", "category": "Layar", "prior_cf": 0.88, "level": "Sedang",
+            "desc": "Inverter adalah komponen yang mengubah arus DC menjadi AC untuk menyalakan lampu latar. Jika rusak, layar tampak gelap gulita.",
+            "sol": ["1. Sorot layar dengan senter HP. Jika terlihat bayangan gambar samar, masalah pada Backlight/Inverter.",
+                    "2. Ganti modul Inverter atau ganti satu set panel layar (untuk laptop LED modern)."]},
+    "C02": {"name": "Kabel Fleksibel Layar (LVDS) Bermasalah", "category": "Layar", "prior_cf": 0.85, "level": "Sedang",
+            "desc": "Kabel pita yang menghubungkan motherboard dengan layar terjepit di engsel atau mengalami keausan.",
+            "sol": ["1. Posisikan layar pada sudut tertentu di mana gambar terlihat normal.",
+                    "2. Bongkar bezel layar dan ganti kabel fleksibel (LVDS Cable)."]},
+    "C03": {"name": "Panel LCD Pecah/Rusak Fisik", "category": "Layar", "prior_cf": 0.95, "level": "Tinggi",
+            "desc": "Lapisan kristal cair di dalam panel layar mengalami keretakan akibat tekanan fisik atau benturan.",
+            "sol": ["1. Sambungkan laptop ke monitor eksternal via HDMI untuk memastikan VGA aman.",
+                    "2. Tidak bisa diservis. Solusi satu-satunya adalah penggantian Panel LCD/LED baru."]},
+    "C04": {"name": "Dead Pixel / Stuck Pixel", "category": "Layar", "prior_cf": 0.90, "level": "Rendah",
+            "desc": "Transistor sub-pixel pada layar mati atau terkunci pada warna tertentu.",
+            "sol": ["1. Gunakan software 'Pixel Healer' atau video flashing warna-warni cepat selama 1-2 jam.",
+                    "2. Ganti layar jika sangat mengganggu pandangan."]},
+    "C05": {"name": "Driver Grafis (VGA) Corrupt", "category": "Layar", "prior_cf": 0.80, "level": "Rendah",
+            "desc": "Perangkat lunak pengendali kartu grafis mengalami konflik sistem atau file korup.",
+            "sol": ["1. Gunakan DDU (Display Driver Uninstaller) untuk menghapus driver lama.",
+                    "2. Download dan install driver VGA versi terbaru dari situs resmi."]},
+    "C06": {"name": "GPU (VGA Card) Artifact/Rusak", "category": "Layar", "prior_cf": 0.92, "level": "Tinggi",
+            "desc": "Chipset grafis (GPU) mengalami kerusakan fisik akibat panas berlebih yang ekstrem.",
+            "sol": ["1. Lakukan proses 'Reballing' (solder ulang chipset GPU).",
+                    "2. Jika Reballing gagal, ganti Motherboard satu set."]},
+    "C07": {"name": "Digitizer Touchscreen Error", "category": "Layar", "prior_cf": 0.85, "level": "Sedang",
+            "desc": "Lapisan kaca sensor sentuh mengalami gangguan elektrostatis atau tekanan fisik.",
+            "sol": ["1. Nonaktifkan fitur Touchscreen melalui Device Manager.",
+                    "2. Ganti kaca Digitizer Touchscreen."]},
+    "C08": {"name": "Baterai Drop/Aus (Soak)", "category": "Power", "prior_cf": 0.88, "level": "Sedang",
+            "desc": "Kapasitas penyimpanan kimiawi di dalam sel baterai sudah menurun drastis karena siklus charge-discharge.",
+            "sol": ["1. Lakukan kalibrasi baterai: Charge 100%, pakai sampai mati total, diamkan 2 jam, charge penuh lagi.",
+                    "2. Jika Wear Level > 50%, ganti dengan baterai baru."]},
+    "C09": {"name": "Baterai Kembung (Swollen Battery)", "category": "Power", "prior_cf": 0.95, "level": "Tinggi",
+            "desc": "Terjadi penumpukan gas di dalam kemasan baterai. BAHAYA MELEDAK/TERBAKAR!",
+            "sol": ["1. SEGERA LEPAS baterai dari laptop! Jangan coba menusuk atau menekannya.",
+                    "2. Ganti baterai baru. Buang baterai lama di tempat limbah B3."]},
+    "C10": {"name": "IC Power Motherboard Rusak", "category": "Power", "prior_cf": 0.90, "level": "Tinggi",
+            "desc": "Kerusakan pada IC pengatur daya di motherboard. Listrik masuk tapi tidak didistribusikan.",
+            "sol": ["1. Cek tegangan 19V pada jalur utama motherboard menggunakan Multitester.",
+                    "2. Solder ulang atau ganti komponen IC yang terbakar/short."]},
+    "C11": {"name": "DC Jack (Port Charger) Rusak", "category": "Power", "prior_cf": 0.85, "level": "Sedang",
+            "desc": "Soket tempat mencolok charger mengalami keretakan pada kaki solderan atau pin patah.",
+            "sol": ["1. Goyangkan ujung charger pelan-pelan. Jika indikator nyala-mati, port bermasalah.",
+                    "2. Bongkar laptop, ganti part DC Jack."]},
+    "C12": {"name": "Adaptor Charger Rusak", "category": "Power", "prior_cf": 0.82, "level": "Sedang",
+            "desc": "Unit adaptor tidak mampu mengeluarkan tegangan atau arus yang stabil.",
+            "sol": ["1. Coba gunakan charger lain yang voltase dan tipe colokannya sama.",
+                    "2. Beli adaptor charger baru. Disarankan Original."]},
+    "C13": {"name": "Kabel Power Putus Dalam", "category": "Power", "prior_cf": 0.80, "level": "Rendah",
+            "desc": "Serabut tembaga di dalam kabel charger putus akibat kebiasaan menggulung kabel terlalu ketat.",
+            "sol": ["1. Potong bagian kabel yang putus, lalu sambung ulang (solder dan isolasi).",
+                    "2. Ganti kabel power AC atau ganti unit adaptor baru."]},
+    "C14": {"name": "Fleksibel Keyboard Kotor/Korosi", "category": "Input", "prior_cf": 0.75, "level": "Rendah",
+            "desc": "Ujung kabel pita keyboard mengalami oksidasi atau tertutup debu halus.",
+            "sol": ["1. Lepas keyboard, bersihkan ujung pin kabel fleksibel menggunakan penghapus pensil.",
+                    "2. Pasang kembali dengan presisi dan kunci soketnya dengan rapat."]},
+    "C15": {"name": "Switch Tombol Keyboard Rusak", "category": "Input", "prior_cf": 0.90, "level": "Sedang",
+            "desc": "Mekanisme karet atau pengait plastik di bawah tombol patah atau aus.",
+            "sol": ["1. Pindahkan mekanisme dari tombol yang jarang dipakai.",
+                    "2. Ganti keyboard satu set."]},
+    "C16": {"name": "Jalur Matrix Keyboard Short (Cairan)", "category": "Input", "prior_cf": 0.92, "level": "Sedang",
+            "desc": "Terjadi korsleting pada lapisan sirkuit matriks keyboard akibat masuknya cairan.",
+            "sol": ["1. Gunakan Keyboard USB Eksternal atau On-Screen Keyboard.",
+                    "2. Keyboard yang kena cairan wajib ganti unit baru."]},
+    "C17": {"name": "Driver Touchpad Konflik", "category": "Input", "prior_cf": 0.70, "level": "Rendah",
+            "desc": "Driver touchpad bawaan Windows bentrok dengan driver produsen.",
+            "sol": ["1. Cek tombol fungsi (Fn + F7/F9) untuk memastikan touchpad tidak dimatikan.",
+                    "2. Uninstall driver touchpad di Device Manager, restart, lalu install driver terbaru."]},
+    "C18": {"name": "Kabel Touchpad Lepas", "category": "Input", "prior_cf": 0.85, "level": "Sedang",
+            "desc": "Kabel fleksibel pipih yang menghubungkan modul touchpad ke motherboard terlepas.",
+            "sol": ["1. Buka casing laptop, cari kabel touchpad di bawah baterai/palmrest.",
+                    "2. Masukkan kembali kabel ke soket dan tekan penguncinya sampai bunyi 'klik'."]},
+    "C19": {"name": "Sensor Fingerprint Rusak", "category": "Input", "prior_cf": 0.80, "level": "Rendah",
+            "desc": "Permukaan sensor pembaca sidik jari tergores, berminyak parah, atau kabel putus.",
+            "sol": ["1. Bersihkan sensor dengan kain microfiber dan sedikit alkohol.",
+                    "2. Hapus data sidik jari lama di Windows Hello, lalu daftarkan ulang."]},
+    "C20": {"name": "Membran Speaker Robek", "category": "Audio", "prior_cf": 0.88, "level": "Rendah",
+            "desc": "Daun membran speaker pecah atau sobek karena usia atau volume 100%.",
+            "sol": ["1. Jangan setel volume diatas 70-80% untuk mengurangi distorsi.",
+                    "2. Ganti sepasang speaker internal laptop."]},
+    "C21": {"name": "Driver Audio Corrupt", "category": "Audio", "prior_cf": 0.80, "level": "Rendah",
+            "desc": "File driver suara rusak atau hilang akibat update Windows yang gagal.",
+            "sol": ["1. Klik kanan ikon speaker -> Troubleshoot Sound Problems.",
+                    "2. Download driver Audio Realtek terbaru dari situs resmi laptop."]},
+    "C22": {"name": "Port Jack Audio Rusak", "category": "Audio", "prior_cf": 0.85, "level": "Sedang",
+            "desc": "Plat logam kontak di dalam lubang jack 3.5mm bengkok atau patah.",
+            "sol": ["1. Gunakan USB Sound Card External.",
+                    "2. Ganti port audio (solder board) atau ganti Daughter Board Audio."]},
+    "C23": {"name": "Kabel Webcam Putus", "category": "Video", "prior_cf": 0.82, "level": "Sedang",
+            "desc": "Jalur kabel data untuk kamera yang melewati engsel laptop putus.",
+            "sol": ["1. Gunakan Webcam USB eksternal.",
+                    "2. Ganti kabel fleksibel kamera (biasanya satu paket dengan kabel LCD)."]},
+    "C24": {"name": "Modul Mikrofon Rusak/Tertutup", "category": "Audio", "prior_cf": 0.75, "level": "Rendah",
+            "desc": "Lubang mikrofon di bezel layar tertutup debu atau modul mic internal mati.",
+            "sol": ["1. Pastikan lubang kecil di dekat webcam tidak tertutup stiker/kotoran.",
+                    "2. Cek Privacy Settings di Windows, pastikan akses Microphone diizinkan."]},
+    "C25": {"name": "Harddisk (HDD) Bad Sector", "category": "Storage", "prior_cf": 0.90, "level": "Tinggi",
+            "desc": "Piringan magnetik harddisk mengalami kerusakan fisik di sektor-sektor tertentu.",
+            "sol": ["1. Segera BACKUP data penting ke tempat lain selagi bisa.",
+                    "2. Ganti HDD lama dengan SSD untuk kecepatan 10x lipat."]},
+    "C26": {"name": "Head Harddisk Macet (Mechanical Fail)", "category": "Storage", "prior_cf": 0.95, "level": "Tinggi",
+            "desc": "Komponen jarum pembaca/penulis data (Head) menabrak piringan atau macet, bunyi 'klik-klik'.",
+            "sol": ["1. Jangan dipaksakan menyala terus menerus karena akan memperparah kerusakan.",
+                    "2. Harddisk sudah rusak total secara fisik. Wajib ganti baru."]},
+    "C27": {"name": "SSD Health Critical / End of Life", "category": "Storage", "prior_cf": 0.88, "level": "Tinggi",
+            "desc": "Chip memori Flash pada SSD sudah mencapai batas maksimum siklus tulis (TBW).",
+            "sol": ["1. Cek kesehatan SSD menggunakan 'CrystalDiskInfo' atau 'Hard Disk Sentinel'.",
+                    "2. Segera cloning sistem ke SSD baru sebelum SSD lama mati."]},
+    "C28": {"name": "Bootloader Windows Rusak", "category": "Storage", "prior_cf": 0.85, "level": "Sedang",
+            "desc": "File sistem yang bertugas memanggil OS saat start-up (BCD/MBR) hilang atau korup.",
+            "sol": ["1. Booting menggunakan USB Installer Windows -> Repair your computer -> Startup Repair.",
+                    "2. Buka Command Prompt di mode repair, ketik: 'bootrec /fixmbr' dan 'bootrec /rebuildbcd'."]},
+    "C29": {"name": "Koneksi SATA/M.2 Kotor", "category": "Storage", "prior_cf": 0.70, "level": "Rendah",
+            "desc": "Pin konektor pada harddisk/SSD atau slot di motherboard kotor oleh debu/oksidasi.",
+            "sol": ["1. Cabut storage, bersihkan pin emasnya dengan penghapus, bersihkan slot dengan kuas.",
+                    "2. Jika pakai kabel SATA, coba ganti kabelnya."]},
+    "C30": {"name": "File System Corrupt", "category": "Storage", "prior_cf": 0.75, "level": "Sedang",
+            "desc": "Struktur pengalamatan file berantakan karena laptop sering dimatikan paksa.",
+            "sol": ["1. Buka CMD sebagai Admin, ketik 'chkdsk C: /f /r' lalu enter dan restart.",
+                    "2. Jika error berlanjut, backup data lalu format ulang drive."]},
+    "C31": {"name": "Wi-Fi Card (WLAN) Rusak", "category": "Network", "prior_cf": 0.85, "level": "Sedang",
+            "desc": "Modul hardware penerima sinyal Wi-Fi di motherboard mengalami kerusakan komponen.",
+            "sol": ["1. Beli USB Wi-Fi Dongle (Plug and Play) sebagai solusi termurah.",
+                    "2. Ganti card Wi-Fi internal (biasanya slot M.2 atau Mini PCIe)."]},
+    "C32": {"name": "Kabel Antena Wi-Fi Lepas", "category": "Network", "prior_cf": 0.80, "level": "Rendah",
+            "desc": "Kabel antena (hitam/putih) yang menempel pada card Wi-Fi terlepas akibat guncangan.",
+            "sol": ["1. Buka casing belakang laptop, cari card Wi-Fi.",
+                    "2. Tekan kembali kepala kabel antena ke soket di card Wi-Fi sampai bunyi 'klik'."]},
+    "C33": {"name": "Driver Network Adapter Error", "category": "Network", "prior_cf": 0.75, "level": "Rendah",
+            "desc": "Driver pengendali jaringan crash atau tidak kompatibel dengan update Windows.",
+            "sol": ["1. Buka Settings -> Network & Internet -> Network Reset.",
+                    "2. Download driver WLAN/LAN via HP lain, transfer via USB, lalu install."]},
+    "C34": {"name": "Modul Bluetooth Rusak", "category": "Network", "prior_cf": 0.80, "level": "Rendah",
+            "desc": "Komponen Bluetooth (biasanya satu chip dengan Wi-Fi) mati.",
+            "sol": ["1. Gunakan USB Bluetooth Dongle 5.0.",
+                    "2. Pastikan Bluetooth Support Service berjalan di 'services.msc'."]},
+    "C35": {"name": "Pasta Termal Kering", "category": "Thermal", "prior_cf": 0.85, "level": "Sedang",
+            "desc": "Pasta konduktor panas di atas prosesor sudah mengeras, panas tidak tersalurkan ke heatsink.",
+            "sol": ["1. Bongkar sistem pendingin, bersihkan pasta lama dengan alkohol, oleskan pasta baru (Arctic MX-4).",
+                    "2. Lakukan penggantian pasta termal setiap 1-2 tahun sekali."]},
+    "C36": {"name": "Kipas Pendingin (Fan) Mati", "category": "Thermal", "prior_cf": 0.92, "level": "Tinggi",
+            "desc": "Dinamo kipas putus atau macet total. Panas akan terperangkap dan menyebabkan laptop mati mendadak.",
+            "sol": ["1. Coba bersihkan debu yang mengganjal kipas.",
+                    "2. Jika dibersihkan tetap tidak muter, wajib ganti unit kipas baru."]},
+    "C37": {"name": "Bearing Kipas Aus/Kotor", "category": "Thermal", "prior_cf": 0.80, "level": "Rendah",
+            "desc": "Poros putaran kipas kering pelumasnya atau kemasukan debu kasar, bunyi bising/bergetar.",
+            "sol": ["1. Buka kipas, beri 1 tetes minyak mesin jahit di porosnya.",
+                    "2. Jika kipas model permanen (sealed), harus ganti baru."]},
+    "C38": {"name": "Ventilasi Heatsink Tersumbat", "category": "Thermal", "prior_cf": 0.75, "level": "Rendah",
+            "desc": "Debu tebal membentuk 'karpet' di sirip-sirip heatsink, menghalangi angin panas keluar.",
+            "sol": ["1. Gunakan kompresor angin atau kaleng compressed air untuk meniup debu keluar.",
+                    "2. Gunakan kuas antistatik untuk membersihkan celah-celah ventilasi."]},
+    "C39": {"name": "Baterai CMOS Habis", "category": "Motherboard", "prior_cf": 0.90, "level": "Rendah",
+            "desc": "Baterai kancing (CR2032) di motherboard yang menjaga settingan BIOS dan Jam habis dayanya.",
+            "sol": ["1. Buka casing, cari baterai bulat seperti uang koin, ganti dengan tipe CR2032 baru.",
+                    "2. Setelah ganti, masuk BIOS dan atur ulang tanggal/jam."]},
+    "C40": {"name": "Korsleting (Short Circuit) Motherboard", "category": "Motherboard", "prior_cf": 0.95, "level": "Tinggi",
+            "desc": "Terjadi hubungan arus pendek antar jalur komponen. BAHAYA KEBAKARAN!",
+            "sol": ["1. Jangan coba nyalakan laptop! Cabut charger dan baterai.",
+                    "2. Bawa ke tempat servis spesialis motherboard untuk pelacakan jalur short."]},
+    "C41": {"name": "RAM Rusak/Kotor", "category": "Motherboard", "prior_cf": 0.88, "level": "Tinggi",
+            "desc": "Modul memori RAM mengalami error pada chip-nya atau pin konektornya kotor.",
+            "sol": ["1. Lepas RAM, gosok pin emasnya dengan penghapus pensil putih, pasang lagi.",
+                    "2. Coba ganti dengan RAM lain yang normal."]},
+    "C42": {"name": "Slot RAM Bermasalah", "category": "Motherboard", "prior_cf": 0.85, "level": "Sedang",
+            "desc": "Kaki-kaki logam di dalam slot memori motherboard ada yang bengkok atau longgar.",
+            "sol": ["1. Jika laptop punya 2 slot, pindahkan RAM ke slot satunya.",
+                    "2. Jika semua slot error, perlu solder ulang kaki slot."]},
+    "C43": {"name": "BIOS Corrupt", "category": "Motherboard", "prior_cf": 0.92, "level": "Tinggi",
+            "desc": "Firmware dasar (BIOS) rusak, biasanya karena gagal update BIOS atau mati listrik saat flashing.",
+            "sol": ["1. Lakukan Flash BIOS ulang menggunakan alat programmer (USB EPROM Programmer).",
+                    "2. Coba reset BIOS dengan mencabut baterai CMOS selama 5 menit."]},
+    "C44": {"name": "Infeksi Virus/Malware/Adware", "category": "Software", "prior_cf": 0.90, "level": "Sedang",
+            "desc": "Sistem terinfeksi program jahat yang memakan resource CPU/RAM atau memunculkan iklan.",
+            "sol": ["1. Jalankan Full Scan menggunakan Windows Defender atau Malwarebytes.",
+                    "2. Hapus ekstensi browser yang mencurigakan."]},
+    "C45": {"name": "Serangan Ransomware", "category": "Software", "prior_cf": 0.98, "level": "Tinggi",
+            "desc": "Virus berbahaya yang mengenkripsi (mengunci) semua data pribadi dan meminta tebusan.",
+            "sol": ["1. Matikan internet segera agar tidak menyebar ke jaringan.",
+                    "2. Format habis harddisk dan install ulang Windows. Data yang terkunci sangat sulit kembali."]},
+    "C46": {"name": "Registry Windows Error", "category": "Software", "prior_cf": 0.75, "level": "Rendah",
+            "desc": "Database konfigurasi sistem operasi berantakan karena sisa uninstalasi program.",
+            "sol": ["1. Buka CMD Admin, ketik 'sfc /scannow' untuk memperbaiki file sistem.",
+                    "2. Gunakan fitur 'Reset this PC' di settings Windows (Keep my files)."]},
+    "C47": {"name": "Update Windows Bermasalah", "category": "Software", "prior_cf": 0.85, "level": "Sedang",
+            "desc": "File update Windows korup atau tidak cocok dengan hardware, menyebabkan bootloop.",
+            "sol": ["1. Masuk Safe Mode, hapus update terakhir via Control Panel -> View Installed Updates.",
+                    "2. Pause update sementara waktu sampai Microsoft merilis patch perbaikan."]},
+    "C48": {"name": "Bloatware Berlebihan", "category": "Software", "prior_cf": 0.75, "level": "Rendah",
+            "desc": "Terlalu banyak aplikasi berjalan otomatis saat laptop dinyalakan (Startup), membebani RAM.",
+            "sol": ["1. Buka Task Manager -> Tab Startup -> Disable aplikasi yang tidak perlu.",
+                    "2. Hapus aplikasi bawaan pabrik yang tidak pernah dipakai."]},
+    "C49": {"name": "Engsel (Hinge) Patah/Jebol", "category": "Fisik", "prior_cf": 0.98, "level": "Tinggi",
+            "desc": "Dudukan baut kuningan di dalam casing plastik hancur, engsel besi tidak punya pegangan.",
+            "sol": ["1. Servis casing dengan lem khusus campur bubuk penguat untuk membuat dudukan baru.",
+                    "2. Ganti casing laptop (Top Case/Bottom Case) dengan yang baru/copotan."]},
+    "C50": {"name": "Port USB Controller Rusak", "category": "Motherboard", "prior_cf": 0.85, "level": "Sedang",
+            "desc": "Chipset yang mengatur lalu lintas data USB di motherboard mati atau short.",
+            "sol": ["1. Gunakan USB Hub pada port yang masih menyala (jika ada).",
+                    "2. Jika ada slot ExpressCard (laptop lama), pakai USB ExpressCard adapter."]},
+}
+
+RULES = [
+    # LAYAR
+    {"id": "R01", "symptoms": ["G006", "G001"], "cause": "C01", "cf": 0.85},
+    {"id": "R02", "symptoms": ["G002", "G008", "G009"], "cause": "C02", "cf": 0.80},
+    {"id": "R03", "symptoms": ["G003", "G007"], "cause": "C03", "cf": 0.95},
+    {"id": "R04", "symptoms": ["G004"], "cause": "C04", "cf": 0.90},
+    {"id": "R05", "symptoms": ["G007", "G058"], "cause": "C05", "cf": 0.70},
+    {"id": "R06", "symptoms": ["G007", "G057", "G051"], "cause": "C06", "cf": 0.90},
+    {"id": "R07", "symptoms": ["G005"], "cause": "C07", "cf": 0.85},
+    {"id": "R08", "symptoms": ["G010"], "cause": "C03", "cf": 0.85},
+    # POWER
+    {"id": "R09", "symptoms": ["G011", "G019"], "cause": "C08", "cf": 0.85},
+    {"id": "R10", "symptoms": ["G014", "G027"], "cause": "C09", "cf": 0.95},
+    {"id": "R11", "symptoms": ["G012", "G015"], "cause": "C10", "cf": 0.88},
+    {"id": "R12", "symptoms": ["G013", "G012"], "cause": "C11", "cf": 0.90},
+    {"id": "R13", "symptoms": ["G016", "G012"], "cause": "C12", "cf": 0.80},
+    {"id": "R14", "symptoms": ["G013", "G017"], "cause": "C13", "cf": 0.75},
+    {"id": "R15", "symptoms": ["G018"], "cause": "C08", "cf": 0.80},
+    # INPUT
+    {"id": "R16", "symptoms": ["G020"], "cause": "C14", "cf": 0.70},
+    {"id": "R17", "symptoms": ["G020", "G022"], "cause": "C15", "cf": 0.85},
+    {"id": "R18", "symptoms": ["G021"], "cause": "C16", "cf": 0.90},
+    {"id": "R19", "symptoms": ["G023", "G024"], "cause": "C17", "cf": 0.60},
+    {"id": "R20", "symptoms": ["G023"], "cause": "C18", "cf": 0.80},
+    {"id": "R21", "symptoms": ["G026"], "cause": "C19", "cf": 0.85},
+    {"id": "R22", "symptoms": ["G025"], "cause": "C18", "cf": 0.75},
+    # AUDIO/VIDEO
+    {"id": "R23", "symptoms": ["G028", "G030"], "cause": "C20", "cf": 0.90},
+    {"id": "R24", "symptoms": ["G029"], "cause": "C21", "cf": 0.80},
+    {"id": "R25", "symptoms": ["G031", "G032"], "cause": "C22", "cf": 0.85},
+    {"id": "R26", "symptoms": ["G033", "G034"], "cause": "C23", "cf": 0.85},
+    {"id": "R27", "symptoms": ["G035"], "cause": "C24", "cf": 0.80},
+    # STORAGE
+    {"id": "R28", "symptoms": ["G036", "G042"], "cause": "C25", "cf": 0.75},
+    {"id": "R29", "symptoms": ["G037", "G038"], "cause": "C26", "cf": 0.95},
+    {"id": "R30", "symptoms": ["G057", "G038", "G040"], "cause": "C27", "cf": 0.85},
+    {"id": "R31", "symptoms": ["G038"], "cause": "C28", "cf": 0.80},
+    {"id": "R32", "symptoms": ["G038"], "cause": "C29", "cf": 0.65},
+    {"id": "R33", "symptoms": ["G036", "G040"], "cause": "C30", "cf": 0.60},
+    {"id": "R34", "symptoms": ["G043"], "cause": "C25", "cf": 0.70},
+    # NETWORK
+    {"id": "R35", "symptoms": ["G044", "G045"], "cause": "C31", "cf": 0.85},
+    {"id": "R36", "symptoms": ["G046", "G047"], "cause": "C32", "cf": 0.80},
+    {"id": "R37", "symptoms": ["G044", "G050"], "cause": "C33", "cf": 0.70},
+    {"id": "R38", "symptoms": ["G048"], "cause": "C34", "cf": 0.80},
+    {"id": "R39", "symptoms": ["G049"], "cause": "C33", "cf": 0.75},
+    # THERMAL
+    {"id": "R40", "symptoms": ["G051", "G052", "G056"], "cause": "C35", "cf": 0.80},
+    {"id": "R41", "symptoms": ["G051", "G052", "G054"], "cause": "C36", "cf": 0.90},
+    {"id": "R42", "symptoms": ["G053"], "cause": "C37", "cf": 0.85},
+    {"id": "R43", "symptoms": ["G051", "G055"], "cause": "C38", "cf": 0.75},
+    # MOBO & OS
+    {"id": "R44", "symptoms": ["G063"], "cause": "C39", "cf": 0.95},
+    {"id": "R45", "symptoms": ["G070", "G015"], "cause": "C40", "cf": 0.95},
+    {"id": "R46", "symptoms": ["G057", "G058"], "cause": "C41", "cf": 0.85},
+    {"id": "R47", "symptoms": ["G057"], "cause": "C42", "cf": 0.70},
+    {"id": "R48", "symptoms": ["G001", "G015"], "cause": "C43", "cf": 0.80},
+    {"id": "R49", "symptoms": ["G064"], "cause": "C43", "cf": 0.90},
+    # SOFTWARE
+    {"id": "R50", "symptoms": ["G060", "G056"], "cause": "C44", "cf": 0.85},
+    {"id": "R51", "symptoms": ["G061"], "cause": "C45", "cf": 0.98},
+    {"id": "R52", "symptoms": ["G062", "G057"], "cause": "C46", "cf": 0.75},
+    {"id": "R53", "symptoms": ["G059"], "cause": "C47", "cf": 0.85},
+    {"id": "R54", "symptoms": ["G056", "G042"], "cause": "C48", "cf": 0.70},
+    # FISIK
+    {"id": "R55", "symptoms": ["G065", "G066", "G073"], "cause": "C49", "cf": 0.98},
+    {"id": "R56", "symptoms": ["G067", "G068"], "cause": "C50", "cf": 0.85},
+    {"id": "R57", "symptoms": ["G071"], "cause": "C40", "cf": 0.60},
+    {"id": "R58", "symptoms": ["G069"], "cause": "C05", "cf": 0.60},
+    {"id": "R59", "symptoms": ["G072"], "cause": "C09", "cf": 0.80},
+]
@@ -0,0 +1,307 @@
+"""Memuat basis pengetahuan dari file eksternal, dengan validasi dan hot reload.
+
+Dua format didukung, dipilih dari ekstensi file:
+
+- ``.json``: ``{"symptoms": {...}, "causes": {...}, "rules": [...]}`` dengan
+  bentuk yang sama seperti SYMPTOMS/CAUSES/RULES di pakar.kb.
+- ``.kbb``: biner ringkas. Gejala dan penyebab disimpan sebagai JSON di header,
+  rule sebagai array terkemas (cause, cf, premis) yang dibaca lewat mmap dan
+  baru didekode saat diakses.
+
+Saat mempublikasikan KB baru, tulis ke file sementara lalu ``os.replace`` ke
+path tujuan (seperti dump_kb) agar watcher tidak pernah membaca file setengah jadi.
+"""
+
+import json
+import logging
+import mmap
+import os
+import struct
+import threading
+from collections.abc import Sequence
+
+from .engine import KnowledgeBase, kb_version, use_kb
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"PKKB"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHHI")
+
+class KnowledgeBaseError(ValueError):
+    """File KB tidak bisa dibaca atau isinya tidak konsisten."""
+
+    def __init__(self, path, problems):
+        self.path = path
+        self.problems = problems
+        shown = "; ".join(problems[:5])
+        more = f" (+{len(problems) - 5} lainnya)" if len(problems) > 5 else ""
+        super().__init__(f"{path}: {shown}{more}")
+
+def is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def validate(symptoms, causes, rules, path="<kb>"):
+    """Periksa bentuk dan tipe setiap field; semua masalah dikumpulkan dalam satu KnowledgeBaseError."""
+    problems = []
+    if not isinstance(symptoms, dict) or not isinstance(causes, dict):
+        raise KnowledgeBaseError(path, ["symptoms dan causes harus berupa objek"])
+    if not isinstance(rules, Sequence) or isinstance(rules, (str, bytes)):
+        raise KnowledgeBaseError(path, ["rules harus berupa list"])
+
+    for code, data in symptoms.items():
+        if not isinstance(data, dict) or not isinstance(data.get("text"), str):
+            problems.append(f"gejala {code} tidak punya 'text' berupa string")
+        elif not isinstance(data.get("category", ""), str):
+            problems.append(f"gejala {code}: category harus string")
+    for code, data in causes.items():
+        if not isinstance(data, dict):
+            problems.append(f"penyebab {code} harus berupa objek")
+            continue
+        missing = [f for f in ("name", "prior_cf", "level") if f not in data]
+        if missing:
+            problems.append(f"penyebab {code} tidak punya {', '.join(missing)}")
+            continue
+        for field in ("name", "level", "category", "desc"):
+            if field in data and not isinstance(data[field], str):
+                problems.append(f"penyebab {code}: {field} harus string")
+        if "sol" in data and (not isinstance(data["sol"], list) or not all(isinstance(x, str) for x in data["sol"])):
+            problems.append(f"penyebab {code}: sol harus list string")
+        if not is_number(data["prior_cf"]):
+            problems.append(f"penyebab {code}: prior_cf {data['prior_cf']!r} bukan angka")
+        elif not 0 <= data["prior_cf"] <= 1:
+            problems.append(f"penyebab {code}: prior_cf {data['prior_cf']} di luar 0..1")
+
+    seen = set()
+    for n, rule in enumerate(rules):
+        if not isinstance(rule, dict):
+            problems.append(f"rule #{n} harus berupa objek")
+            continue
+        rule_id = rule.get("id", f"#{n}")
+        if not isinstance(rule_id, (str, int)) or isinstance(rule_id, bool):
+            problems.append(f"rule #{n}: id {rule_id!r} harus string atau angka")
+            rule_id = f"#{n}"
+        if rule_id in seen:
+            problems.append(f"rule {rule_id} duplikat")
+        seen.add(rule_id)
+        cause = rule.get("cause")
+        if not isinstance(cause, str) or cause not in causes:
+            problems.append(f"rule {rule_id}: penyebab {cause!r} tidak ada di CAUSES")
+        premise = rule.get("symptoms")
+        if not isinstance(premise, list) or not all(isinstance(sym, str) for sym in premise):
+            problems.append(f"rule {rule_id}: symptoms harus list kode gejala")
+        elif not premise:
+            problems.append(f"rule {rule_id}: premis kosong")
+        else:
+            for sym in premise:
+                if sym not in symptoms:
+                    problems.append(f"rule {rule_id}: gejala {sym} tidak ada di SYMPTOMS")
+        if not is_number(rule.get("cf")) or not 0 <= rule["cf"] <= 1:
+            problems.append(f"rule {rule_id}: cf {rule.get('cf')!r} di luar 0..1")
+
+    if problems:
+        raise KnowledgeBaseError(path, problems)
+
+class PackedRules(Sequence):
+    """Rule dari file .kbb; setiap rule didekode menjadi dict hanya saat diakses.
+
+    Kompilasi KB memakai `columns()` sehingga memuat file .kbb tidak mendekode rule satu per satu.
+    """
+
+    def __init__(self, ids, codes, cause_ids, cause, cf, premise_ptr, premise, keepalive):
+        self.ids = ids
+        self._codes = codes
+        self._cause_ids = cause_ids
+        self._cause = cause
+        self._cf = cf
+        self._ptr = premise_ptr
+        self._premise = premise
+        self._keepalive = keepalive
+
+    def __len__(self):
+        return len(self._cf)
+
+    def columns(self):
+        """(premise_ptr, premise, id penyebab per rule, cf per rule) untuk engine.compile_columns."""
+        cause_ids = self._cause_ids
+        return self._ptr, self._premise, [cause_ids[c] for c in self._cause], self._cf
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        codes = self._codes
+        return {
+            "id": self.ids[i],
+            "symptoms": [codes[j] for j in self._premise[self._ptr[i]:self._ptr[i + 1]]],
+            "cause": self._cause_ids[self._cause[i]],
+            "cf": self._cf[i],
+        }
+
+def _load_json(path):
+    with open(path, encoding="utf-8") as f:
+        try:
+            data = json.load(f)
+        except ValueError as e:
+            raise KnowledgeBaseError(path, [f"JSON tidak valid: {e}"]) from None
+    if not isinstance(data, dict) or not all(k in data for k in ("symptoms", "causes", "rules")):
+        raise KnowledgeBaseError(path, ["harus berisi objek dengan kunci symptoms, causes, rules"])
+    validate(data["symptoms"], data["causes"], data["rules"], path)
+    return KnowledgeBase(data["symptoms"], data["causes"], data["rules"])
+
+def _load_packed(path):
+    with open(path, "rb") as f:
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise KnowledgeBaseError(path, ["file kosong"]) from None
+    view = memoryview(buf)
+    try:
+        magic, fmt, _, meta_len = HEADER.unpack_from(view)
+    except struct.error:
+        raise KnowledgeBaseError(path, ["file terlalu pendek"]) from None
+    if magic != MAGIC or fmt != FORMAT_VERSION:
+        raise KnowledgeBaseError(path, [f"bukan file KB biner versi {FORMAT_VERSION}"])
+
+    offset = HEADER.size
+    try:
+        meta = json.loads(bytes(view[offset:offset + meta_len]))
+        n_rules, n_premise = meta["n_rules"], meta["n_premise"]
+        codes, cause_ids, rule_ids = list(meta["symptoms"]), list(meta["causes"]), meta["rule_ids"]
+        version = meta["version"]
+    except (ValueError, KeyError, TypeError) as e:
+        # ValueError mencakup JSONDecodeError dan UnicodeDecodeError
+        raise KnowledgeBaseError(path, [f"metadata rusak: {type(e).__name__}: {e}"]) from None
+    if (not isinstance(n_rules, int) or not isinstance(n_premise, int) or n_rules < 0 or n_premise < 0
+            or not isinstance(rule_ids, list) or len(rule_ids) != n_rules):
+        raise KnowledgeBaseError(path, ["metadata rusak: jumlah rule/premis tidak konsisten"])
+    offset += meta_len + (-meta_len - HEADER.size) % 8
+
+    def take(fmt, count):
+        nonlocal offset
+        size = struct.calcsize(fmt) * count
+        if offset + size > len(view):
+            raise KnowledgeBaseError(path, ["file terpotong"])
+        array = view[offset:offset + size].cast(fmt)
+        offset += size
+        return array
+
+    cf = take("d", n_rules)
+    cause = take("I", n_rules)
+    premise_ptr = take("I", n_rules + 1)
+    premise = take("I", n_premise)
+
+    problems = []
+    if n_rules and max(cause) >= len(cause_ids):
+        problems.append("indeks penyebab di luar tabel CAUSES")
+    if n_premise and max(premise) >= len(codes):
+        problems.append("indeks gejala di luar tabel SYMPTOMS")
+    if premise_ptr[n_rules] != n_premise or any(premise_ptr[i] >= premise_ptr[i + 1] for i in range(n_rules)):
+        problems.append("tabel premis rusak atau ada premis kosong")
+    if any(not 0 <= v <= 1 for v in cf):
+        problems.append("cf rule di luar 0..1")
+    if problems:
+        raise KnowledgeBaseError(path, problems)
+    # Gejala/penyebab tetap divalidasi penuh; rule cukup lewat pemeriksaan indeks di atas
+    validate(meta["symptoms"], meta["causes"], [], path)
+
+    rules = PackedRules(rule_ids, codes, cause_ids, cause, cf, premise_ptr, premise, buf)
+    return KnowledgeBase(meta["symptoms"], meta["causes"], rules, version=version)
+
+def load_kb(path):
+    """Baca, validasi, dan kompilasi KB dari file .json atau .kbb."""
+    if path.endswith(".kbb"):
+        return _load_packed(path)
+    return _load_json(path)
+
+def dump_kb(path, symptoms, causes, rules):
+    """Tulis KB ke .json atau .kbb secara atomik (file sementara lalu os.replace)."""
+    validate(symptoms, causes, rules, path)
+    tmp = f"{path}.tmp{os.getpid()}"
+    if path.endswith(".kbb"):
+        codes = {code: i for i, code in enumerate(symptoms)}
+        cause_index = {code: i for i, code in enumerate(causes)}
+        premise_ptr, premise = [0], []
+        for rule in rules:
+            premise.extend(codes[s] for s in rule["symptoms"])
+            premise_ptr.append(len(premise))
+        meta = json.dumps({
+            "version": kb_version(symptoms, causes, list(rules)),
+            "symptoms": symptoms,
+            "causes": causes,
+            "rule_ids": [rule["id"] for rule in rules],
+            "n_rules": len(rules),
+            "n_premise": len(premise),
+        }, ensure_ascii=False).encode("utf-8")
+        with open(tmp, "wb") as f:
+            f.write(HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(meta)))
+            f.write(meta)
+            f.write(b"\0" * ((-len(meta) - HEADER.size) % 8))
+            f.write(struct.pack(f"<{len(rules)}d", *(rule["cf"] for rule in rules)))
+            f.write(struct.pack(f"<{len(rules)}I", *(cause_index[rule["cause"]] for rule in rules)))
+            f.write(struct.pack(f"<{len(premise_ptr)}I", *premise_ptr))
+            f.write(struct.pack(f"<{len(premise)}I", *premise))
+    else:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"symptoms": symptoms, "causes": causes, "rules": list(rules)}, f, ensure_ascii=False, indent=1)
+    os.replace(tmp, path)
+
+class KnowledgeBaseWatcher:
+    """Memantau file KB dan memasang versi baru lewat use_kb tanpa menghentikan diagnosa.
+
+    KB baru dimuat dan dikompilasi penuh di thread watcher, baru kemudian
+    referensinya ditukar. Diagnosa yang sedang berjalan tetap memakai KB lama.
+    File yang gagal divalidasi diabaikan (KB lama tetap aktif) dan dicatat di log.
+    """
+
+    def __init__(self, path, interval=2.0):
+        self.path = path
+        self.interval = interval
+        self.last_error = None
+        self._stamp = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _file_stamp(self):
+        st = os.stat(self.path)
+        return st.st_mtime_ns, st.st_size, st.st_ino
+
+    def poll(self):
+        """Muat ulang jika file berubah; True bila KB baru dipasang."""
+        try:
+            stamp = self._file_stamp()
+            if stamp == self._stamp:
+                return False
+            self._stamp = stamp
+            kb = load_kb(self.path)
+        except (OSError, KnowledgeBaseError) as e:
+            self.last_error = e
+            logger.warning("KB %s tidak dimuat ulang: %s", self.path, e)
+            return False
+        except Exception as e:
+            # Bug di loader/kompilasi tidak boleh mematikan thread watcher; KB lama tetap aktif
+            self.last_error = e
+            logger.exception("KB %s tidak dimuat ulang karena error tak terduga", self.path)
+            return False
+        use_kb(kb)
+        self.last_error = None
+        logger.info("KB %s dimuat (versi %s, %d rule)", self.path, kb.version, len(kb.rules))
+        return True
+
+    def start(self):
+        # Pemuatan pertama sinkron dan error-nya dilempar, agar salah konfigurasi langsung terlihat
+        self._stamp = self._file_stamp()
+        use_kb(load_kb(self.path))
+        self._thread = threading.Thread(target=self._run, name="kb-watcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.poll()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
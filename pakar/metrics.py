@@ -0,0 +1,290 @@
+"""Instrumentasi opsional dengan ekspor format teks Prometheus.
+
+Diaktifkan lewat variabel lingkungan ``PAKAR_METRICS``:
+
+- angka (mis. ``9108``): endpoint HTTP ``http://127.0.0.1:9108/metrics``
+- path file (mis. ``/var/lib/node_exporter/pakar.prom``): ditulis ulang setiap
+  ``PAKAR_METRICS_INTERVAL`` detik (default 15), cocok untuk textfile collector
+
+Tanpa variabel itu tidak ada yang dipasang: ``timed()`` mengembalikan fungsi
+aslinya dan pemanggil diagnosa hanya memeriksa ``registry() is None``.
+
+Diagnosa dicatat di tempat permintaan dijawab (DiagnosisCache.diagnose, termasuk
+hit cache, dan jalur tunggal/batch pakar.service), bukan di run_diagnosis, sehingga
+setiap jawaban terhitung tepat sekali. Jalur diagnosa hanya menampung (gejala, hasil, durasi); histogram, hit penyebab,
+dan hitungan rule menyala dihitung sekaligus (rule lewat matriks sparse
+pakar.batch) saat ekspor atau saat tampungan penuh. Rule dengan hitungan 0 adalah kandidat rule
+mati di RULES.
+"""
+
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from functools import wraps
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from . import engine
+
+logger = logging.getLogger(__name__)
+
+# Batas bucket histogram (detik); rerun Streamlit dan diagnosa tunggal punya skala berbeda
+DIAGNOSIS_BUCKETS = (1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 1e-2, 5e-2)
+PAGE_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+# Jumlah diagnosa yang ditampung sebelum diagregasikan ke metrik
+FLUSH_EVERY = 4096
+
+def escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def format_labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{escape(v)}"' for k, v in labels) + "}"
+
+def rule_labels(kb):
+    # Rule dari KB eksternal boleh tanpa "id"; pakai nomor urutnya
+    ids = getattr(kb.rules, "ids", None)
+    if ids is not None:
+        # Rule dari file biner: id dibaca dari metadata tanpa mendekode rule
+        return [str(rule_id) for rule_id in ids]
+    return [rule.get("id", str(i)) for i, rule in enumerate(kb.rules)]
+
+class Histogram:
+    def __init__(self, name, help, buckets, label=None):
+        self.name = name
+        self.help = help
+        self.buckets = buckets
+        self.label = label
+        self._series = {}
+
+    def observe(self, value, label=None):
+        # Dipanggil di bawah lock Registry
+        series = self._series.get(label)
+        if series is None:
+            series = self._series[label] = [[0] * (len(self.buckets) + 1), 0.0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for label, (counts, total) in sorted(self._series.items(), key=lambda x: str(x[0])):
+            base = [(self.label, label)] if self.label else []
+            running = 0
+            for bound, count in zip(self.buckets, counts):
+                running += count
+                lines.append(f"{self.name}_bucket{format_labels(base + [('le', repr(bound))])} {running}")
+            running += counts[-1]
+            lines.append(f"{self.name}_bucket{format_labels(base + [('le', '+Inf')])} {running}")
+            lines.append(f"{self.name}_sum{format_labels(base)} {total}")
+            lines.append(f"{self.name}_count{format_labels(base)} {running}")
+        return lines
+
+class Counter:
+    def __init__(self, name, help, label=None):
+        self.name = name
+        self.help = help
+        self.label = label
+        self._values = {}
+
+    def inc(self, label=None, amount=1):
+        self._values[label] = self._values.get(label, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for label, value in sorted(self._values.items(), key=lambda x: str(x[0])):
+            lines.append(f"{self.name}{format_labels([(self.label, label)] if self.label else [])} {value}")
+        return lines
+
+class Registry:
+    """Semua metrik satu proses; aman dipakai banyak thread (satu per sesi Streamlit)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self.diagnosis_seconds = Histogram(
+            "pakar_diagnosis_seconds", "Latensi run_diagnosis", DIAGNOSIS_BUCKETS)
+        self.page_seconds = Histogram(
+            "pakar_page_seconds", "Waktu eksekusi fungsi halaman", PAGE_BUCKETS, label="page")
+        self.rerun_seconds = Histogram(
+            "pakar_rerun_seconds", "Waktu satu rerun skrip (dispatch router)", PAGE_BUCKETS, label="page")
+        self.cause_hits = Counter("pakar_cause_hits_total", "Penyebab yang muncul di hasil diagnosa", label="cause")
+        self.top_cause_hits = Counter("pakar_top_cause_hits_total", "Penyebab peringkat pertama", label="cause")
+        self.sessions = Counter("pakar_sessions_total", "Sesi Streamlit baru")
+        self._collectors = []
+        self._pending = deque()
+        self._fired = None
+        self._fired_version = None
+
+    def observe_diagnosis(self, user_symptoms, kb, results, seconds):
+        # Jalur panas: hanya satu append (atomik di bawah GIL); agregasi ditunda ke flush()
+        pending = self._pending
+        pending.append((user_symptoms, kb, results, seconds))
+        if len(pending) >= FLUSH_EVERY:
+            self.flush()
+
+    def flush(self):
+        """Agregasikan diagnosa yang ditampung: histogram, hit penyebab, dan rule menyala."""
+        with self._flush_lock:
+            # popleft sebanyak isi saat ini: append dari thread lain tidak hilang
+            queue = self._pending
+            pending = [queue.popleft() for _ in range(len(queue))]
+            if not pending:
+                return
+            from .batch import batch_for, count_fired
+
+            current = engine.current_kb()
+            sets = [tuple(symptoms) for symptoms, kb, _, _ in pending if kb is current]
+            # Rule menyala dihitung sekaligus lewat matriks sparse, bukan per diagnosa
+            counts = count_fired(batch_for(current), sets) if sets else None
+            with self._lock:
+                for _, _, results, seconds in pending:
+                    self.diagnosis_seconds.observe(seconds)
+                    for n, (cause_id, _) in enumerate(results):
+                        self.cause_hits.inc(cause_id)
+                        if n == 0:
+                            self.top_cause_hits.inc(cause_id)
+                if self._fired_version != current.version:
+                    # KB berganti: hitungan lama tidak berlaku untuk rule baru
+                    self._fired, self._fired_version = None, current.version
+                if counts is not None:
+                    self._fired = counts if self._fired is None else self._fired + counts
+
+    def add_collector(self, collect):
+        """collect() -> list (nama, tipe, help, nilai) untuk gauge/counter milik pemanggil."""
+        with self._lock:
+            self._collectors.append(collect)
+
+    def render(self):
+        self.flush()
+        kb = engine.current_kb()
+        with self._lock:
+            lines = []
+            for metric in (self.diagnosis_seconds, self.page_seconds, self.rerun_seconds, self.cause_hits,
+                           self.top_cause_hits, self.sessions):
+                lines.extend(metric.render())
+            collectors = list(self._collectors)
+            fired = self._fired if self._fired_version == kb.version else None
+
+        rule_ids = kb.derived("rule_ids", rule_labels)
+        lines.append("# HELP pakar_rule_fired_total Berapa kali rule menyala (0 = kandidat rule mati)")
+        lines.append("# TYPE pakar_rule_fired_total counter")
+        for i, rule_id in enumerate(rule_ids):
+            value = int(fired[i]) if fired is not None else 0
+            lines.append(f"pakar_rule_fired_total{format_labels([('rule', rule_id), ('kb_version', kb.version)])} {value}")
+
+        for collect in collectors:
+            try:
+                for name, kind, help, value in collect():
+                    lines += [f"# HELP {name} {help}", f"# TYPE {name} {kind}", f"{name} {value}"]
+            except Exception:
+                logger.exception("collector metrik gagal")
+        return "\n".join(lines) + "\n"
+
+_registry = None
+
+def registry():
+    return _registry
+
+def enable():
+    """Pasang registry (idempoten)."""
+    global _registry
+    if _registry is None:
+        _registry = Registry()
+    return _registry
+
+def disable():
+    global _registry
+    _registry = None
+
+def observe_diagnosis(user_symptoms, kb, results, seconds):
+    """Catat satu diagnosa yang dijawab; `results` None (CF rendah) dihitung tanpa penyebab."""
+    if _registry is not None:
+        _registry.observe_diagnosis(user_symptoms, kb, results or (), seconds)
+
+def observe_batch(symptom_sets, kb, diagnosed, seconds):
+    """Catat hasil run_diagnosis_batch; latensi per diagnosa = durasi batch dibagi jumlahnya."""
+    if _registry is not None and symptom_sets:
+        each = seconds / len(symptom_sets)
+        for symptoms, (results, _) in zip(symptom_sets, diagnosed):
+            _registry.observe_diagnosis(symptoms, kb, results or (), each)
+
+def timed(histogram_name, label):
+    """Dekorator pengukur waktu; bila metrik mati fungsi asli dikembalikan apa adanya."""
+    def decorate(fn):
+        if _registry is None:
+            return fn
+        histogram = getattr(_registry, histogram_name)
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            t0 = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - t0
+                with _registry._lock:
+                    histogram.observe(elapsed, label)
+        return wrapper
+    return decorate
+
+def observe(histogram_name, seconds, label=None):
+    if _registry is not None:
+        with _registry._lock:
+            getattr(_registry, histogram_name).observe(seconds, label)
+
+def count(counter_name, label=None):
+    if _registry is not None:
+        with _registry._lock:
+            getattr(_registry, counter_name).inc(label)
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path != "/metrics":
+            self.send_error(404)
+            return
+        body = _registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def write_file(path):
+    tmp = f"{path}.tmp{os.getpid()}"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(_registry.render())
+    os.replace(tmp, path)
+
+def start_exporter(target, interval=15.0):
+    """target: port (HTTP di 127.0.0.1) atau path file .prom."""
+    enable()
+    if str(target).isdigit():
+        server = ThreadingHTTPServer(("127.0.0.1", int(target)), MetricsHandler)
+        threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+        logger.info("metrik tersedia di http://127.0.0.1:%s/metrics", target)
+        return server
+
+    def loop():
+        while True:
+            try:
+                write_file(target)
+            except OSError as e:
+                logger.warning("gagal menulis metrik ke %s: %s", target, e)
+            time.sleep(interval)
+
+    threading.Thread(target=loop, name="metrics-file", daemon=True).start()
+    return target
+
+def from_env():
+    """Aktifkan metrik sesuai PAKAR_METRICS; mengembalikan registry atau None."""
+    target = os.environ.get("PAKAR_METRICS")
+    if not target:
+        return None
+    start_exporter(target, float(os.environ.get("PAKAR_METRICS_INTERVAL", "15")))
+    return _registry
@@ -0,0 +1,182 @@
+"""Mode tanya jawab: sistem memilih gejala berikutnya yang paling membedakan penyebab.
+
+Selain gejala, kategori gejala juga bisa ditanyakan; jawaban "tidak" untuk
+kategori menggugurkan semua rule yang premisnya memuat gejala kategori itu.
+
+Setiap rule yang belum gugur dianggap satu hipotesis "rule inilah penjelasan
+kerusakannya", dengan bobot awal prior_cf x cf. Jawaban "tidak" untuk gejala s
+menggugurkan rule yang memuat s. Jawaban "ya" membuat rule yang tidak memuat s
+jauh kurang mungkin (gejala di luar premis dianggap muncul dengan peluang
+1/YES_BOOST); karena yang penting hanya perbandingan massa, ini sama dengan
+mengalikan bobot rule yang memuat s dengan YES_BOOST, sehingga hanya rule di
+indeks terbalik s yang disentuh.
+
+Peluang jawaban "ya" untuk gejala s kira-kira massa rule yang memuat s dibagi
+total massa; informasi jawaban (entropi biner) maksimal bila nilainya paling
+dekat dengan setengah.
+
+Massa per pertanyaan disimpan dalam list terurut dan hanya diperbarui untuk gejala
+di premis rule yang bobotnya berubah, sehingga memilih pertanyaan berikutnya
+cukup satu bisect, berapa pun ukuran KB.
+"""
+
+from bisect import bisect_left, insort
+
+from .engine import current_kb, rule_premises
+from .incremental import IncrementalDiagnosis
+from .kb import THRESHOLD_CF
+
+# Selisih CF minimum penyebab teratas terhadap peringkat kedua agar tanya jawab berhenti
+MARGIN = 0.1
+# Tanya jawab juga berhenti bila rule yang sudah menyala menguasai porsi massa ini
+EXPLAINED = 0.9
+# Faktor bobot rule yang premisnya memuat gejala yang dijawab "ya"
+YES_BOOST = 20.0
+# Massa di bawah ini dianggap nol (sisa pembulatan setelah banyak pengurangan)
+MASS_EPS = 1e-12
+
+# Pertanyaan kategori ("apakah masalahnya di Layar?") memakai kunci berawalan ini
+CATEGORY_PREFIX = "kategori:"
+
+def rule_weight(kb, i, evidence):
+    return kb.causes[kb.rule_cause[i]]["prior_cf"] * kb.rule_cf[i] * YES_BOOST ** evidence
+
+def question_index(kb):
+    """Pertanyaan yang menyentuh tiap rule (gejala premis + kategorinya) dan kebalikannya."""
+    premises = kb.derived("rule_premises", rule_premises)
+    rule_questions = []
+    question_rules = {}
+    for i, premise in enumerate(premises):
+        categories = {kb.symptoms[code].get("category") for code in premise if code in kb.symptoms}
+        keys = list(premise) + sorted(CATEGORY_PREFIX + cat for cat in categories if cat)
+        rule_questions.append(keys)
+        for key in keys:
+            question_rules.setdefault(key, []).append(i)
+    return rule_questions, question_rules
+
+def initial_mass(kb):
+    # Massa awal per pertanyaan (belum ada jawaban); dihitung sekali per KB
+    rule_questions, _ = kb.derived("question_index", question_index)
+    mass = {}
+    total = 0.0
+    for i, keys in enumerate(rule_questions):
+        if not keys:
+            continue
+        weight = rule_weight(kb, i, 0)
+        total += weight
+        for key in keys:
+            mass[key] = mass.get(key, 0.0) + weight
+    return mass, sorted((m, key) for key, m in mass.items()), total
+
+class GuidedQuestioning:
+    """Status satu sesi tanya jawab; jawaban gejala diteruskan ke IncrementalDiagnosis."""
+
+    def __init__(self, kb=None, threshold=THRESHOLD_CF, margin=MARGIN, explained=EXPLAINED):
+        self.kb = kb or current_kb()
+        self.threshold = threshold
+        self.margin = margin
+        self.explained = explained
+        self.answers = {}
+        self.diagnosis = IncrementalDiagnosis(self.kb)
+        self._premises = self.kb.derived("rule_premises", rule_premises)
+        self._rule_questions, self._question_rules = self.kb.derived("question_index", question_index)
+        mass, ordered, self._total = self.kb.derived("question_mass", initial_mass)
+        self._mass = dict(mass)
+        self._ordered = list(ordered)
+        self._evidence = {}
+        self._hits = {}
+        self._dead = set()
+        self._fired = set()
+        self._fired_mass = 0.0
+
+    def _set_mass(self, code, value):
+        old = self._mass[code]
+        del self._ordered[bisect_left(self._ordered, (old, code))]
+        self._mass[code] = value
+        insort(self._ordered, (value, code))
+
+    def _forget(self, code):
+        # Gejala yang sudah ditanyakan tidak lagi menjadi kandidat pertanyaan
+        mass = self._mass.pop(code, None)
+        if mass is not None:
+            del self._ordered[bisect_left(self._ordered, (mass, code))]
+
+    def _reweight(self, i, new_weight, deltas):
+        delta = new_weight - rule_weight(self.kb, i, self._evidence.get(i, 0))
+        self._total += delta
+        if i in self._fired:
+            self._fired_mass += delta
+        for key in self._rule_questions[i]:
+            deltas[key] = deltas.get(key, 0.0) + delta
+
+    def answer(self, key, present):
+        """Catat jawaban ya/tidak untuk gejala atau kategori; None berarti dilewati."""
+        if key in self.answers:
+            return
+        self.answers[key] = present
+        self._forget(key)
+        if present is None:
+            return
+        is_symptom = not key.startswith(CATEGORY_PREFIX)
+        # Perubahan massa dikumpulkan dulu agar list terurut diubah sekali per pertanyaan
+        deltas = {}
+        for i in self._question_rules.get(key, ()):
+            if i in self._dead:
+                continue
+            if not present:
+                self._reweight(i, 0.0, deltas)
+                self._dead.add(i)
+                continue
+            evidence = self._evidence.get(i, 0) + 1
+            self._reweight(i, rule_weight(self.kb, i, evidence), deltas)
+            self._evidence[i] = evidence
+            if is_symptom:
+                hits = self._hits[i] = self._hits.get(i, 0) + 1
+                if hits == len(self._premises[i]):
+                    # Rule menyala tidak bisa gugur lagi (semua premisnya sudah dijawab "ya")
+                    self._fired.add(i)
+                    self._fired_mass += rule_weight(self.kb, i, evidence)
+        for other, delta in deltas.items():
+            if other in self._mass:
+                self._set_mass(other, self._mass[other] + delta)
+        if present and is_symptom:
+            self.diagnosis.add(key)
+
+    def next_question(self):
+        """Kunci pertanyaan berikutnya (kode gejala atau kategori), atau None bila habis."""
+        ordered = self._ordered
+        pos = bisect_left(ordered, (self._total / 2, ""))
+        best = None
+        for j in (pos - 1, pos):
+            if 0 <= j < len(ordered) and ordered[j][0] > MASS_EPS:
+                gap = abs(ordered[j][0] - self._total / 2)
+                if best is None or gap < best[0]:
+                    best = (gap, ordered[j][1])
+        return best[1] if best else None
+
+    def top(self, k=3):
+        return self.diagnosis.top(k, self.threshold)
+
+    def done(self):
+        """Penyebab teratas lolos threshold dengan selisih jelas, atau pertanyaan habis.
+
+        "Jelas" berarti unggul minimal `margin` dari peringkat kedua, atau rule yang
+        sudah menyala menjelaskan minimal `explained` dari massa hipotesis, sehingga
+        jawaban berikutnya hampir pasti tidak mengubah hasil.
+        """
+        top = self.top(2)
+        if top:
+            if len(top) == 1 or top[0][1] - top[1][1] >= self.margin:
+                return True
+            if self._total > 0 and self._fired_mass / self._total >= self.explained:
+                return True
+        return self.next_question() is None
+
+    def confirmed(self):
+        """Gejala yang dijawab "ya", dalam urutan ditanyakan."""
+        return [key for key, present in self.answers.items() if present and not key.startswith(CATEGORY_PREFIX)]
+
+    def question_text(self, key):
+        if key.startswith(CATEGORY_PREFIX):
+            return f"Apakah kerusakan berkaitan dengan {key[len(CATEGORY_PREFIX):]}?"
+        return self.kb.symptoms.get(key, {}).get("text", key)
@@ -0,0 +1,108 @@
+"""Diagnosa ulang riwayat tersimpan terhadap versi KB lain, paralel dan bisa dilanjutkan.
+
+    python -m pakar rescore --db riwayat.db --kb kb_baru.json --workers 8
+    python -m pakar rescore-report --db riwayat.db --kb kb_baru.json
+
+Riwayat dibaca urut id dalam potongan; setiap potongan didiagnosa di process pool
+lewat mesin batch NumPy lalu disimpan ke tabel ``rescored`` dalam satu
+transaksi, berurutan. Karena itu id terbesar di ``rescored`` untuk versi KB
+tersebut adalah titik lanjut yang aman bila job terhenti di tengah jalan.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .engine import current_kb, use_kb
+from .history import HistoryStore
+from .loader import load_kb
+
+CHUNK_SIZE = 10_000
+
+def init_worker(kb_path):
+    # Setiap proses memuat KB sendiri dari file; objek KB terkompilasi tidak dikirim lewat pickle
+    if kb_path:
+        use_kb(load_kb(kb_path))
+
+def score_chunk(chunk, kb=None):
+    """[(history_id, gejala)] -> [(history_id, cause, cause_name, confidence, level)] dengan `kb` atau KB proses ini."""
+    from .batch import batch_for, run_diagnosis_batch
+
+    kb = kb or current_kb()
+    out = []
+    sets = [symptoms for _, symptoms in chunk]
+    for (id_, _), (top, _) in zip(chunk, run_diagnosis_batch(sets, k=1, batch=batch_for(kb))):
+        if top:
+            cause_id, cf = top[0]
+            cause = kb.causes[cause_id]
+            out.append((id_, cause_id, cause["name"], cf, cause["level"]))
+        else:
+            out.append((id_, "", "", 0.0, ""))
+    return out
+
+def chunks(store, after, chunk_size):
+    while True:
+        chunk = store.symptom_chunk(after, chunk_size)
+        if not chunk:
+            return
+        yield chunk
+        after = chunk[-1][0]
+
+def rescore(db_path, kb_path=None, workers=None, chunk_size=CHUNK_SIZE, progress=None):
+    """Diagnosa ulang semua entri riwayat yang belum punya hasil untuk KB ini.
+
+    Mengembalikan (versi KB, jumlah entri yang diproses pada pemanggilan ini).
+    `progress(n_done, last_id)` dipanggil setelah setiap potongan tersimpan.
+    """
+    kb = load_kb(kb_path) if kb_path else current_kb()
+    store = HistoryStore(db_path)
+    workers = workers or os.cpu_count() or 1
+    done = 0
+    try:
+        pending = chunks(store, store.last_rescored(kb.version), chunk_size)
+        if workers == 1:
+            # Di proses ini KB yang sudah dimuat dipakai langsung; KB global (mis. milik UI) tidak diganti
+            for rows in (score_chunk(chunk, kb) for chunk in pending):
+                store.save_rescored(kb.version, rows)
+                done += len(rows)
+                if progress:
+                    progress(done, rows[-1][0])
+            return kb.version, done
+
+        with ProcessPoolExecutor(workers, initializer=init_worker, initargs=(kb_path,)) as pool:
+            # Maksimal 2 potongan per worker sedang berjalan; hasil disimpan sesuai urutan id
+            in_flight = deque()
+            for chunk in pending:
+                in_flight.append(pool.submit(score_chunk, chunk))
+                if len(in_flight) >= 2 * workers:
+                    done += save_next(store, kb.version, in_flight, progress, done)
+            while in_flight:
+                done += save_next(store, kb.version, in_flight, progress, done)
+        return kb.version, done
+    finally:
+        store.close()
+
+def save_next(store, kb_version, in_flight, progress, done):
+    rows = in_flight.popleft().result()
+    store.save_rescored(kb_version, rows)
+    if progress:
+        progress(done + len(rows), rows[-1][0])
+    return len(rows)
+
+def diff_report(db_path, kb_version, limit=20):
+    store = HistoryStore(db_path)
+    try:
+        return store.rescore_diff(kb_version, limit)
+    finally:
+        store.close()
+
+def format_report(report):
+    lines = [
+        f"KB {report['kb_version']}: {report['rescored']} entri didiagnosa ulang, "
+        f"{report['changed']} penyebab teratas berubah",
+        f"rata-rata perubahan CF (penyebab tetap): {report['unchanged_cf_delta']:+.3f}",
+    ]
+    for t in report["transitions"]:
+        new = f"{t['to']} {t['to_name']}" if t["to"] else "(di bawah threshold)"
+        lines.append(f"{t['count']:>8}  {t['from']} {t['from_name']} -> {new}  (CF {t['cf_delta']:+.3f})")
+    return "\n".join(lines)
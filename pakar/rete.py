@@ -0,0 +1,101 @@
+"""Matcher gaya Rete: jaringan node kondisi bersama yang dikompilasi dari RULES.
+
+Premis tiap rule diurutkan (gejala paling sering dipakai lebih dulu) lalu
+dimasukkan ke trie; node = join "semua gejala di prefiks ini terpilih", sehingga
+rule dengan awalan premis yang sama (mis. G051 di beberapa rule thermal/GPU)
+berbagi node yang sama. Setiap gejala punya alpha memory berupa daftar node
+yang mengujinya. Menambah gejala hanya mengaktifkan node di alpha memory-nya
+yang induknya sudah aktif, lalu merambat ke anak yang gejalanya sudah terpilih;
+menghapus gejala menonaktifkan node itu beserta turunannya yang aktif.
+"""
+
+from .engine import current_kb, rule_premises
+from .incremental import IncrementalDiagnosis
+
+class ReteNetwork:
+    """Jaringan node (tidak berubah) untuk satu KB; dipakai bersama semua sesi."""
+
+    def __init__(self, kb):
+        usage = {code: len(rules) for code, rules in kb.symptom_rules.items()}
+        order = lambda code: (-usage[code], code)  # noqa: E731
+
+        self.node_symptom = []
+        self.node_parent = []
+        self.node_children = []
+        self.node_rules = []
+        self.alpha = {}
+        self.conditions = 0
+        edges = {}
+        for i, premise in enumerate(kb.derived("rule_premises", rule_premises)):
+            parent = -1
+            for code in sorted(premise, key=order):
+                self.conditions += 1
+                node = edges.get((parent, code))
+                if node is None:
+                    node = edges[parent, code] = len(self.node_symptom)
+                    self.node_symptom.append(code)
+                    self.node_parent.append(parent)
+                    self.node_children.append([])
+                    self.node_rules.append([])
+                    self.alpha.setdefault(code, []).append(node)
+                    if parent >= 0:
+                        self.node_children[parent].append(node)
+                parent = node
+            if parent >= 0:
+                self.node_rules[parent].append(i)
+
+    def __len__(self):
+        return len(self.node_symptom)
+
+def rete_network(kb):
+    return kb.derived("rete_network", ReteNetwork)
+
+class ReteDiagnosis(IncrementalDiagnosis):
+    """IncrementalDiagnosis dengan pencocokan lewat jaringan Rete, bukan hitungan premis."""
+
+    def __init__(self, kb=None):
+        kb = kb or current_kb()
+        self.network = rete_network(kb)
+        self._active = set()
+        super().__init__(kb)
+
+    def add(self, code):
+        if code in self.selected:
+            return set()
+        self.selected.add(code)
+        net, active, selected = self.network, self._active, self.selected
+        parents = net.node_parent
+        stack = [n for n in net.alpha.get(code, ()) if parents[n] < 0 or parents[n] in active]
+        changed = set()
+        while stack:
+            node = stack.pop()
+            active.add(node)
+            for i in net.node_rules[node]:
+                self._fire(i)
+                changed.add(self.kb.rule_cause[i])
+            for child in net.node_children[node]:
+                if net.node_symptom[child] in selected:
+                    stack.append(child)
+        for cause_id in changed:
+            self._recompute(cause_id)
+        return changed
+
+    def remove(self, code):
+        if code not in self.selected:
+            return set()
+        self.selected.discard(code)
+        net, active = self.network, self._active
+        stack = [n for n in net.alpha.get(code, ()) if n in active]
+        changed = set()
+        while stack:
+            node = stack.pop()
+            active.discard(node)
+            for i in net.node_rules[node]:
+                self._unfire(i)
+                changed.add(self.kb.rule_cause[i])
+            for child in net.node_children[node]:
+                if child in active:
+                    stack.append(child)
+        for cause_id in changed:
+            self._recompute(cause_id)
+        return changed
@@ -0,0 +1,81 @@
+"""Rollup statistik riwayat untuk dasbor: per hari, per penyebab, per level, per kategori.
+
+Setiap entri baru menambah beberapa counter (O(1)); dasbor membaca counter ini,
+bukan memindai tabel riwayat. Di SQLite rollup disimpan di tabel ``rollup``
+(kind, key) dan diperbarui dalam transaksi yang sama dengan INSERT riwayat,
+sehingga keduanya tidak pernah selisih. ``Rollups.from_rows`` membangun ulang
+semuanya dari riwayat dalam satu kali baca berurutan.
+"""
+
+from datetime import date, datetime, timedelta
+
+# Jenis rollup: kunci tiap jenis diambil dari satu kolom entri
+KINDS = ("day", "cause", "level", "category")
+
+def day_key(ts):
+    return datetime.fromtimestamp(ts).date().isoformat()
+
+class Rollups:
+    """Counter (jumlah, total CF) per (jenis, kunci)."""
+
+    def __init__(self):
+        self.counts = {kind: {} for kind in KINDS}
+
+    def record(self, ts, cause, confidence, level, category):
+        for kind, key in (("day", day_key(ts)), ("cause", cause), ("level", level), ("category", category)):
+            bucket = self.counts[kind]
+            count, total = bucket.get(key, (0, 0.0))
+            bucket[key] = (count + 1, total + confidence)
+
+    def merge(self, other):
+        for kind, bucket in other.counts.items():
+            mine = self.counts[kind]
+            for key, (count, total) in bucket.items():
+                old_count, old_total = mine.get(key, (0, 0.0))
+                mine[key] = (old_count + count, old_total + total)
+
+    def rows(self):
+        """(kind, key, jumlah, total CF) untuk disimpan ke tabel rollup."""
+        return [(kind, key, count, total) for kind, bucket in self.counts.items()
+                for key, (count, total) in bucket.items()]
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Bangun dari (ts, cause, confidence, level, category) dalam satu kali iterasi."""
+        rollups = cls()
+        for ts, cause, confidence, level, category in rows:
+            rollups.record(ts, cause, confidence, level, category)
+        return rollups
+
+    @classmethod
+    def from_table(cls, rows):
+        rollups = cls()
+        for kind, key, count, total in rows:
+            rollups.counts[kind][key] = (count, total)
+        return rollups
+
+    def total(self):
+        return sum(count for count, _ in self.counts["level"].values())
+
+    def mean_confidence(self):
+        count = self.total()
+        return sum(total for _, total in self.counts["level"].values()) / count if count else None
+
+    def per_day(self, days=14, today=None):
+        """Jumlah diagnosa untuk `days` hari terakhir (termasuk hari tanpa diagnosa), urut tanggal."""
+        today = today or date.today()
+        bucket = self.counts["day"]
+        out = []
+        for offset in range(days - 1, -1, -1):
+            key = (today - timedelta(days=offset)).isoformat()
+            out.append((key, bucket.get(key, (0, 0.0))[0]))
+        return out
+
+    def top(self, kind, k=3):
+        """(kunci, jumlah) terbanyak untuk satu jenis rollup."""
+        items = sorted(self.counts[kind].items(), key=lambda x: (-x[1][0], x[0]))
+        return [(key, count) for key, (count, _) in items[:k]]
+
+    def mean_by(self, kind):
+        """{kunci: rata-rata CF} untuk satu jenis rollup."""
+        return {key: total / count for key, (count, total) in self.counts[kind].items() if count}
@@ -0,0 +1,116 @@
+"""Pencarian gejala toleran salah ketik lewat indeks trigram dan prefiks.
+
+Indeks dibangun sekali per versi KB (``symptom_index(kb)``) atas kosakata teks
+gejala, bukan atas gejala itu sendiri: setiap kata unik punya himpunan trigram
+dan daftar gejala yang memuatnya. Query dipecah per kata; tiap kata dicocokkan
+ke kosakata lewat
+
+- prefiks (list kata terurut + bisect), agar hasil muncul sejak huruf pertama
+- kemiripan trigram (koefisien Dice), agar salah ketik seperti "baterai"/"batrai"
+  tetap ketemu
+
+Skor gejala = rata-rata skor kata query terbaiknya, sehingga gejala yang
+memuat semua kata query berada di atas. Akumulasi skor per gejala memakai array
+NumPy agar kata umum ("tidak", "laptop") yang dimuat ribuan gejala tetap murah. Kode gejala ("G038", "g03") dicocokkan
+langsung sebagai prefiks.
+"""
+
+import re
+import unicodedata
+from bisect import bisect_left
+
+import numpy as np
+
+# Kemiripan trigram minimum agar sebuah kata kosakata dianggap cocok
+MIN_SIMILARITY = 0.35
+# Batas jumlah kata kosakata yang diambil per prefiks (query satu huruf)
+PREFIX_LIMIT = 200
+
+def normalize(text):
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    return re.sub(r"[^a-z0-9]+", " ", text.lower()).strip()
+
+def trigrams(word):
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class SymptomIndex:
+    """Indeks kosakata teks gejala; tidak berubah setelah dibangun, dipakai bersama semua sesi."""
+
+    def __init__(self, kb):
+        self.codes = list(kb.symptoms)
+        code_keys = sorted((code.lower(), i) for i, code in enumerate(self.codes))
+        self._code_keys = [key for key, _ in code_keys]
+        self._code_symptoms = np.array([i for _, i in code_keys], dtype=np.int64)
+        self._code_lengths = np.array([len(key) for key in self._code_keys], dtype=np.float64)
+        word_symptoms = {}
+        for i, code in enumerate(self.codes):
+            # Nama kategori ikut diindeks: "layar bergaris" menemukan gejala Layar tentang garis
+            data = kb.symptoms[code]
+            for word in set(normalize(f"{data.get('text', '')} {data.get('category', '')}").split()):
+                word_symptoms.setdefault(word, []).append(i)
+        self.words = sorted(word_symptoms)
+        # Gejala per kata dalam bentuk CSR: word_symptoms[word_ptr[w]:word_ptr[w + 1]]
+        lengths = [len(word_symptoms[word]) for word in self.words]
+        self.word_ptr = np.concatenate(([0], np.cumsum(lengths))).astype(np.int64)
+        self.word_symptoms = np.array([i for word in self.words for i in word_symptoms[word]], dtype=np.int64)
+        self.word_grams = np.array([len(trigrams(word)) for word in self.words], dtype=np.float64)
+        self.word_lengths = np.array([len(word) for word in self.words], dtype=np.float64)
+        gram_words = {}
+        for w, word in enumerate(self.words):
+            for gram in trigrams(word):
+                gram_words.setdefault(gram, []).append(w)
+        self.gram_words = {gram: np.array(words, dtype=np.int64) for gram, words in gram_words.items()}
+
+    def _word_scores(self, term):
+        """Skor 0..1 untuk setiap kata kosakata (array sepanjang kosakata, 0 = tidak cocok)."""
+        grams = trigrams(term)
+        found = [self.gram_words[gram] for gram in grams if gram in self.gram_words]
+        # Trigram bersama per kata dihitung sekaligus; trigram umum ("  g") bisa dimuat ribuan kata
+        shared = np.bincount(np.concatenate(found), minlength=len(self.words)) if found else 0
+        scores = 2 * shared / (len(grams) + self.word_grams)
+        scores[scores < MIN_SIMILARITY] = 0.0
+        # Kata berawalan `term` adalah satu rentang di list terurut; kosakata hanya [a-z0-9] sehingga "{" menutupnya
+        w = bisect_left(self.words, term)
+        end = min(bisect_left(self.words, term + "{", w), w + PREFIX_LIMIT)
+        # Prefiks yang sedang diketik: makin lengkap makin tinggi, kata utuh = 1
+        np.maximum(scores[w:end], 0.7 + 0.3 * len(term) / self.word_lengths[w:end], out=scores[w:end])
+        return scores
+
+    def search(self, query, limit=10):
+        """Kode gejala terurut dari kecocokan terbaik: list (kode, skor)."""
+        terms = normalize(query).split()
+        if not terms:
+            return []
+        totals = np.zeros(len(self.codes))
+        for term in terms:
+            best = np.zeros(len(self.codes))
+            scores = self._word_scores(term)
+            matched = np.flatnonzero(scores)
+            if len(matched):
+                # Baris CSR semua kata yang cocok dikumpulkan sekaligus, lalu skor maksimum per gejala
+                starts = self.word_ptr[matched]
+                lengths = self.word_ptr[matched + 1] - starts
+                flat = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+                np.maximum.at(best, self.word_symptoms[flat], np.repeat(scores[matched], lengths))
+            totals += best
+        if len(terms) == 1:
+            term = terms[0]
+            # Kode gejala diketik langsung: prefiks kode mengalahkan kecocokan teks
+            # Rentang prefiks lewat bisect, dibatasi seperti prefiks kata ("g" cocok dengan semua kode)
+            keys = self._code_keys
+            j = bisect_left(keys, term)
+            end = min(bisect_left(keys, term + "\U0010ffff", j), j + PREFIX_LIMIT)
+            codes = self._code_symptoms[j:end]
+            totals[codes] = np.maximum(totals[codes], 1.0 + len(term) / self._code_lengths[j:end])
+        hits = np.flatnonzero(totals)
+        if len(hits) > limit:
+            # Semua yang seri dengan skor ke-`limit` ikut dipertahankan agar urutan deterministik
+            kth = np.partition(totals[hits], len(hits) - limit)[len(hits) - limit]
+            hits = hits[totals[hits] >= kth]
+        # Skor sama diurutkan menurut posisi gejala di katalog
+        hits = hits[np.lexsort((hits, -totals[hits]))][:limit]
+        return [(self.codes[i], float(totals[i]) / len(terms)) for i in hits]
+
+def symptom_index(kb):
+    return kb.derived("symptom_search", SymptomIndex)
@@ -0,0 +1,198 @@
+"""Layanan JSON (ASGI) untuk kiosk dan sistem tiket, terpisah dari UI Streamlit.
+
+    uvicorn pakar.service:app --host 0.0.0.0 --port 8000
+
+Endpoint:
+
+- ``GET  /health``            versi KB aktif dan statistik cache
+- ``GET  /symptoms``          katalog gejala
+- ``GET  /causes/{id}``       detail penyebab (deskripsi, solusi, level)
+- ``POST /diagnose``          ``{"symptoms": [...], "k": 3, "threshold": 0.4, "partial": false}``
+- ``POST /diagnose/batch``    ``{"items": [{"id": ..., "symptoms": [...]}, ...]}``
+- ``GET  /metrics``           metrik Prometheus (hanya bila ``PAKAR_METRICS`` di-set)
+
+KB yang dipakai sama dengan UI: ``current_kb()``, atau file ``PAKAR_KB_FILE`` yang
+dipantau KnowledgeBaseWatcher. Diagnosa tunggal hanya butuh mikrodetik sehingga
+dijalankan langsung di event loop; batch besar dipindah ke thread pool agar
+request lain tidak tertahan.
+"""
+
+import json
+import os
+import time
+from contextlib import asynccontextmanager
+
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from . import metrics
+from .cache import DiagnosisCache
+from .engine import current_kb, run_diagnosis
+from .kb import THRESHOLD_CF
+from .loader import KnowledgeBaseWatcher
+
+# Batch sampai ukuran ini dihitung di event loop, di atasnya lewat mesin NumPy di thread
+BATCH_INLINE = 64
+MAX_BATCH = 10_000
+
+diagnosis_cache = DiagnosisCache(maxsize=4096)
+
+class BadRequest(Exception):
+    pass
+
+def error(status, message):
+    return JSONResponse({"error": message}, status_code=status)
+
+def json_bytes(payload):
+    return Response(json.dumps(payload, ensure_ascii=False).encode("utf-8"), media_type="application/json")
+
+def parse_symptoms(value):
+    if not isinstance(value, list) or not all(isinstance(s, str) for s in value):
+        raise BadRequest("symptoms harus berupa list kode gejala")
+    return value
+
+def parse_options(body):
+    k = body.get("k", 3)
+    threshold = body.get("threshold", THRESHOLD_CF)
+    if not isinstance(k, int) or isinstance(k, bool) or not 1 <= k <= 50:
+        raise BadRequest("k harus bilangan bulat 1..50")
+    if not isinstance(threshold, (int, float)) or isinstance(threshold, bool) or not 0 <= threshold <= 1:
+        raise BadRequest("threshold harus di antara 0 dan 1")
+    partial = body.get("partial", False)
+    if not isinstance(partial, bool):
+        raise BadRequest("partial harus boolean")
+    return k, threshold, partial
+
+async def read_json(request):
+    try:
+        body = json.loads(await request.body())
+    except ValueError:
+        raise BadRequest("body bukan JSON yang valid") from None
+    if not isinstance(body, dict):
+        raise BadRequest("body harus berupa objek JSON")
+    return body
+
+def result_payload(symptoms, results, status, kb, record_id=None):
+    out = {"symptoms": symptoms, "status": status, "results": [
+        {"cause": cause_id, "name": kb.causes[cause_id]["name"], "cf": cf} for cause_id, cf in results or []
+    ]}
+    if record_id is not None:
+        out = {"id": record_id, **out}
+    return out
+
+def diagnose_one(symptoms, kb, k, threshold, partial):
+    # Cache hanya berlaku untuk opsi bawaan, sama seperti yang dipakai UI
+    if k == 3 and threshold == THRESHOLD_CF and not partial:
+        return diagnosis_cache.diagnose(symptoms, kb)
+    t0 = time.perf_counter()
+    diagnosed = run_diagnosis(symptoms, kb, k, threshold, partial)
+    metrics.observe_diagnosis(symptoms, kb, diagnosed[0], time.perf_counter() - t0)
+    return diagnosed
+
+def diagnose_many(symptom_sets, kb, k, threshold, partial):
+    if len(symptom_sets) <= BATCH_INLINE:
+        return [diagnose_one(symptoms, kb, k, threshold, partial) for symptoms in symptom_sets]
+    from .batch import batch_for, run_diagnosis_batch
+    t0 = time.perf_counter()
+    diagnosed = run_diagnosis_batch(symptom_sets, k, threshold, batch=batch_for(kb), partial=partial)
+    metrics.observe_batch(symptom_sets, kb, diagnosed, time.perf_counter() - t0)
+    return diagnosed
+
+async def health(request):
+    return JSONResponse({"status": "ok", "kb_version": current_kb().version, "cache": diagnosis_cache.stats()})
+
+async def metrics_endpoint(request):
+    registry = metrics.registry()
+    if registry is None:
+        return JSONResponse({"error": "metrik tidak aktif"}, status_code=404)
+    body = await run_in_threadpool(registry.render)
+    return Response(body, media_type="text/plain; version=0.0.4; charset=utf-8")
+
+def build_symptom_payload(kb):
+    return json.dumps({"kb_version": kb.version, "symptoms": [
+        {"code": code, "text": data["text"], "category": data.get("category")} for code, data in kb.symptoms.items()
+    ]}, ensure_ascii=False).encode("utf-8")
+
+async def symptoms(request):
+    # Katalog diserialisasi sekali per versi KB
+    return Response(current_kb().derived("service_symptoms", build_symptom_payload), media_type="application/json")
+
+async def cause_detail(request):
+    kb = current_kb()
+    cause_id = request.path_params["cause_id"]
+    cause = kb.causes.get(cause_id)
+    if cause is None:
+        return error(404, f"penyebab {cause_id} tidak ada")
+    return json_bytes({"cause": cause_id, "kb_version": kb.version, **cause})
+
+async def diagnose(request):
+    try:
+        body = await read_json(request)
+        symptoms = parse_symptoms(body.get("symptoms"))
+        k, threshold, partial = parse_options(body)
+    except BadRequest as e:
+        return error(400, str(e))
+    kb = current_kb()
+    results, status = diagnose_one(symptoms, kb, k, threshold, partial)
+    return json_bytes({"kb_version": kb.version, **result_payload(symptoms, results, status, kb)})
+
+async def diagnose_batch(request):
+    try:
+        body = await read_json(request)
+        items = body.get("items")
+        if not isinstance(items, list):
+            raise BadRequest("items harus berupa list")
+        if len(items) > MAX_BATCH:
+            return error(413, f"maksimal {MAX_BATCH} item per batch")
+        ids, symptom_sets = [], []
+        for n, item in enumerate(items):
+            if isinstance(item, dict):
+                ids.append(item.get("id"))
+                item = item.get("symptoms")
+            else:
+                ids.append(None)
+            try:
+                symptom_sets.append(parse_symptoms(item))
+            except BadRequest as e:
+                raise BadRequest(f"items[{n}]: {e}") from None
+        k, threshold, partial = parse_options(body)
+    except BadRequest as e:
+        return error(400, str(e))
+
+    kb = current_kb()
+    if len(symptom_sets) <= BATCH_INLINE:
+        diagnosed = diagnose_many(symptom_sets, kb, k, threshold, partial)
+    else:
+        diagnosed = await run_in_threadpool(diagnose_many, symptom_sets, kb, k, threshold, partial)
+    return json_bytes({"kb_version": kb.version, "results": [
+        result_payload(symptoms, results, status, kb, record_id)
+        for record_id, symptoms, (results, status) in zip(ids, symptom_sets, diagnosed)
+    ]})
+
+@asynccontextmanager
+async def lifespan(app):
+    # KB eksternal yang sama dengan UI (PAKAR_KB_FILE), dimuat ulang otomatis
+    path = os.environ.get("PAKAR_KB_FILE")
+    watcher = KnowledgeBaseWatcher(path).start() if path else None
+    # Metrik disajikan lewat /metrics layanan ini sendiri, bukan port/file terpisah
+    if os.environ.get("PAKAR_METRICS"):
+        metrics.enable()
+    try:
+        yield
+    finally:
+        if watcher is not None:
+            watcher.stop()
+
+app = Starlette(
+    routes=[
+        Route("/health", health),
+        Route("/metrics", metrics_endpoint),
+        Route("/symptoms", symptoms),
+        Route("/causes/{cause_id}", cause_detail),
+        Route("/diagnose", diagnose, methods=["POST"]),
+        Route("/diagnose/batch", diagnose_batch, methods=["POST"]),
+    ],
+    lifespan=lifespan,
+)
@@ -0,0 +1,59 @@
+"""Status diagnosa ringkas untuk URL yang bisa dibagikan.
+
+Gejala yang dipilih disimpan sebagai bitset atas urutan SYMPTOMS di KB (bit ke-i
+= gejala ke-i, byte little-endian, nol di ujung dibuang) lalu di-encode
+base64url tanpa padding, misalnya ``?g=AAAAAEA&kb=3f2a9c1b7d4e``. Parameter
+``kb`` adalah versi KB yang dipakai saat encode: posisi bit hanya bermakna untuk
+urutan gejala KB tersebut, jadi tautan dari versi lain ditolak, bukan
+ditafsirkan menjadi gejala yang salah. Tidak ada data yang disimpan di server;
+hasil dihitung ulang dari gejala lewat engine (dan cache-nya).
+"""
+
+import base64
+import binascii
+
+SYMPTOMS_PARAM = "g"
+VERSION_PARAM = "kb"
+PARAMS = (SYMPTOMS_PARAM, VERSION_PARAM)
+
+def encode_symptoms(symptoms, kb):
+    """Token base64url untuk kode gejala; kode yang tidak ada di katalog KB diabaikan."""
+    mask = 0
+    bits = kb.symptom_bits
+    for code in symptoms:
+        if code in kb.symptoms:
+            mask |= bits[code]
+    raw = mask.to_bytes((mask.bit_length() + 7) // 8, "little")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+def decode_symptoms(token, kb):
+    """Kode gejala dari token, dalam urutan katalog KB; ValueError bila token tidak valid."""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+    except (binascii.Error, ValueError):
+        raise ValueError("kode gejala di tautan rusak") from None
+    mask = int.from_bytes(raw, "little")
+    if mask >> len(kb.symptoms):
+        raise ValueError("tautan memuat gejala yang tidak ada di basis pengetahuan")
+    codes = kb.derived("share_codes", lambda kb: list(kb.symptoms))
+    symptoms = []
+    while mask:
+        low = mask & -mask
+        symptoms.append(codes[low.bit_length() - 1])
+        mask ^= low
+    return symptoms
+
+def result_params(symptoms, kb):
+    return {SYMPTOMS_PARAM: encode_symptoms(symptoms, kb), VERSION_PARAM: kb.version}
+
+def symptoms_from_params(params, kb):
+    """Gejala dari parameter URL, atau None bila tidak ada tautan hasil; ValueError bila tidak cocok."""
+    token = params.get(SYMPTOMS_PARAM)
+    if token is None:
+        return None
+    if params.get(VERSION_PARAM) != kb.version:
+        raise ValueError("tautan dibuat dengan versi basis pengetahuan lain")
+    symptoms = decode_symptoms(token, kb)
+    if not symptoms:
+        raise ValueError("tautan tidak memuat gejala")
+    return symptoms
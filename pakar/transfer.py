@@ -0,0 +1,289 @@
+"""Ekspor/impor riwayat diagnosa ke CSV, JSONL, atau Parquet, berpotongan.
+
+    python -m pakar export-history --db riwayat.db riwayat.parquet
+    python -m pakar import-history --db gudang.db riwayat.parquet
+
+Format dipilih dari ekstensi file (``.csv``, ``.jsonl``, ``.parquet``) atau
+``--format``. Riwayat dibaca dan ditulis per potongan berukuran tetap (urut id
+untuk ekspor, satu transaksi per potongan untuk impor), sehingga memori tetap
+konstan berapa pun jumlah barisnya; di Parquet setiap potongan menjadi satu row
+group. Parquet membutuhkan ``pyarrow`` (opsional, tidak ada di requirements.txt).
+
+Setiap record memuat daftar lengkap kode gejala dan versi KB yang dipakai saat
+diagnosa. ``timestamp`` ditulis sebagai ISO 8601 UTC (CSV/JSONL) atau kolom
+timestamp UTC (Parquet). Saat impor, ``id`` diabaikan: entri mendapat id baru
+sehingga file bisa digabungkan ke riwayat yang sudah berisi.
+"""
+
+import csv
+import json
+import os
+from datetime import datetime, timezone
+from itertools import islice
+
+from .history import HistoryStore
+
+FIELDS = ("id", "timestamp", "cause", "cause_name", "confidence", "level", "category", "symptoms",
+          "symptoms_text", "kb_version")
+# Urutan field baris HistoryStore.add_many
+IMPORT_FIELDS = ("timestamp", "cause", "cause_name", "confidence", "level", "symptoms", "symptoms_text", "category",
+                 "kb_version")
+FORMATS = ("csv", "jsonl", "parquet")
+CHUNK_SIZE = 10_000
+
+class HistoryFileError(ValueError):
+    """File riwayat tidak bisa dibaca atau sebuah record tidak valid."""
+
+    def __init__(self, path, problem, line=None):
+        self.path = path
+        self.line = line
+        where = f"{path}:{line}" if line is not None else str(path)
+        super().__init__(f"{where}: {problem}")
+
+def detect_format(path, fmt=None):
+    fmt = fmt or os.path.splitext(str(path))[1].lstrip(".").lower()
+    if fmt not in FORMATS:
+        raise HistoryFileError(path, f"format tidak dikenal; gunakan {', '.join(FORMATS)} atau --format")
+    return fmt
+
+def iso_timestamp(ts):
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat()
+
+def parse_timestamp(value):
+    # Tanpa zona waktu dianggap waktu lokal, sama seperti entri yang ditulis aplikasi
+    return datetime.fromisoformat(value).timestamp()
+
+def import_row(get):
+    """Baris untuk HistoryStore.add_many dari pengambil field `get(nama, default)`."""
+    return (
+        parse_timestamp(get("timestamp")),
+        get("cause"),
+        optional_text(get("cause_name")),
+        float(get("confidence")),
+        get("level"),
+        get("symptoms"),
+        optional_text(get("symptoms_text")),
+        optional_text(get("category")),
+        optional_text(get("kb_version")),
+    )
+
+def optional_text(value):
+    # Field opsional boleh tidak ada atau null; nilai lain tetap diperiksa row_problem
+    return "" if value is None else value
+
+def row_problem(row):
+    """Alasan baris impor tidak valid, atau None; dicek sebelum add_many agar error menyebut barisnya."""
+    _, cause, cause_name, _, level, symptoms, symptoms_text, category, kb_version = row
+    if not cause or not level or not isinstance(symptoms, list):
+        return "timestamp, cause, level, dan symptoms wajib diisi"
+    if not all(isinstance(value, str) for value in (cause, cause_name, level, symptoms_text, category, kb_version)):
+        return "cause, cause_name, level, symptoms_text, category, dan kb_version harus string"
+    if not all(isinstance(code, str) for code in symptoms):
+        return "symptoms harus list kode gejala (string)"
+    return None
+
+def store_chunks(store, chunk_size):
+    after = 0
+    while True:
+        chunk = store.export_chunk(after, chunk_size)
+        if not chunk:
+            return
+        yield chunk
+        after = chunk[-1][0]
+
+# -- CSV: kode gejala digabung dengan koma dalam satu kolom
+
+def write_csv(chunks, path):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDS)
+        for chunk in chunks:
+            writer.writerows(
+                (id_, iso_timestamp(ts), cause, cause_name, confidence, level, category, ",".join(symptoms),
+                 symptoms_text, kb_version)
+                for id_, ts, cause, cause_name, confidence, level, symptoms, symptoms_text, category, kb_version
+                in chunk)
+
+def read_csv(path, chunk_size):
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader, None) or []
+        index = {name: i for i, name in enumerate(header)}
+        missing = [name for name in ("timestamp", "cause", "confidence", "level", "symptoms") if name not in index]
+        if missing:
+            raise HistoryFileError(path, f"kolom wajib tidak ada: {', '.join(missing)}", 1)
+        while True:
+            rows = []
+            for values in islice(reader, chunk_size):
+                def get(name, default=None, values=values):
+                    i = index.get(name)
+                    if i is None:
+                        return default
+                    value = values[i]
+                    return [code for code in value.split(",") if code] if name == "symptoms" else value
+                rows.append(checked(path, reader.line_num, get))
+            if not rows:
+                return
+            yield rows
+
+# -- JSONL: satu objek per baris, kode gejala sebagai list
+
+def write_jsonl(chunks, path):
+    with open(path, "w", encoding="utf-8") as f:
+        for chunk in chunks:
+            f.writelines(
+                json.dumps(
+                    {"id": id_, "timestamp": iso_timestamp(ts), "cause": cause, "cause_name": cause_name,
+                     "confidence": confidence, "level": level, "category": category, "symptoms": symptoms,
+                     "symptoms_text": symptoms_text, "kb_version": kb_version},
+                    ensure_ascii=False) + "\n"
+                for id_, ts, cause, cause_name, confidence, level, symptoms, symptoms_text, category, kb_version
+                in chunk)
+
+def read_jsonl(path, chunk_size):
+    with open(path, encoding="utf-8") as f:
+        lines = enumerate(f, 1)
+        while True:
+            rows = []
+            for n, line in islice(lines, chunk_size):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError as e:
+                    raise HistoryFileError(path, f"JSON tidak valid: {e}", n) from None
+                if not isinstance(record, dict):
+                    raise HistoryFileError(path, "record harus berupa objek", n)
+                rows.append(checked(path, n, lambda name, default=None, record=record: record.get(name, default)))
+            if not rows:
+                return
+            yield rows
+
+# -- Parquet: kolom bertipe, satu row group per potongan
+
+def pyarrow_modules(path):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise HistoryFileError(path, "format Parquet membutuhkan pyarrow (pip install pyarrow)") from None
+    return pa, pq
+
+def parquet_schema(pa):
+    return pa.schema([
+        ("id", pa.int64()),
+        ("timestamp", pa.timestamp("us", tz="UTC")),
+        ("cause", pa.string()),
+        ("cause_name", pa.string()),
+        ("confidence", pa.float64()),
+        ("level", pa.string()),
+        ("category", pa.string()),
+        ("symptoms", pa.list_(pa.string())),
+        ("symptoms_text", pa.string()),
+        ("kb_version", pa.string()),
+    ])
+
+def write_parquet(chunks, path):
+    pa, pq = pyarrow_modules(path)
+    schema = parquet_schema(pa)
+    with pq.ParquetWriter(path, schema, compression="zstd") as writer:
+        for chunk in chunks:
+            ids, ts, cause, cause_name, confidence, level, symptoms, symptoms_text, category, kb_version = zip(*chunk)
+            micros = pa.array([round(t * 1_000_000) for t in ts], pa.int64())
+            columns = [ids, micros.cast(schema.field("timestamp").type), cause, cause_name, confidence, level,
+                       category, symptoms, symptoms_text, kb_version]
+            writer.write_table(pa.Table.from_arrays(
+                [column if isinstance(column, pa.Array) else pa.array(column, field.type)
+                 for column, field in zip(columns, schema)],
+                schema=schema))
+
+def read_parquet(path, chunk_size):
+    pa, pq = pyarrow_modules(path)
+    try:
+        parquet = pq.ParquetFile(path)
+    except pa.ArrowException as e:
+        raise HistoryFileError(path, str(e)) from None
+    names = set(parquet.schema_arrow.names)
+    missing = [name for name in ("timestamp", "cause", "confidence", "level", "symptoms") if name not in names]
+    if missing:
+        raise HistoryFileError(path, f"kolom wajib tidak ada: {', '.join(missing)}")
+    columns = [name for name in FIELDS if name in names and name != "id"]
+    line = 0
+    for batch in parquet.iter_batches(batch_size=chunk_size, columns=columns):
+        data = {}
+        for name in columns:
+            column = batch.column(name)
+            if name == "timestamp":
+                # Detik epoch langsung dari kolom timestamp, tanpa lewat objek datetime
+                column = column.cast(pa.timestamp("us", tz="UTC")).cast(pa.int64())
+                data[name] = [None if v is None else v / 1_000_000 for v in column.to_pylist()]
+            else:
+                data[name] = column.to_pylist()
+        for name in ("cause_name", "category", "symptoms_text", "kb_version"):
+            data[name] = [value or "" for value in data[name]] if name in data else [""] * batch.num_rows
+        rows = []
+        for values in zip(*(data[name] for name in IMPORT_FIELDS)):
+            line += 1
+            ts, cause, cause_name, confidence, level, symptoms, symptoms_text, category, kb_version = values
+            try:
+                row = (ts, cause, cause_name, float(confidence), level, symptoms, symptoms_text, category,
+                       kb_version)
+            except (TypeError, ValueError) as e:
+                raise HistoryFileError(path, f"record tidak valid: {e}", line) from None
+            problem = "timestamp wajib diisi" if ts is None else row_problem(row)
+            if problem:
+                raise HistoryFileError(path, f"record tidak valid: {problem}", line)
+            rows.append(row)
+        yield rows
+
+def checked(path, line, get):
+    try:
+        row = import_row(get)
+    except (TypeError, ValueError) as e:
+        raise HistoryFileError(path, f"record tidak valid: {e}", line) from None
+    problem = row_problem(row)
+    if problem:
+        raise HistoryFileError(path, f"record tidak valid: {problem}", line)
+    return row
+
+WRITERS = {"csv": write_csv, "jsonl": write_jsonl, "parquet": write_parquet}
+READERS = {"csv": read_csv, "jsonl": read_jsonl, "parquet": read_parquet}
+
+def export_history(db_path, path, fmt=None, chunk_size=CHUNK_SIZE, progress=None):
+    """Tulis seluruh riwayat ke `path`; mengembalikan jumlah entri."""
+    fmt = detect_format(path, fmt)
+    store = HistoryStore(db_path)
+    done = 0
+
+    def counted():
+        nonlocal done
+        for chunk in store_chunks(store, chunk_size):
+            yield chunk
+            done += len(chunk)
+            if progress:
+                progress(done)
+
+    try:
+        WRITERS[fmt](counted(), path)
+    finally:
+        store.close()
+    return done
+
+def import_history(db_path, path, fmt=None, chunk_size=CHUNK_SIZE, progress=None):
+    """Tambahkan entri dari `path` ke riwayat, satu transaksi per potongan; mengembalikan jumlah entri.
+
+    Bila sebuah record tidak valid, potongan yang sudah tersimpan tetap ada dan
+    HistoryFileError menyebut baris yang bermasalah.
+    """
+    fmt = detect_format(path, fmt)
+    store = HistoryStore(db_path)
+    done = 0
+    try:
+        for rows in READERS[fmt](path, chunk_size):
+            store.add_many(rows)
+            done += len(rows)
+            if progress:
+                progress(done)
+    finally:
+        store.close()
+    return done
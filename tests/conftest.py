@@ -0,0 +1,75 @@
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pakar import CAUSES, RULES, SYMPTOMS  # noqa: E402
+from pakar.engine import KnowledgeBase, combine_cf, current_kb, use_kb  # noqa: E402
+
+def reference_chaining(user_symptoms, symptoms, causes, rules):
+    """forward_chaining asli dari app.py: setiap rule diperiksa berurutan, tanpa indeks."""
+    results = {}
+    for rule in rules:
+        if all(sym in user_symptoms for sym in rule["symptoms"]):
+            cause_id = rule["cause"]
+            if cause_id not in results:
+                results[cause_id] = combine_cf(causes[cause_id]["prior_cf"], rule["cf"])
+            else:
+                results[cause_id] = combine_cf(results[cause_id], rule["cf"])
+    return results
+
+def reference_top(user_symptoms, symptoms, causes, rules, k=3, threshold=0.0):
+    # Urutan asli: CF menurun, seri mengikuti urutan penyebab pertama kali menyala
+    results = reference_chaining(user_symptoms, symptoms, causes, rules)
+    return sorted(((c, cf) for c, cf in results.items() if cf >= threshold), key=lambda x: x[1], reverse=True)[:k]
+
+def random_kb(n_symptoms=60, n_causes=15, n_rules=120, seed=0):
+    rng = random.Random(seed)
+    symptoms = {f"S{i:03d}": {"text": f"gejala {i}", "category": rng.choice(["Layar", "Daya"])}
+                for i in range(n_symptoms)}
+    causes = {f"K{i:02d}": {"name": f"penyebab {i}", "prior_cf": round(rng.uniform(0, 0.3), 2), "level": "Sedang",
+                            "category": "Daya", "desc": "", "sol": []}
+              for i in range(n_causes)}
+    codes, cause_ids = list(symptoms), list(causes)
+    rules = [{"id": f"R{i}", "cause": rng.choice(cause_ids), "symptoms": rng.sample(codes, rng.randint(1, 4)),
+              "cf": round(rng.uniform(0.1, 0.9), 2)}
+             for i in range(n_rules)]
+    return symptoms, causes, rules
+
+def random_queries(symptoms, rules, n=300, seed=1):
+    """Himpunan gejala acak, sebagian berisi premis rule lengkap agar banyak rule menyala."""
+    rng = random.Random(seed)
+    codes = list(symptoms)
+    queries = []
+    for i in range(n):
+        query = set(rng.sample(codes, rng.randint(0, 6)))
+        for rule in rng.sample(rules, rng.randint(0, 3)):
+            query.update(rule["symptoms"])
+        queries.append(sorted(query, key=codes.index) if i % 2 else list(query))
+    return queries
+
+@pytest.fixture
+def bundled():
+    return SYMPTOMS, CAUSES, RULES
+
+@pytest.fixture
+def synthetic():
+    return random_kb()
+
+@pytest.fixture(params=["bundled", "synthetic"])
+def kb_data(request):
+    return request.getfixturevalue(request.param)
+
+@pytest.fixture
+def restore_kb():
+    # Tes yang memasang KB global (watcher, use_kb) mengembalikan KB bawaan sesudahnya
+    kb = current_kb()
+    yield
+    use_kb(kb)
+
+@pytest.fixture
+def kb(kb_data):
+    return KnowledgeBase(*kb_data)
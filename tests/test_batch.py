@@ -0,0 +1,44 @@
+import pytest
+
+from conftest import random_queries, reference_top
+from pakar.batch import batch_for, count_fired, run_diagnosis_batch
+from pakar.engine import run_diagnosis
+
+def assert_same(got, expected):
+    assert [status for _, status in got] == [status for _, status in expected]
+    for (results, _), (want, _) in zip(got, expected):
+        if want is None:
+            assert results is None
+        else:
+            assert [c for c, _ in results] == [c for c, _ in want]
+            assert [cf for _, cf in results] == pytest.approx([cf for _, cf in want], abs=1e-12)
+
+@pytest.mark.parametrize("k,threshold", [(3, 0.4), (1, 0.0), (5, 0.8)])
+def test_batch_matches_original_forward_chaining(kb, kb_data, k, threshold):
+    symptoms, causes, rules = kb_data
+    queries = random_queries(symptoms, rules)
+    expected = []
+    for query in queries:
+        top = reference_top(query, *kb_data, k, threshold)
+        expected.append((top, "success") if top else (None, "low_confidence"))
+    assert_same(run_diagnosis_batch(queries, k, threshold, batch=batch_for(kb)), expected)
+
+def test_batch_matches_scalar_partial_mode(kb, kb_data):
+    symptoms, causes, rules = kb_data
+    queries = random_queries(symptoms, rules)
+    got = run_diagnosis_batch(queries, batch=batch_for(kb), partial=True)
+    assert_same(got, [run_diagnosis(query, kb, partial=True) for query in queries])
+
+def test_chunking_and_empty_input(kb, kb_data):
+    symptoms, causes, rules = kb_data
+    queries = random_queries(symptoms, rules, n=50)
+    batch = batch_for(kb)
+    assert_same(run_diagnosis_batch(queries, chunk_size=7, batch=batch), run_diagnosis_batch(queries, batch=batch))
+    assert run_diagnosis_batch([], batch=batch) == []
+    assert run_diagnosis_batch([[], ["TIDAK-ADA"]], batch=batch) == [(None, "low_confidence")] * 2
+
+def test_count_fired(kb, kb_data):
+    symptoms, causes, rules = kb_data
+    queries = random_queries(symptoms, rules, n=100)
+    expected = [sum(all(s in query for s in rule["symptoms"]) for query in queries) for rule in rules]
+    assert list(count_fired(batch_for(kb), [tuple(q) for q in queries])) == expected
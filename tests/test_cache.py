@@ -0,0 +1,91 @@
+import threading
+
+import pytest
+
+from pakar.cache import DiagnosisCache
+from pakar.engine import KnowledgeBase, current_kb, run_diagnosis, use_kb
+
+def codes(kb, *positions):
+    symptoms = list(kb.symptoms)
+    return [symptoms[i] for i in positions]
+
+def test_hits_ignore_order_and_duplicates(kb):
+    cache = DiagnosisCache(maxsize=8)
+    first = cache.diagnose(codes(kb, 0, 1, 2), kb)
+    assert first == run_diagnosis(codes(kb, 0, 1, 2), kb)
+    assert cache.diagnose(codes(kb, 2, 0, 1, 0), kb) == first
+    assert cache.stats() == {"size": 1, "maxsize": 8, "hits": 1, "misses": 1, "evictions": 0}
+
+def test_results_are_copies(kb):
+    cache = DiagnosisCache()
+    picked = codes(kb, *range(6))
+    results, _ = cache.diagnose(picked, kb)
+    if results:
+        results.clear()
+    assert cache.diagnose(picked, kb) == run_diagnosis(picked, kb)
+
+def test_least_recently_used_is_evicted(kb):
+    cache = DiagnosisCache(maxsize=2)
+    cache.diagnose(codes(kb, 0), kb)
+    cache.diagnose(codes(kb, 1), kb)
+    cache.diagnose(codes(kb, 0), kb)  # codes 0 kini paling baru dipakai
+    cache.diagnose(codes(kb, 2), kb)
+    assert cache.stats()["evictions"] == 1 and cache.stats()["size"] == 2
+    hits = cache.stats()["hits"]
+    cache.diagnose(codes(kb, 0), kb)
+    assert cache.stats()["hits"] == hits + 1
+    cache.diagnose(codes(kb, 1), kb)
+    assert cache.stats()["hits"] == hits + 1
+
+def test_kb_swap_never_returns_stale_results(kb_data, restore_kb):
+    symptoms, causes, rules = kb_data
+    old = KnowledgeBase(symptoms, causes, rules)
+    # Semua CF rule diubah: hasil dengan gejala yang sama pasti berbeda
+    new = KnowledgeBase(symptoms, causes, [{**rule, "cf": rule["cf"] / 2} for rule in rules])
+    picked = max((rule["symptoms"] for rule in rules), key=lambda s: len(run_diagnosis(s, old)[0] or []))
+    assert run_diagnosis(picked, old) != run_diagnosis(picked, new)
+
+    cache = DiagnosisCache(maxsize=8)
+    use_kb(old)
+    assert cache.diagnose(picked) == run_diagnosis(picked, old)
+    use_kb(new)
+    assert current_kb() is new
+    assert cache.diagnose(picked) == run_diagnosis(picked, new)
+    # Versi lama tidak dibuang sekaligus: sesi yang masih memegang KB lama tetap mendapat hit
+    assert cache.diagnose(picked, old) == run_diagnosis(picked, old)
+    assert cache.stats() == {"size": 2, "maxsize": 8, "hits": 1, "misses": 2, "evictions": 0}
+
+def test_clear(kb):
+    cache = DiagnosisCache()
+    cache.diagnose(codes(kb, 0), kb)
+    cache.clear()
+    assert cache.stats()["size"] == 0
+    cache.diagnose(codes(kb, 0), kb)
+    assert cache.stats()["misses"] == 2
+
+def test_concurrent_sessions_stay_bounded(kb):
+    cache = DiagnosisCache(maxsize=16)
+    sets = [codes(kb, i, i + 1) for i in range(40)]
+
+    def worker(offset):
+        for i in range(200):
+            picked = sets[(i + offset) % len(sets)]
+            assert cache.diagnose(picked, kb) == run_diagnosis(picked, kb)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stats = cache.stats()
+    assert stats["size"] == 16
+    assert stats["hits"] + stats["misses"] == 800
+    # Dua sesi bisa miss kunci yang sama bersamaan; entri kedua menimpa, bukan menambah
+    assert stats["misses"] - stats["evictions"] >= 16
+
+@pytest.mark.parametrize("maxsize", [1, 3])
+def test_size_never_exceeds_maxsize(kb, maxsize):
+    cache = DiagnosisCache(maxsize=maxsize)
+    for i in range(10):
+        cache.diagnose(codes(kb, i), kb)
+        assert cache.stats()["size"] <= maxsize
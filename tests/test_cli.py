@@ -0,0 +1,39 @@
+import io
+import json
+
+import pytest
+
+from pakar import cli
+from pakar.engine import run_diagnosis
+
+def run(monkeypatch, capsys, lines, *args):
+    monkeypatch.setattr("sys.stdin", io.StringIO("".join(line + "\n" for line in lines)))
+    code = cli.main(["diagnose", *args])
+    return code, [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+@pytest.mark.parametrize("args", [(), ("--batch", "2")])
+def test_valid_lines(monkeypatch, capsys, args):
+    code, out = run(monkeypatch, capsys, ['["G038", "G037"]', '{"id": "a", "symptoms": ["G057", "G058"]}', ""], *args)
+    assert code == 0
+    assert [record.get("id") for record in out] == [None, "a"]
+    results, status = run_diagnosis(["G057", "G058"])
+    assert out[1]["status"] == status
+    assert [(r["cause"], r["cf"]) for r in out[1]["results"]] == pytest.approx(results)
+
+@pytest.mark.parametrize("args", [(), ("--batch", "8")])
+@pytest.mark.parametrize("bad", [
+    '{"symptoms": null}',
+    '{"symptoms": 5}',
+    '{"symptoms": [["G001"]]}',
+    '{"symptoms": "G001"}',
+    '"G001"',
+    '5',
+    '{"id": 1}',
+    '{bukan json',
+])
+def test_bad_lines_are_reported_without_losing_the_stream(monkeypatch, capsys, args, bad):
+    code, out = run(monkeypatch, capsys, ['["G038"]', bad, '{"id": 3, "symptoms": ["G038"]}'], *args)
+    assert code == 1
+    assert out[0]["symptoms"] == ["G038"]
+    assert out[1]["line"] == 2 and out[1]["error"].startswith("input tidak valid")
+    assert out[2]["id"] == 3 and "status" in out[2]
@@ -0,0 +1,30 @@
+import pytest
+
+from conftest import random_queries, reference_chaining, reference_top
+from pakar.engine import forward_chaining, rank_causes, run_diagnosis
+from pakar.kb import THRESHOLD_CF
+
+def test_forward_chaining_matches_original(kb, kb_data):
+    symptoms, causes, rules = kb_data
+    for query in random_queries(symptoms, rules):
+        assert forward_chaining(query, kb) == reference_chaining(query, *kb_data)
+
+@pytest.mark.parametrize("k", [1, 3, 5])
+@pytest.mark.parametrize("threshold", [0.0, 0.4, 0.8])
+def test_rank_causes_matches_sorted_forward_chaining(kb, kb_data, k, threshold):
+    symptoms, causes, rules = kb_data
+    for query in random_queries(symptoms, rules):
+        assert rank_causes(query, kb, k, threshold) == reference_top(query, *kb_data, k, threshold)
+
+def test_duplicates_and_unknown_codes_are_ignored(kb, kb_data):
+    symptoms, causes, rules = kb_data
+    premise = rules[0]["symptoms"]
+    assert forward_chaining(premise + premise + ["TIDAK-ADA"], kb) == forward_chaining(premise, kb)
+
+def test_run_diagnosis_status(kb, kb_data):
+    symptoms, causes, rules = kb_data
+    results, status = run_diagnosis(rules[0]["symptoms"], kb)
+    assert status == "success"
+    assert results == reference_top(rules[0]["symptoms"], *kb_data, 3, THRESHOLD_CF)
+    assert run_diagnosis([], kb) == (None, "low_confidence")
+    assert rank_causes(rules[0]["symptoms"], kb, k=0) == []
@@ -0,0 +1,156 @@
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from pakar.history import HistoryStore, HistoryWriter
+from pakar.rollups import Rollups
+
+def row(cause="C01", confidence=0.5, level="Tinggi", category="Storage", ts=1_700_000_000.0):
+    return (ts, cause, f"nama {cause}", confidence, level, ["G038", "G001"], "teks tersimpan", category, "v1")
+
+def entry(cause="C01", confidence=0.5, **kwargs):
+    return dict(cause=cause, cause_name=f"nama {cause}", confidence=confidence, level="Tinggi",
+                symptoms=["G038", "G001"], symptoms_text="teks tersimpan", category="Storage", **kwargs)
+
+def table_rollups(store):
+    with store._lock:
+        return Rollups.from_table(store._conn.execute("SELECT kind, key, n, conf_sum FROM rollup")).rows()
+
+def assert_same_rollups(got, expected):
+    # Jumlah persis; total CF boleh berbeda urutan penjumlahan
+    assert sorted((kind, key, n) for kind, key, n, _ in got) == sorted((kind, key, n) for kind, key, n, _ in expected)
+    assert {(kind, key): total for kind, key, _, total in got} == pytest.approx(
+        {(kind, key): total for kind, key, _, total in expected})
+
+def reject(store, cause):
+    # Transaksi yang menyisipkan `cause` gagal seperti saat disk penuh atau database terkunci
+    with store._lock:
+        store._conn.execute(f"CREATE TRIGGER tolak BEFORE INSERT ON history WHEN NEW.cause = '{cause}'"
+                            " BEGIN SELECT RAISE(ABORT, 'ditolak'); END")
+
+@pytest.fixture
+def store(tmp_path):
+    store = HistoryStore(str(tmp_path / "riwayat.db"), batch_size=4)
+    yield store
+    store.close()
+
+def test_add_batches_and_pages(store):
+    for i in range(10):
+        store.add(**entry(confidence=i / 10), timestamp=datetime.fromtimestamp(1_700_000_000 + i))
+    assert store.count() == 10
+    page = store.page(limit=4)
+    assert [item.id for item in page] == [10, 9, 8, 7]
+    assert page[0].symptoms == ["G038", "G001"] and page[0].symptoms_text == "teks tersimpan"
+    assert [item.id for item in store.page(before=page[-1].id, limit=4)] == [6, 5, 4, 3]
+    assert [item.id for item in store.page(level="Rendah")] == []
+
+def test_rollups_track_pending_and_persist(tmp_path, store):
+    store.add(**entry("C01", 0.4))
+    store.add_many([row("C02", 0.8), row("C01", 0.6, category="")])
+    rollups = store.rollups()
+    assert rollups.total() == 3
+    assert rollups.counts["cause"]["C01"] == (2, pytest.approx(1.0))
+    store.close()
+    reopened = HistoryStore(str(tmp_path / "riwayat.db"))
+    assert_same_rollups(reopened.rollups().rows(), rollups.rows())
+    reopened.rebuild_rollups()
+    assert_same_rollups(reopened.rollups().rows(), rollups.rows())
+    reopened.close()
+
+def test_failed_batch_is_dropped_and_rollups_stay_consistent(store):
+    store.add_many([row("C01")] * 3)
+    reject(store, "C99")
+    with pytest.raises(sqlite3.Error):
+        store.add_many([row("C99"), row("C01")])
+    assert store.count() == 3
+    assert_same_rollups(store.rollups().rows(), table_rollups(store))
+
+    # Batch berikutnya tidak mengulang batch yang gagal, jadi tidak ikut gagal
+    store.add_many([row("C02")])
+    assert store.count() == 4
+    assert_same_rollups(store.rollups().rows(), table_rollups(store))
+    assert [item.cause for item in store.page()] == ["C02", "C01", "C01", "C01"]
+
+def test_failed_pending_rows_do_not_fail_add_many(store):
+    reject(store, "C99")
+    store.add(**entry("C99"))
+    assert store.rollups().total() == 1
+    store.add_many([row("C02")])
+    assert store.count() == 1
+    assert store.rollups().counts["cause"] == {"C02": (1, 0.5)}
+    assert_same_rollups(store.rollups().rows(), table_rollups(store))
+
+def test_writer_groups_entries_and_counts_errors(store):
+    writer = HistoryWriter(store, max_batch=64, max_delay=0.01).start()
+    try:
+        for i in range(200):
+            writer.add(**entry(confidence=i / 200))
+        assert writer.sync(5)
+        stats = writer.stats()
+        assert stats["written"] == 200 and stats["queued"] == 0 and stats["errors"] == 0
+        assert stats["batches"] < 200
+        assert store.count() == 200
+
+        reject(store, "C99")
+        writer.add(**entry("C99"))
+        assert writer.sync(5)
+        writer.add(**entry("C02"))
+        assert writer.sync(5)
+        assert writer.stats()["errors"] == 1
+        assert writer._thread.is_alive()
+    finally:
+        writer.close()
+    assert store.count() == 201
+    assert_same_rollups(store.rollups().rows(), table_rollups(store))
+
+def test_writer_close_flushes_queue(store):
+    writer = HistoryWriter(store, max_batch=8, max_delay=1.0).start()
+    for _ in range(20):
+        writer.add(**entry())
+    writer.close()
+    assert store.count() == 20
+
+def test_writer_survives_non_sqlite_errors(store, monkeypatch):
+    writer = HistoryWriter(store, max_delay=0.01).start()
+    add_many = store.add_many
+    calls = []
+
+    def broken_once(rows):
+        calls.append(len(rows))
+        if len(calls) == 1:
+            raise TypeError("baris rusak")
+        return add_many(rows)
+
+    monkeypatch.setattr(store, "add_many", broken_once)
+    try:
+        writer.add(**entry("C01"))
+        assert writer.sync(5)
+        seq = writer.add(**entry("C02"))
+        assert writer.sync(5, seq=seq)
+        assert writer._thread.is_alive()
+        assert writer.stats()["errors"] == 1
+    finally:
+        writer.close()
+    assert [item.cause for item in store.page()] == ["C02"]
+
+def test_sync_waits_only_for_the_given_entry(store):
+    writer = HistoryWriter(store, max_queue=4, put_timeout=0.05)
+    # Penulis belum berjalan: entri pertama tertahan di antrean
+    first = writer.add(**entry())
+    assert not writer.sync(0.05, seq=first)
+    assert writer.sync(0, seq=0)
+    writer.start()
+    assert writer.sync(5, seq=first)
+    writer.close()
+
+def test_full_queue_does_not_block_forever(store):
+    writer = HistoryWriter(store, max_queue=1, put_timeout=0.05)
+    writer.add(**entry())
+    seq = writer.add(**entry())
+    assert writer.stats()["errors"] == 1 and writer.stats()["waits"] == 1
+    writer.start()
+    # Entri yang dibuang dihitung selesai: tanpa itu `written` berhenti di 1 dan sync ini habis waktu
+    assert writer.sync(5, seq=seq)
+    writer.close()
+    assert store.count() == 1
@@ -0,0 +1,40 @@
+import random
+
+import pytest
+
+from pakar.engine import forward_chaining, rank_causes
+from pakar.incremental import IncrementalDiagnosis
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_random_toggles_match_rank_causes(kb, seed):
+    rng = random.Random(seed)
+    codes = list(kb.symptoms)
+    live = IncrementalDiagnosis(kb)
+    selected = set()
+    for _ in range(300):
+        code = rng.choice(codes)
+        before = live.results()
+        if code in selected:
+            selected.discard(code)
+            changed = live.remove(code)
+        else:
+            selected.add(code)
+            changed = live.add(code)
+        after = live.results()
+        assert after == forward_chaining(selected, kb)
+        assert {c for c in before.keys() | after.keys() if before.get(c) != after.get(c)} <= changed
+        for k, threshold in ((3, 0.4), (5, 0.0)):
+            assert live.top(k, threshold) == rank_causes(selected, kb, k, threshold)
+
+def test_sync_and_idempotent_updates(kb):
+    codes = list(kb.symptoms)
+    live = IncrementalDiagnosis(kb)
+    live.sync(codes[:8])
+    assert live.selected == set(codes[:8])
+    assert live.add(codes[0]) == set()
+    assert live.remove("TIDAK-ADA") == set()
+    live.sync(codes[4:12])
+    assert live.results() == forward_chaining(codes[4:12], kb)
+    live.sync([])
+    assert live.results() == forward_chaining([], kb)
+    assert live.top() == rank_causes([], kb)
@@ -0,0 +1,143 @@
+import copy
+import json
+import struct
+
+import pytest
+
+from pakar.engine import current_kb, rank_causes
+from pakar.loader import HEADER, KnowledgeBaseError, KnowledgeBaseWatcher, dump_kb, load_kb, validate
+
+def write_json(path, symptoms, causes, rules):
+    path.write_text(json.dumps({"symptoms": symptoms, "causes": causes, "rules": rules}), encoding="utf-8")
+    return str(path)
+
+@pytest.mark.parametrize("suffix", [".json", ".kbb"])
+def test_dump_and_load_round_trip(tmp_path, synthetic, suffix):
+    symptoms, causes, rules = synthetic
+    path = str(tmp_path / f"kb{suffix}")
+    dump_kb(path, symptoms, causes, rules)
+    kb = load_kb(path)
+    assert kb.symptoms == symptoms and kb.causes == causes
+    assert list(kb.rules) == rules
+    assert kb.version == load_kb(write_json(tmp_path / "ref.json", *synthetic)).version
+
+def test_packed_rules_compile_like_json(tmp_path, synthetic):
+    dump_kb(str(tmp_path / "kb.kbb"), *synthetic)
+    packed, plain = load_kb(str(tmp_path / "kb.kbb")), load_kb(write_json(tmp_path / "kb.json", *synthetic))
+    assert packed.symptom_bits == plain.symptom_bits
+    assert packed.rule_masks == plain.rule_masks
+    assert packed.symptom_rules == plain.symptom_rules
+    assert list(packed.rule_cause) == list(plain.rule_cause)
+    assert list(packed.rule_cf) == list(plain.rule_cf)
+    codes = list(synthetic[0])
+    assert rank_causes(codes[:10], packed, k=5, threshold=0) == rank_causes(codes[:10], plain, k=5, threshold=0)
+
+def break_rule(field, value):
+    def apply(symptoms, causes, rules):
+        rules[0][field] = value
+    return apply
+
+def break_cause(field, value):
+    def apply(symptoms, causes, rules):
+        causes[next(iter(causes))][field] = value
+    return apply
+
+def break_symptom(value):
+    def apply(symptoms, causes, rules):
+        symptoms[next(iter(symptoms))] = value
+    return apply
+
+@pytest.mark.parametrize("problem,apply", [
+    ("cf", break_rule("cf", 1.5)),
+    ("cf", break_rule("cf", "0.5")),
+    ("cf", break_rule("cf", True)),
+    ("penyebab", break_rule("cause", "TIDAK-ADA")),
+    ("penyebab", break_rule("cause", ["K00"])),
+    ("symptoms harus list", break_rule("symptoms", "S001")),
+    ("symptoms harus list", break_rule("symptoms", [1, 2])),
+    ("premis kosong", break_rule("symptoms", [])),
+    ("tidak ada di SYMPTOMS", break_rule("symptoms", ["TIDAK-ADA"])),
+    ("id", break_rule("id", ["R0"])),
+    ("prior_cf", break_cause("prior_cf", "0.1")),
+    ("prior_cf", break_cause("prior_cf", -0.1)),
+    ("name harus string", break_cause("name", 3)),
+    ("sol harus list string", break_cause("sol", "ganti")),
+    ("text", break_symptom({"text": 5})),
+    ("text", break_symptom("teks saja")),
+])
+def test_validate_rejects_malformed_fields(synthetic, problem, apply):
+    symptoms, causes, rules = copy.deepcopy(synthetic)
+    apply(symptoms, causes, rules)
+    with pytest.raises(KnowledgeBaseError) as e:
+        validate(symptoms, causes, rules, "kb.json")
+    assert any(problem in p for p in e.value.problems)
+
+@pytest.mark.parametrize("shape", [
+    {"symptoms": [], "causes": {}, "rules": []},
+    {"symptoms": {}, "causes": {}, "rules": "R1"},
+    {"symptoms": {}, "causes": {}, "rules": [5]},
+    {"symptoms": {}, "causes": {"K": 1}, "rules": []},
+])
+def test_malformed_types_raise_knowledge_base_error(tmp_path, shape):
+    path = tmp_path / "kb.json"
+    path.write_text(json.dumps(shape), encoding="utf-8")
+    with pytest.raises(KnowledgeBaseError):
+        load_kb(str(path))
+
+def test_duplicate_rule_id_and_all_problems_reported(synthetic):
+    symptoms, causes, rules = copy.deepcopy(synthetic)
+    rules[1]["id"] = rules[0]["id"]
+    rules[2]["cf"] = 2
+    with pytest.raises(KnowledgeBaseError) as e:
+        validate(symptoms, causes, rules)
+    assert len(e.value.problems) == 2
+
+@pytest.mark.parametrize("corrupt", ["empty", "short", "magic", "meta", "meta_type", "truncated", "index"])
+def test_corrupt_packed_file(tmp_path, synthetic, corrupt):
+    path = tmp_path / "kb.kbb"
+    dump_kb(str(path), *synthetic)
+    data = bytearray(path.read_bytes())
+    _, _, _, meta_len = HEADER.unpack_from(data)
+    if corrupt == "empty":
+        data = b""
+    elif corrupt == "short":
+        data = data[:6]
+    elif corrupt == "magic":
+        data[:4] = b"XXXX"
+    elif corrupt == "meta":
+        data[HEADER.size:HEADER.size + 8] = b"\xff" * 8
+    elif corrupt == "meta_type":
+        meta = json.dumps({"n_rules": "banyak"}).encode()
+        data = HEADER.pack(b"PKKB", 1, 0, len(meta)) + meta
+    elif corrupt == "truncated":
+        data = data[:-16]
+    else:
+        # Indeks gejala premis pertama di luar tabel SYMPTOMS
+        n_rules = len(synthetic[2])
+        start = HEADER.size + meta_len + (-meta_len - HEADER.size) % 8 + n_rules * (8 + 4) + (n_rules + 1) * 4
+        struct.pack_into("<I", data, start, 10 ** 6)
+    path.write_bytes(bytes(data))
+    with pytest.raises(KnowledgeBaseError):
+        load_kb(str(path))
+
+def test_watcher_keeps_previous_kb_on_bad_file(tmp_path, synthetic, restore_kb):
+    path = tmp_path / "kb.json"
+    dump_kb(str(path), *synthetic)
+    watcher = KnowledgeBaseWatcher(str(path))
+    assert watcher.poll()
+    good = current_kb()
+    assert good.version == load_kb(str(path)).version
+
+    for bad in ("{tidak valid", json.dumps({"symptoms": {}, "causes": {}, "rules": [None]}),
+                json.dumps({"symptoms": synthetic[0], "causes": synthetic[1], "rules": {"R": 1}})):
+        path.write_text(bad, encoding="utf-8")
+        assert not watcher.poll()
+        assert isinstance(watcher.last_error, KnowledgeBaseError)
+        assert current_kb() is good
+
+    symptoms, causes, rules = copy.deepcopy(synthetic)
+    rules[0]["cf"] = 0.11
+    dump_kb(str(path), symptoms, causes, rules)
+    assert watcher.poll()
+    assert watcher.last_error is None
+    assert current_kb().version != good.version
@@ -0,0 +1,116 @@
+import re
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from pakar import metrics  # noqa: E402
+from pakar.engine import KnowledgeBase, current_kb, run_diagnosis, use_kb  # noqa: E402
+
+LINE = re.compile(r'^(\w+)(?:\{(.*)\})? (\S+)$')
+
+def parse(text):
+    """{(nama, ((label, nilai), ...)): angka} dari format teks Prometheus."""
+    samples = {}
+    for line in text.splitlines():
+        if line.startswith("#"):
+            continue
+        name, labels, value = LINE.match(line).groups()
+        pairs = tuple(re.findall(r'(\w+)="((?:[^"\\]|\\.)*)"', labels or ""))
+        samples[name, pairs] = float(value)
+    return samples
+
+def fired_counts(samples):
+    return {dict(labels)["rule"]: (dict(labels)["kb_version"], value)
+            for (name, labels), value in samples.items() if name == "pakar_rule_fired_total"}
+
+@pytest.fixture
+def registry():
+    metrics.disable()
+    yield metrics.enable()
+    metrics.disable()
+
+def test_histogram_buckets_are_cumulative(registry):
+    for seconds in (5e-6, 1e-5, 3e-5, 3e-5, 0.2):
+        metrics.observe_diagnosis([], current_kb(), None, seconds)
+    samples = parse(registry.render())
+    buckets = {dict(labels)["le"]: value for (name, labels), value in samples.items()
+               if name == "pakar_diagnosis_seconds_bucket"}
+    # Batas atas inklusif: 1e-05 masuk bucket le="1e-05"
+    assert buckets["1e-05"] == 2 and buckets["2.5e-05"] == 2 and buckets["5e-05"] == 4
+    assert buckets["0.05"] == 4 and buckets["+Inf"] == 5
+    assert list(buckets) == [repr(b) for b in metrics.DIAGNOSIS_BUCKETS] + ["+Inf"]
+    assert samples["pakar_diagnosis_seconds_count", ()] == 5
+    assert samples["pakar_diagnosis_seconds_sum", ()] == pytest.approx(0.200075)
+
+def test_labelled_histogram_and_counter(registry):
+    metrics.observe("page_seconds", 0.003, "home")
+    metrics.observe("page_seconds", 2.0, "riwayat")
+    metrics.count("sessions")
+    samples = parse(registry.render())
+    assert samples["pakar_page_seconds_bucket", (("page", "home"), ("le", "0.005"))] == 1
+    assert samples["pakar_page_seconds_bucket", (("page", "riwayat"), ("le", "1.0"))] == 0
+    assert samples["pakar_page_seconds_count", (("page", "riwayat"),)] == 1
+    assert samples["pakar_sessions_total", ()] == 1
+
+def test_cause_hits(registry):
+    kb = current_kb()
+    sets = [["G057", "G058"], ["G038", "G037"], ["G057", "G058"], []]
+    expected, top = {}, {}
+    for symptoms in sets:
+        results, _ = run_diagnosis(symptoms, kb)
+        metrics.observe_diagnosis(symptoms, kb, results, 1e-4)
+        for n, (cause_id, _) in enumerate(results or []):
+            expected[cause_id] = expected.get(cause_id, 0) + 1
+            if n == 0:
+                top[cause_id] = top.get(cause_id, 0) + 1
+    assert expected
+    samples = parse(registry.render())
+    assert {dict(labels)["cause"]: v for (name, labels), v in samples.items()
+            if name == "pakar_cause_hits_total"} == expected
+    assert {dict(labels)["cause"]: v for (name, labels), v in samples.items()
+            if name == "pakar_top_cause_hits_total"} == top
+
+def test_rule_fired_counts_reset_after_kb_swap(registry, kb_data, restore_kb):
+    symptoms, causes, rules = kb_data
+    old = KnowledgeBase(symptoms, causes, rules)
+    use_kb(old)
+    sets = [rule["symptoms"] for rule in rules[:10]] * 2
+    metrics.observe_batch(sets, old, [run_diagnosis(s, old) for s in sets], 1e-3)
+    fired = fired_counts(parse(registry.render()))
+    assert len(fired) == len(rules)
+    for i, rule in enumerate(rules):
+        want = sum(1 for s in sets if set(rule["symptoms"]) <= set(s))
+        assert fired[rule.get("id", str(i))] == (old.version, want)
+    assert sum(value for _, value in fired.values()) >= len(sets)
+
+    # KB baru: hitungan lama tidak terbawa, diagnosa yang masih memakai KB lama tidak dihitung
+    new = KnowledgeBase(symptoms, causes, [{**rule, "cf": rule["cf"] / 2} for rule in rules])
+    use_kb(new)
+    metrics.observe_diagnosis(sets[0], old, None, 1e-4)
+    fired = fired_counts(parse(registry.render()))
+    assert set(fired.values()) == {(new.version, 0)}
+
+    metrics.observe_diagnosis(rules[0]["symptoms"], new, None, 1e-4)
+    fired = fired_counts(parse(registry.render()))
+    assert fired[rules[0].get("id", "0")] == (new.version, 1)
+
+def test_collectors_and_escaping(registry, caplog):
+    registry.add_collector(lambda: [("pakar_cache_entries", "gauge", "Isi cache", 7)])
+
+    def broken():
+        raise RuntimeError("rusak")
+
+    registry.add_collector(broken)
+    metrics.count("cause_hits", 'C"01\\\n')
+    text = registry.render()
+    assert "# TYPE pakar_cache_entries gauge\npakar_cache_entries 7\n" in text
+    assert 'pakar_cause_hits_total{cause="C\\"01\\\\\\n"} 1' in text
+    assert "collector metrik gagal" in caplog.text
+
+def test_disabled_metrics_record_nothing():
+    metrics.disable()
+    metrics.observe_diagnosis([], current_kb(), None, 1.0)
+    metrics.count("sessions")
+    assert metrics.registry() is None
+    assert metrics.timed("page_seconds", "home")(len) is len
@@ -0,0 +1,100 @@
+import random
+
+import pytest
+
+from pakar.engine import rank_causes, rule_premises
+from pakar.questioning import CATEGORY_PREFIX, MASS_EPS, YES_BOOST, GuidedQuestioning
+
+def reference_gaps(kb, answers):
+    """Selisih massa tiap pertanyaan terbuka terhadap setengah total, dihitung ulang dari nol."""
+    weights = {}
+    for i, premise in enumerate(kb.derived("rule_premises", rule_premises)):
+        if not premise:
+            continue
+        keys = set(premise) | {CATEGORY_PREFIX + kb.symptoms[c]["category"] for c in premise
+                               if kb.symptoms.get(c, {}).get("category")}
+        if any(answers.get(key) is False for key in keys):
+            continue
+        evidence = sum(1 for key in keys if answers.get(key))
+        weights[i] = (keys, kb.causes[kb.rule_cause[i]]["prior_cf"] * kb.rule_cf[i] * YES_BOOST ** evidence)
+    total = sum(w for _, w in weights.values())
+    mass = {}
+    for keys, w in weights.values():
+        for key in keys - answers.keys():
+            mass[key] = mass.get(key, 0.0) + w
+    return {key: abs(m - total / 2) for key, m in mass.items() if m > MASS_EPS}
+
+def respond(kb, truth, key):
+    # Jawaban pengguna dengan kerusakan `truth` (himpunan gejala yang benar-benar muncul)
+    if key.startswith(CATEGORY_PREFIX):
+        return any(kb.symptoms[c].get("category") == key[len(CATEGORY_PREFIX):] for c in truth)
+    return key in truth
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_next_question_maximises_information(kb, seed):
+    rng = random.Random(seed)
+    session = GuidedQuestioning(kb, threshold=0.0)
+    for _ in range(40):
+        key = session.next_question()
+        gaps = reference_gaps(kb, session.answers)
+        if key is None:
+            assert not gaps
+            break
+        assert gaps[key] == pytest.approx(min(gaps.values()), abs=1e-9)
+        session.answer(key, rng.choice([True, False, False, None]))
+
+@pytest.mark.parametrize("seed", [0, 1, 2, 3])
+def test_session_stops_once_top_cause_is_decided(kb, seed):
+    rng = random.Random(seed)
+    premises = [p for p in kb.derived("rule_premises", rule_premises) if p]
+    truth = set(rng.choice(premises))
+    session = GuidedQuestioning(kb)
+    asked = 0
+    while not session.done():
+        key = session.next_question()
+        session.answer(key, respond(kb, truth, key))
+        asked += 1
+    assert asked < len(kb.symptoms)
+    top = session.top(2)
+    assert top == rank_causes(session.confirmed(), kb, 2, session.threshold)
+    if session.next_question() is not None:
+        # Berhenti lebih awal hanya bila penyebab teratas sudah lolos threshold
+        assert top and top[0][1] >= session.threshold
+
+def test_clear_margin_stops_after_last_premise(kb):
+    def margin(premise):
+        top = rank_causes(premise, kb, 2, 0.4)
+        return top[0][1] - (top[1][1] if len(top) > 1 else 0.0) if top else -1.0
+
+    premise = sorted(max((p for p in kb.derived("rule_premises", rule_premises) if p), key=margin))
+    assert margin(premise) >= 0.1
+    session = GuidedQuestioning(kb, threshold=0.4, margin=0.1, explained=1.1)
+    for code in premise[:-1]:
+        session.answer(code, True)
+    # Selama premis belum lengkap dan penyebab teratas belum jelas, tanya jawab berlanjut
+    assert session.done() == (margin(premise[:-1]) >= 0.1 or session.next_question() is None)
+    session.answer(premise[-1], True)
+    assert session.done()
+    assert session.top(1) == rank_causes(premise, kb, 1, 0.4)
+
+def test_answered_questions_are_not_asked_again(kb):
+    session = GuidedQuestioning(kb)
+    seen = []
+    for present in [True, False, None] * 10:
+        key = session.next_question()
+        if key is None:
+            break
+        assert key not in seen
+        seen.append(key)
+        session.answer(key, present)
+    assert list(session.answers) == seen
+    before = dict(session.answers)
+    session.answer(seen[0], not before[seen[0]])
+    assert session.answers == before
+    assert session.confirmed() == [k for k in seen[::3] if not k.startswith(CATEGORY_PREFIX)]
+
+def test_all_no_exhausts_questions(kb):
+    session = GuidedQuestioning(kb)
+    while (key := session.next_question()) is not None:
+        session.answer(key, False)
+    assert session.done() and session.top() == []
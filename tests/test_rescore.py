@@ -0,0 +1,113 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from pakar import CAUSES, RULES, SYMPTOMS  # noqa: E402
+from pakar.engine import current_kb, run_diagnosis  # noqa: E402
+from pakar.history import HistoryStore  # noqa: E402
+from pakar.loader import dump_kb, load_kb  # noqa: E402
+from pakar.rescore import diff_report, format_report, rescore  # noqa: E402
+
+# Entri riwayat: premis rule lengkap, diselingi premis terpotong yang mungkin tidak menyalakan rule apa pun
+QUERIES = [RULES[i % len(RULES)]["symptoms"][: None if i % 2 == 0 else 1] for i in range(0, 5 * len(RULES), 7)]
+
+@pytest.fixture
+def db(tmp_path):
+    path = str(tmp_path / "riwayat.db")
+    store = HistoryStore(path)
+    rows = []
+    for i, symptoms in enumerate(QUERIES):
+        results, _ = run_diagnosis(symptoms, k=1, threshold=0.0)
+        cause, cf = results[0] if results else ("C01", 0.1)
+        rows.append((1_700_000_000.0 + i, cause, CAUSES[cause]["name"], cf, CAUSES[cause]["level"], symptoms,
+                     "", CAUSES[cause]["category"], current_kb().version))
+    store.add_many(rows)
+    store.close()
+    return path
+
+@pytest.fixture
+def new_kb(tmp_path):
+    # Rule penyebab pertama yang tercatat di riwayat dihapus: entri itu harus pindah penyebab
+    dropped = run_diagnosis(QUERIES[0], k=1, threshold=0.0)[0][0][0]
+    path = str(tmp_path / "kb_baru.json")
+    dump_kb(path, SYMPTOMS, CAUSES, [rule for rule in RULES if rule["cause"] != dropped])
+    return path, dropped
+
+def expected_rows(kb):
+    out = {}
+    for i, symptoms in enumerate(QUERIES, start=1):
+        results, _ = run_diagnosis(symptoms, kb, k=1)
+        out[i] = results[0] if results else ("", 0.0)
+    return out
+
+def rescored(db, version):
+    store = HistoryStore(db)
+    try:
+        with store._lock:
+            rows = store._conn.execute(
+                "SELECT history_id, cause, confidence FROM rescored WHERE kb_version = ? ORDER BY history_id",
+                (version,)).fetchall()
+        return {id_: (cause, cf) for id_, cause, cf in rows}
+    finally:
+        store.close()
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_rescore_matches_run_diagnosis(db, new_kb, workers):
+    before = current_kb()
+    version, done = rescore(db, new_kb[0], workers=workers, chunk_size=16)
+    kb = load_kb(new_kb[0])
+    assert version == kb.version and done == len(QUERIES)
+    assert current_kb() is before
+    got, want = rescored(db, version), expected_rows(kb)
+    assert list(got) == list(want)
+    for id_ in want:
+        assert got[id_][0] == want[id_][0] and got[id_][1] == pytest.approx(want[id_][1])
+
+def test_interrupted_job_resumes_after_last_saved_id(db, new_kb):
+    seen = []
+
+    def stop_after_two(done, last_id):
+        seen.append((done, last_id))
+        if len(seen) == 2:
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        rescore(db, new_kb[0], workers=1, chunk_size=10, progress=stop_after_two)
+    assert seen == [(10, 10), (20, 20)]
+    version = load_kb(new_kb[0]).version
+    assert list(rescored(db, version)) == list(range(1, 21))
+
+    resumed = []
+    assert rescore(db, new_kb[0], workers=1, chunk_size=10, progress=lambda *a: resumed.append(a)) == (
+        version, len(QUERIES) - 20)
+    assert resumed[0] == (10, 30)
+    assert list(rescored(db, version)) == list(range(1, len(QUERIES) + 1))
+    # Job yang sudah selesai tidak mengerjakan apa pun lagi
+    assert rescore(db, new_kb[0], workers=1) == (version, 0)
+
+def test_diff_report(db, new_kb):
+    path, dropped = new_kb
+    version, _ = rescore(db, path, workers=1)
+    report = diff_report(db, version)
+    kb = load_kb(path)
+    original = {i: run_diagnosis(s, k=1, threshold=0.0)[0] for i, s in enumerate(QUERIES, start=1)}
+    new = expected_rows(kb)
+    changed = [i for i in new if (original[i][0][0] if original[i] else "C01") != new[i][0]]
+    assert report["kb_version"] == version
+    assert report["rescored"] == len(QUERIES)
+    assert report["changed"] == len(changed) > 0
+    assert sum(t["count"] for t in report["transitions"]) == len(changed)
+    assert any(t["from"] == dropped for t in report["transitions"])
+    assert all(t["to"] != dropped for t in report["transitions"])
+    # Entri di bawah threshold tersimpan dengan penyebab kosong dan dilaporkan tanpa nama
+    for t in report["transitions"]:
+        assert (t["to_name"] is None) == (t["to"] == "")
+    text = format_report(report)
+    assert text.splitlines()[0] == (f"KB {version}: {len(QUERIES)} entri didiagnosa ulang, "
+                                    f"{len(changed)} penyebab teratas berubah")
+    assert len(text.splitlines()) == 2 + len(report["transitions"])
+    assert len(diff_report(db, version, limit=1)["transitions"]) == min(1, len(report["transitions"]))
+
+def test_report_for_unknown_version_is_empty(db):
+    report = diff_report(db, "tidak-ada")
+    assert report["rescored"] == 0 and report["changed"] == 0 and report["transitions"] == []
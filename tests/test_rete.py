@@ -0,0 +1,63 @@
+import random
+
+import pytest
+
+from pakar.engine import forward_chaining, rank_causes, rule_premises
+from pakar.rete import ReteDiagnosis, rete_network
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_random_toggles_match_rank_causes(kb, seed):
+    rng = random.Random(seed)
+    codes = list(kb.symptoms)
+    live = ReteDiagnosis(kb)
+    selected = set()
+    for _ in range(300):
+        code = rng.choice(codes)
+        before = live.results()
+        if code in selected:
+            selected.discard(code)
+            changed = live.remove(code)
+        else:
+            selected.add(code)
+            changed = live.add(code)
+        after = live.results()
+        assert after == forward_chaining(selected, kb)
+        assert {c for c in before.keys() | after.keys() if before.get(c) != after.get(c)} <= changed
+        for k, threshold in ((3, 0.4), (5, 0.0)):
+            assert live.top(k, threshold) == rank_causes(selected, kb, k, threshold)
+
+def test_every_premise_order_fires(kb):
+    # Rule harus menyala apa pun urutan gejala premisnya dipilih, termasuk setelah dicabut lalu dipilih lagi
+    rng = random.Random(0)
+    live = ReteDiagnosis(kb)
+    for premise in kb.derived("rule_premises", rule_premises):
+        premise = list(premise)
+        for _ in range(2):
+            rng.shuffle(premise)
+            for code in premise:
+                live.add(code)
+            assert live.results() == forward_chaining(premise, kb)
+            for code in premise[::-1]:
+                live.remove(code)
+            assert live.results() == forward_chaining([], kb)
+            assert live._active == set()
+
+def test_retract_and_readd_middle_symptom(kb):
+    live = ReteDiagnosis(kb)
+    premise = max(kb.derived("rule_premises", rule_premises), key=len)
+    codes = sorted(premise)
+    live.sync(codes)
+    assert live.results() == forward_chaining(codes, kb)
+    middle = codes[len(codes) // 2]
+    live.remove(middle)
+    assert live.results() == forward_chaining(set(codes) - {middle}, kb)
+    live.add(middle)
+    assert live.results() == forward_chaining(codes, kb)
+    assert live.add(middle) == set() and live.remove("TIDAK-ADA") == set()
+
+def test_network_shares_prefixes(kb):
+    net = rete_network(kb)
+    assert rete_network(kb) is net
+    assert len(net) <= net.conditions
+    premises = kb.derived("rule_premises", rule_premises)
+    assert sorted(i for rules in net.node_rules for i in rules) == [i for i, p in enumerate(premises) if p]
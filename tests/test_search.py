@@ -0,0 +1,70 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from pakar.engine import KnowledgeBase  # noqa: E402
+from pakar.search import MIN_SIMILARITY, normalize, symptom_index, trigrams  # noqa: E402
+
+BATTERY = {"G011", "G014", "G018", "G019"}
+
+def reference_search(kb, query):
+    """Skor tiap gejala dihitung langsung dari teksnya, tanpa indeks."""
+    terms = normalize(query).split()
+    if not terms:
+        return []
+    scores = []
+    for code, data in kb.symptoms.items():
+        words = set(normalize(f"{data.get('text', '')} {data.get('category', '')}").split())
+        total = 0.0
+        for term in terms:
+            best = 0.0
+            for word in words:
+                shared = len(trigrams(term) & trigrams(word))
+                score = 2 * shared / (len(trigrams(term)) + len(trigrams(word)))
+                if score < MIN_SIMILARITY:
+                    score = 0.0
+                if word.startswith(term):
+                    score = max(score, 0.7 + 0.3 * len(term) / len(word))
+                best = max(best, score)
+            total += best
+        if len(terms) == 1 and code.lower().startswith(terms[0]):
+            total = max(total, 1.0 + len(terms[0]) / len(code))
+        if total:
+            scores.append((code, total / len(terms)))
+    order = list(kb.symptoms)
+    return sorted(scores, key=lambda item: (-item[1], order.index(item[0])))
+
+@pytest.mark.parametrize("query", ["batrai", "baterai"])
+def test_typo_finds_battery_symptoms_first(bundled, query):
+    results = symptom_index(KnowledgeBase(*bundled)).search(query)
+    assert {code for code, _ in results[:len(BATTERY)]} == BATTERY
+    rest = [score for _, score in results[len(BATTERY):]]
+    assert all(score > max(rest, default=0.0) for _, score in results[:len(BATTERY)])
+
+def test_multi_word_typo(bundled):
+    results = symptom_index(KnowledgeBase(*bundled)).search("layr bergaris")
+    assert results[0][0] == "G010"
+
+@pytest.mark.parametrize("query", ["", "   ", "!!", "?-"])
+def test_empty_queries(kb, query):
+    assert symptom_index(kb).search(query) == []
+
+def test_short_queries(kb):
+    index = symptom_index(kb)
+    assert index.search("zz") == []
+    one = index.search("g", limit=5)
+    assert 0 < len(one) <= 5 and all(score > 0 for _, score in one)
+    # Kode gejala yang diketik langsung mengalahkan kecocokan teks
+    code = list(kb.symptoms)[3]
+    assert index.search(code[:-1].lower())[0][1] > 1.0
+    assert index.search(code)[0][0] == code
+
+@pytest.mark.parametrize("query", ["batrai", "layar berkedip", "mati sendiri", "gejla 1", "daya", "s00", "kipas"])
+def test_matches_reference_scores(kb, query):
+    got = symptom_index(kb).search(query, limit=len(kb.symptoms))
+    expected = reference_search(kb, query)
+    assert [code for code, _ in got] == [code for code, _ in expected]
+    assert [score for _, score in got] == pytest.approx([score for _, score in expected])
+
+def test_index_is_cached_per_kb(kb):
+    assert symptom_index(kb) is symptom_index(kb)
@@ -0,0 +1,108 @@
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("starlette")
+
+from pakar import service  # noqa: E402
+from pakar.engine import run_diagnosis  # noqa: E402
+
+def call(method, path, body=b""):
+    """Panggil app ASGI langsung; kembalikan (status, JSON body)."""
+    if not isinstance(body, bytes):
+        body = json.dumps(body).encode("utf-8")
+    scope = {"type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": method, "scheme": "http",
+             "path": path, "raw_path": path.encode(), "root_path": "", "query_string": b"",
+             "headers": [(b"content-type", b"application/json")], "server": ("test", 80), "client": ("test", 1)}
+    received = [{"type": "http.request", "body": body, "more_body": False}]
+    sent = []
+
+    async def receive():
+        return received.pop(0) if received else {"type": "http.disconnect"}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(service.app(scope, receive, send))
+    status = next(m["status"] for m in sent if m["type"] == "http.response.start")
+    return status, json.loads(b"".join(m.get("body", b"") for m in sent if m["type"] == "http.response.body"))
+
+@pytest.fixture
+def threadpool_calls(monkeypatch):
+    calls = []
+    original = service.run_in_threadpool
+
+    async def spy(func, *args):
+        calls.append(func)
+        return await original(func, *args)
+
+    monkeypatch.setattr(service, "run_in_threadpool", spy)
+    return calls
+
+def assert_matches_engine(record, symptoms, k=3, threshold=0.4):
+    results, status = run_diagnosis(symptoms, k=k, threshold=threshold)
+    assert record["status"] == status
+    assert [r["cause"] for r in record["results"]] == [cause for cause, _ in results or []]
+    assert [r["cf"] for r in record["results"]] == pytest.approx([cf for _, cf in results or []])
+
+@pytest.mark.parametrize("path,body,message", [
+    ("/diagnose", b"{bukan json", "bukan JSON"),
+    ("/diagnose", [], "objek JSON"),
+    ("/diagnose", {"symptoms": "G001"}, "symptoms harus"),
+    ("/diagnose", {"symptoms": [1]}, "symptoms harus"),
+    ("/diagnose", {"symptoms": [], "k": 0}, "k harus"),
+    ("/diagnose", {"symptoms": [], "k": True}, "k harus"),
+    ("/diagnose", {"symptoms": [], "threshold": 2}, "threshold harus"),
+    ("/diagnose", {"symptoms": [], "partial": "ya"}, "partial harus"),
+    ("/diagnose/batch", {"items": {}}, "items harus"),
+    ("/diagnose/batch", {"items": [["G001"], {"symptoms": None}]}, "items[1]"),
+    ("/diagnose/batch", {"items": [], "k": 99}, "k harus"),
+])
+def test_validation_errors_are_400(path, body, message):
+    status, payload = call("POST", path, body)
+    assert status == 400
+    assert message in payload["error"]
+
+def test_single_diagnosis_matches_engine():
+    status, payload = call("POST", "/diagnose", {"symptoms": ["G057", "G058"]})
+    assert status == 200
+    assert payload["kb_version"] == service.current_kb().version
+    assert payload["symptoms"] == ["G057", "G058"]
+    assert_matches_engine(payload, ["G057", "G058"])
+    _, custom = call("POST", "/diagnose", {"symptoms": ["G057", "G058"], "k": 1, "threshold": 0.0})
+    assert_matches_engine(custom, ["G057", "G058"], k=1, threshold=0.0)
+
+def test_small_batch_runs_inline(threadpool_calls):
+    items = [{"id": "a", "symptoms": ["G038", "G037"]}, ["G057", "G058"], {"symptoms": []}]
+    status, payload = call("POST", "/diagnose/batch", {"items": items})
+    assert status == 200 and threadpool_calls == []
+    assert [r.get("id") for r in payload["results"]] == ["a", None, None]
+    for record, symptoms in zip(payload["results"], (["G038", "G037"], ["G057", "G058"], [])):
+        assert_matches_engine(record, symptoms)
+    # Batch satu item sama dengan diagnosa tunggal
+    _, single = call("POST", "/diagnose", {"symptoms": ["G038", "G037"]})
+    assert payload["results"][0]["results"] == single["results"]
+
+def test_large_batch_runs_in_thread_pool(threadpool_calls):
+    pytest.importorskip("numpy")
+    codes = list(service.current_kb().symptoms)
+    sets = [codes[i % 40: i % 40 + 1 + i % 4] for i in range(service.BATCH_INLINE + 1)]
+    status, payload = call("POST", "/diagnose/batch",
+                           {"items": [{"id": i, "symptoms": s} for i, s in enumerate(sets)]})
+    assert status == 200
+    assert threadpool_calls == [service.diagnose_many]
+    assert [r["id"] for r in payload["results"]] == list(range(len(sets)))
+    for record, symptoms in zip(payload["results"], sets):
+        assert_matches_engine(record, symptoms)
+
+def test_batch_limit(monkeypatch):
+    monkeypatch.setattr(service, "MAX_BATCH", 2)
+    status, payload = call("POST", "/diagnose/batch", {"items": [[], [], []]})
+    assert status == 413 and "maksimal 2" in payload["error"]
+
+def test_health_and_unknown_cause():
+    status, payload = call("GET", "/health")
+    assert status == 200 and payload["kb_version"] == service.current_kb().version
+    status, payload = call("GET", "/causes/TIDAK-ADA")
+    assert status == 404
@@ -0,0 +1,68 @@
+import base64
+import copy
+import random
+
+import pytest
+
+from pakar.engine import KnowledgeBase
+from pakar.share import (SYMPTOMS_PARAM, VERSION_PARAM, decode_symptoms, encode_symptoms, result_params,
+                         symptoms_from_params)
+
+def test_round_trip_in_catalog_order(kb):
+    codes = list(kb.symptoms)
+    rng = random.Random(0)
+    for n in (1, 2, 5, len(codes)):
+        picked = rng.sample(codes, n)
+        token = encode_symptoms(picked + ["TIDAK-ADA"], kb)
+        assert set(token) <= set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_")
+        assert decode_symptoms(token, kb) == [code for code in codes if code in picked]
+        assert symptoms_from_params(result_params(picked, kb), kb) == decode_symptoms(token, kb)
+
+def test_last_symptom_survives_padding(kb):
+    last = list(kb.symptoms)[-1]
+    assert decode_symptoms(encode_symptoms([last], kb), kb) == [last]
+
+def test_no_link_and_empty_link(kb):
+    assert symptoms_from_params({}, kb) is None
+    with pytest.raises(ValueError, match="tidak memuat gejala"):
+        symptoms_from_params({SYMPTOMS_PARAM: "", VERSION_PARAM: kb.version}, kb)
+
+@pytest.mark.parametrize("token", ["!!!", "A", "AAAA"])
+def test_corrupt_token(kb, token):
+    with pytest.raises(ValueError):
+        symptoms_from_params({SYMPTOMS_PARAM: token, VERSION_PARAM: kb.version}, kb)
+
+def test_bits_beyond_catalog_are_rejected(kb):
+    mask = 1 << len(kb.symptoms)
+    raw = mask.to_bytes((mask.bit_length() + 7) // 8, "little")
+    token = base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+    with pytest.raises(ValueError, match="tidak ada di basis pengetahuan"):
+        decode_symptoms(token, kb)
+
+def test_kb_version_mismatch_is_rejected(kb_data):
+    symptoms, causes, rules = kb_data
+    old = KnowledgeBase(symptoms, causes, rules)
+    params = result_params(list(symptoms)[:3], old)
+
+    # KB baru dengan gejala baru di depan: posisi bit lama akan menunjuk gejala lain
+    reordered = {"BARU": {"text": "gejala baru"}, **copy.deepcopy(symptoms)}
+    new = KnowledgeBase(reordered, causes, rules)
+    assert new.version != old.version
+    with pytest.raises(ValueError, match="versi basis pengetahuan lain"):
+        symptoms_from_params(params, new)
+    with pytest.raises(ValueError, match="versi basis pengetahuan lain"):
+        symptoms_from_params({SYMPTOMS_PARAM: params[SYMPTOMS_PARAM]}, new)
+    assert symptoms_from_params(params, old) == list(symptoms)[:3]
+
+def test_reordered_symptoms_change_the_version(kb_data):
+    symptoms, causes, rules = kb_data
+    old = KnowledgeBase(symptoms, causes, rules)
+    codes = list(symptoms)
+    params = result_params([codes[0], codes[-2]], old)
+
+    # Katalog sama persis, hanya urutannya dibalik: bit yang sama berarti gejala lain
+    reversed_kb = KnowledgeBase(dict(reversed(list(copy.deepcopy(symptoms).items()))), causes, rules)
+    assert reversed_kb.version != old.version
+    with pytest.raises(ValueError, match="versi basis pengetahuan lain"):
+        symptoms_from_params(params, reversed_kb)
+    assert symptoms_from_params(params, old) == [codes[0], codes[-2]]
@@ -0,0 +1,116 @@
+import json
+
+import pytest
+
+from pakar.history import HistoryStore
+from pakar.transfer import FORMATS, HistoryFileError, export_history, import_history
+
+ROWS = [
+    (1_700_000_000.25 + i * 3600, f"C0{i % 3}", f"Penyebab {i % 3}", 0.5 + i / 100, ("Tinggi", "Sedang")[i % 2],
+     ["G038", "G001", "G010"][: 1 + i % 3], f"teks, \"kutip\" {i}\nbaris", ("Storage", "")[i % 2], "v1")
+    for i in range(25)
+]
+
+def fill(path, rows=ROWS):
+    store = HistoryStore(str(path))
+    store.add_many(rows)
+    store.close()
+
+def dump(path):
+    store = HistoryStore(str(path))
+    try:
+        return [row[1:] for row in store.export_chunk(0, 10_000)], store.rollups().rows()
+    finally:
+        store.close()
+
+@pytest.mark.parametrize("fmt", FORMATS)
+def test_round_trip(tmp_path, fmt):
+    if fmt == "parquet":
+        pytest.importorskip("pyarrow")
+    fill(tmp_path / "asal.db")
+    out = tmp_path / f"riwayat.{fmt}"
+    seen = []
+    assert export_history(str(tmp_path / "asal.db"), str(out), chunk_size=10, progress=seen.append) == len(ROWS)
+    assert seen == [10, 20, 25]
+    assert import_history(str(tmp_path / "tujuan.db"), str(out), chunk_size=7) == len(ROWS)
+    original, imported = dump(tmp_path / "asal.db"), dump(tmp_path / "tujuan.db")
+    for got, want in zip(imported[0], original[0]):
+        assert got[0] == pytest.approx(want[0], abs=1e-6)
+        assert got[1:] == want[1:]
+    assert len(imported[0]) == len(original[0])
+    counts = [sorted((kind, key, n) for kind, key, n, _ in rollups) for _, rollups in (imported, original)]
+    assert counts[0] == counts[1]
+    sums = [dict(((kind, key), total) for kind, key, _, total in rollups) for _, rollups in (imported, original)]
+    assert sums[0] == pytest.approx(sums[1])
+
+def test_import_appends_with_new_ids(tmp_path):
+    fill(tmp_path / "asal.db")
+    export_history(str(tmp_path / "asal.db"), str(tmp_path / "r.jsonl"))
+    fill(tmp_path / "tujuan.db", ROWS[:5])
+    import_history(str(tmp_path / "tujuan.db"), str(tmp_path / "r.jsonl"))
+    store = HistoryStore(str(tmp_path / "tujuan.db"))
+    assert store.count() == 30
+    assert [row[0] for row in store.export_chunk(0, 100)] == list(range(1, 31))
+    store.close()
+
+def test_unknown_format(tmp_path):
+    with pytest.raises(HistoryFileError, match="format tidak dikenal"):
+        export_history(str(tmp_path / "a.db"), str(tmp_path / "r.xml"))
+
+@pytest.mark.parametrize("fmt,content,line", [
+    ("jsonl", '{"timestamp": "2024-01-01T00:00:00", "cause": "C01", "confidence": 0.5, "level": "Tinggi",'
+              ' "symptoms": ["G001"]}\n{bukan json\n', 2),
+    ("jsonl", "[1, 2]\n", 1),
+    ("jsonl", '{"timestamp": "kemarin", "cause": "C01", "confidence": 0.5, "level": "T", "symptoms": []}\n', 1),
+    ("csv", "timestamp,cause\n", 1),
+    ("csv", "timestamp,cause,confidence,level,symptoms\n2024-01-01T00:00:00,C01,tinggi,T,G001\n", 2),
+])
+def test_invalid_records_name_the_line(tmp_path, fmt, content, line):
+    path = tmp_path / f"r.{fmt}"
+    path.write_text(content, encoding="utf-8")
+    with pytest.raises(HistoryFileError) as e:
+        import_history(str(tmp_path / "t.db"), str(path))
+    assert e.value.line == line
+
+def test_chunks_before_a_bad_record_are_kept(tmp_path):
+    good = {"timestamp": "2024-01-01T00:00:00", "cause": "C01", "confidence": 0.5, "level": "T", "symptoms": ["G1"]}
+    path = tmp_path / "r.jsonl"
+    path.write_text("".join(json.dumps(good) + "\n" for _ in range(4)) + "{}\n", encoding="utf-8")
+    with pytest.raises(HistoryFileError):
+        import_history(str(tmp_path / "t.db"), str(path), chunk_size=2)
+    store = HistoryStore(str(tmp_path / "t.db"))
+    assert store.count() == 4
+    store.close()
+
+@pytest.mark.parametrize("record,problem", [
+    ({"symptoms": [1, 2]}, "symptoms harus list kode gejala"),
+    ({"symptoms": [["G001"]]}, "symptoms harus list kode gejala"),
+    ({"cause": 5}, "harus string"),
+    ({"level": ["Tinggi"]}, "harus string"),
+    ({"cause_name": {"x": 1}}, "harus string"),
+    ({"symptoms_text": 3}, "harus string"),
+])
+def test_wrong_types_are_history_file_errors(tmp_path, record, problem):
+    good = {"timestamp": "2024-01-01T00:00:00", "cause": "C01", "confidence": 0.5, "level": "T", "symptoms": ["G1"]}
+    path = tmp_path / "r.jsonl"
+    path.write_text(json.dumps(good) + "\n" + json.dumps({**good, **record}) + "\n", encoding="utf-8")
+    with pytest.raises(HistoryFileError, match=problem) as e:
+        import_history(str(tmp_path / "t.db"), str(path))
+    assert e.value.line == 2
+
+def test_optional_text_fields_may_be_null(tmp_path):
+    record = {"timestamp": "2024-01-01T00:00:00", "cause": "C01", "confidence": 0.5, "level": "T",
+              "symptoms": ["G1"], "cause_name": None, "symptoms_text": None, "category": None, "kb_version": None}
+    path = tmp_path / "r.jsonl"
+    path.write_text(json.dumps(record) + "\n", encoding="utf-8")
+    assert import_history(str(tmp_path / "t.db"), str(path)) == 1
+
+def test_parquet_wrong_symptom_types(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    table = pa.table({"timestamp": pa.array([0], pa.timestamp("us", tz="UTC")), "cause": ["C01"],
+                      "confidence": [0.5], "level": ["T"], "symptoms": pa.array([[1, 2]], pa.list_(pa.int64()))})
+    pq.write_table(table, tmp_path / "r.parquet")
+    with pytest.raises(HistoryFileError, match="symptoms harus list kode gejala") as e:
+        import_history(str(tmp_path / "t.db"), str(tmp_path / "r.parquet"))
+    assert e.value.line == 1